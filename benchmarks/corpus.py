@@ -0,0 +1,129 @@
+import random
+from typing import Dict, List
+
+BENCH_HOST = "https://bench.tenasia.local"
+
+SUBJECTS = ("아이돌 그룹", "배우", "가수", "멤버", "솔로 아티스트", "신인 그룹", "actor", "singer")
+EVENTS = ("컴백", "공개", "발표", "출연", "개최", "팬미팅", "쇼케이스", "release", "interview")
+TIMES = ("오늘", "지난", "오는", "오후", "방송", "3월 14일", "2024-05-02", "현지시간")
+FILLER = (
+    "소속사는", "관계자에 따르면", "이번", "새 앨범", "타이틀곡", "뮤직비디오", "무대", "팬들은",
+    "현장", "반응", "기대를", "모았다", "전했다", "밝혔다", "예정이다", "드라마", "촬영",
+    "캐릭터", "연기", "변신", "콘셉트", "티저", "포토", "화보", "글로벌", "차트", "1위",
+)
+
+SIZES = {"10kb": 10_000, "100kb": 100_000, "500kb": 500_000, "2mb": 2_000_000}
+IMAGE_COUNTS = {"10kb": 0, "100kb": 5, "500kb": 20, "2mb": 40}
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(SUBJECTS), rng.choice(TIMES)]
+    words += [rng.choice(FILLER) for _ in range(rng.randint(6, 18))]
+    words.append(rng.choice(EVENTS))
+    return " ".join(words) + rng.choice((".", ".", ".", "!", "?"))
+
+
+def _paragraph(rng: random.Random) -> str:
+    return "<p>" + " ".join(_sentence(rng) for _ in range(rng.randint(2, 5))) + "</p>"
+
+
+def _nav(rng: random.Random, count: int) -> str:
+    items = "".join(
+        f'<li class="gnb-item"><a href="/section/{rng.randint(1, 999)}">{rng.choice(FILLER)}</a></li>'
+        for _ in range(count)
+    )
+    return f'<nav class="gnb"><ul class="gnb-list">{items}</ul></nav>'
+
+
+def _ad_block(rng: random.Random) -> str:
+    slot = rng.randint(10000, 99999)
+    return (
+        f'<div class="ad-wrap ad-slot-{slot}" data-ad-unit="/1234/tenasia/{slot}">'
+        f'<script>window.adq=window.adq||[];adq.push({{slot:"{slot}",sizes:[[300,250],[728,90]]}});</script>'
+        f'<iframe src="https://ads.example.net/frame/{slot}" width="300" height="250"></iframe>'
+        "</div>"
+    )
+
+
+def _related(rng: random.Random, count: int) -> str:
+    items = "".join(
+        f'<li><a href="{BENCH_HOST}/article/{rng.randint(100000, 999999)}">'
+        f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)} {rng.choice(FILLER)}</a></li>"
+        for _ in range(count)
+    )
+    return f'<aside class="related"><ul>{items}</ul></aside>'
+
+
+def _image(rng: random.Random, index: int) -> str:
+    alt = "" if rng.random() < 0.3 else f' alt="{rng.choice(SUBJECTS)} {rng.choice(EVENTS)}"'
+    loading = ' loading="lazy"' if index and rng.random() < 0.6 else ""
+    return (
+        f'<figure><img src="https://img.bench.tenasia.local/photo/{rng.randint(1, 10**8)}.jpg"'
+        f'{alt}{loading} /><figcaption>{rng.choice(FILLER)}</figcaption></figure>'
+    )
+
+
+def _nbytes(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def generate_page(name: str, target_bytes: int, image_count: int, seed: int = 0) -> str:
+    rng = random.Random(f"{name}:{target_bytes}:{image_count}:{seed}")
+    nav_items = max(20, min(120, target_bytes // 400))
+    title = f"{rng.choice(SUBJECTS)} {rng.choice(TIMES)} {rng.choice(EVENTS)} {rng.choice(FILLER)}"
+    head = (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\" />"
+        f"<title>{title} | 텐아시아</title>"
+        f'<meta name="description" content="{_sentence(rng)}" />'
+        f'<meta property="og:title" content="{title}" />'
+        + "".join(f'<link rel="stylesheet" href="/css/{i}.css" />' for i in range(8))
+        + "".join(f'<script src="/js/vendor{i}.js"></script>' for i in range(6))
+        + "</head>"
+    )
+    header = f'<header class="header">{_nav(rng, nav_items)}{_ad_block(rng)}</header>'
+    footer = f'<footer class="footer">{_nav(rng, nav_items // 2)}</footer>'
+
+    body_parts: List[str] = [f"<h1>{title}</h1>"]
+    body_size = 0
+    images_left = image_count
+    body_budget = max(target_bytes // 3, 2_000)
+    while body_size < body_budget:
+        part = _paragraph(rng)
+        if images_left and rng.random() < 0.5:
+            part += _image(rng, image_count - images_left)
+            images_left -= 1
+        if rng.random() < 0.15:
+            part += f"<h2>{rng.choice(FILLER)} {rng.choice(EVENTS)}</h2>"
+        if rng.random() < 0.2:
+            part += f'<p><a href="/article/{rng.randint(1, 10**6)}">{rng.choice(SUBJECTS)}</a></p>'
+        body_parts.append(part)
+        body_size += _nbytes(part)
+    body_parts.extend(_image(rng, image_count - n) for n in range(images_left, 0, -1))
+    article = (
+        '<div class="article-view"><div itemprop="articleBody" class="article_body">'
+        + "".join(body_parts)
+        + "</div></div>"
+    )
+
+    chrome: List[str] = []
+    remaining = target_bytes - sum(_nbytes(part) for part in (head, header, article, footer)) - 100
+    while remaining > 0:
+        block = _ad_block(rng) + _related(rng, rng.randint(10, 40))
+        chrome.append(block)
+        remaining -= _nbytes(block)
+
+    return (
+        f'{head}<body><div id="wrap">{header}<main class="container">'
+        f'{article}{"".join(chrome)}</main>{footer}</div></body></html>'
+    )
+
+
+def build_corpus(seed: int = 0) -> Dict[str, Dict[str, object]]:
+    corpus: Dict[str, Dict[str, object]] = {}
+    for label, target in SIZES.items():
+        corpus[label] = {
+            "url": f"{BENCH_HOST}/article/{label}",
+            "html": generate_page(label, target, IMAGE_COUNTS[label], seed),
+            "image_count": IMAGE_COUNTS[label],
+        }
+    return corpus
@@ -0,0 +1,28 @@
+from typing import Dict
+
+from requests.adapters import BaseAdapter
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+
+class ReplayAdapter(BaseAdapter):
+    def __init__(self, pages: Dict[str, bytes]) -> None:
+        super().__init__()
+        self.pages = pages
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        body = self.pages.get(request.url or "")
+        response = Response()
+        response.status_code = 200 if body is not None else 404
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "text/html; charset=utf-8", "Content-Length": str(len(body or b""))}
+        )
+        response._content = body or b""
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.reason = "OK" if body is not None else "Not Found"
+        return response
+
+    def close(self) -> None:
+        pass
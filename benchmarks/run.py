@@ -0,0 +1,155 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from urllib.parse import urlparse
+
+from benchmarks.corpus import BENCH_HOST, build_corpus
+from benchmarks.replay import ReplayAdapter
+from src import crawler
+from src.crawler import parse_article_html
+from src.main import load_rubric, run
+from src.politeness import get_controller
+from src.recommender import recommend_fixes
+from src.scorer import score_article
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+# 마이크로초 단위 벤치마크의 잡음으로 실패하지 않도록 절대 차이 하한을 둔다.
+MIN_DELTA_MS = 0.05
+
+
+def _time_op(func: Callable[[], Any], min_time: float, min_rounds: int) -> List[float]:
+    func()
+    rounds: List[float] = []
+    started = time.perf_counter()
+    while len(rounds) < min_rounds or time.perf_counter() - started < min_time:
+        op_started = time.perf_counter()
+        func()
+        rounds.append(time.perf_counter() - op_started)
+    return rounds
+
+
+def _peak_bytes(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _measure(func: Callable[[], Any], size_bytes: int, min_time: float, min_rounds: int) -> Dict[str, Any]:
+    rounds = _time_op(func, min_time, min_rounds)
+    median = statistics.median(rounds)
+    return {
+        "rounds": len(rounds),
+        "median_ms": round(median * 1000, 4),
+        "ops_per_sec": round(1 / median, 3) if median else 0.0,
+        "mb_per_sec": round(size_bytes / median / 1_000_000, 3) if median and size_bytes else 0.0,
+        "peak_kb": round(_peak_bytes(func) / 1024, 1),
+    }
+
+
+def build_benchmarks(corpus: Dict[str, Dict[str, Any]]) -> Dict[str, Callable[[], Any]]:
+    rubric = load_rubric()
+    benchmarks: Dict[str, Callable[[], Any]] = {}
+    for label, page in corpus.items():
+        url, html = page["url"], page["html"]
+        article = parse_article_html(url, html)
+        score = score_article(article, rubric)
+        benchmarks[f"parse_{label}"] = lambda url=url, html=html: parse_article_html(url, html)
+        benchmarks[f"score_{label}"] = lambda article=article: score_article(article, rubric)
+        benchmarks[f"recommend_{label}"] = lambda score=score: recommend_fixes(score)
+        benchmarks[f"run_replay_{label}"] = lambda url=url: run(url, timings=False)
+    return benchmarks
+
+
+def run_benchmarks(name_filter: str = "", min_time: float = 0.5, min_rounds: int = 3) -> Dict[str, Any]:
+    corpus = build_corpus()
+    pages = {page["url"]: page["html"].encode("utf-8") for page in corpus.values()}
+    crawler.get_session().mount(BENCH_HOST, ReplayAdapter(pages))
+    # replay 호스트는 실제 서버가 아니므로 호스트별 속도 제한을 끈다.
+    get_controller().set_host_rate(urlparse(BENCH_HOST).netloc, 0)
+
+    results: Dict[str, Any] = {}
+    try:
+        for name, func in build_benchmarks(corpus).items():
+            if name_filter and name_filter not in name:
+                continue
+            label = name.rsplit("_", 1)[1]
+            size = len(pages[corpus[label]["url"]]) if not name.startswith("recommend") else 0
+            results[name] = _measure(func, size, min_time, min_rounds)
+            print(
+                f"{name:<22} {results[name]['median_ms']:>10.3f} ms  "
+                f"{results[name]['ops_per_sec']:>9.2f} ops/s  {results[name]['peak_kb']:>10.1f} KB peak",
+                flush=True,
+            )
+    finally:
+        crawler.get_session().adapters.pop(BENCH_HOST, None)
+
+    return {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions: List[str] = []
+    for name, base in baseline.get("benchmarks", {}).items():
+        now = current.get("benchmarks", {}).get(name)
+        if not now:
+            continue
+        slowdown = now["median_ms"] / base["median_ms"] - 1 if base["median_ms"] else 0.0
+        growth = now["peak_kb"] / base["peak_kb"] - 1 if base["peak_kb"] else 0.0
+        if slowdown > threshold and now["median_ms"] - base["median_ms"] > MIN_DELTA_MS:
+            regressions.append(f"{name}: median {base['median_ms']} -> {now['median_ms']} ms (+{slowdown:.0%})")
+        if growth > threshold:
+            regressions.append(f"{name}: peak {base['peak_kb']} -> {now['peak_kb']} KB (+{growth:.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run parse/score/recommend/run() benchmarks on a synthetic corpus.")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds per benchmark.")
+    parser.add_argument("--output", default="", help="Write results json to this path.")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Overwrite {BASELINE_PATH.name}.")
+    parser.add_argument("--compare", default="", help="Baseline json to compare against; exit 1 on regression.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown or peak memory growth before failing.",
+    )
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.filter, args.min_time)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline: {BASELINE_PATH}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
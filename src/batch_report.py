@@ -1,10 +1,41 @@
 import argparse
 import json
+import threading
+import tracemalloc
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from src.main import run
+from src.canonical import (
+    CANONICAL_RULES_PATH,
+    DEFAULT_MAP_PATH,
+    CanonicalMap,
+    Canonicalizer,
+    dedupe,
+    fan_out,
+    load_rules,
+)
+from src.discovery import Frontier
+from src.image_probe import get_prober
+from src.link_graph import LinkGraph, get_link_graph
+from src.main import RUBRIC_PATH, add_analysis_arguments, run
+from src.metrics import stage_quantiles, write_prometheus
+from src.profiling import add_profile_arguments, profiling
+from src.recommender import get_impact_table
+from src.rubric_compare import iter_archive
+from src.sampling import StratifiedSample, build_strata, known_articles, run_sample
+from src.watch import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SEEN_DB,
+    DropDirWatcher,
+    FileTailer,
+    SeenStore,
+    install_stop_handlers,
+    watch,
+)
+from src.worker_pool import current_rss_bytes, imap_recycling
 
 
 def load_urls(url_file: Path) -> List[str]:
@@ -18,10 +49,18 @@ def load_urls(url_file: Path) -> List[str]:
     return urls
 
 
-def build_report(urls: List[str]) -> dict:
+def build_report(
+    urls: List[str],
+    timings: Optional[bool] = None,
+    profiler: Any = None,
+    prober: Any = None,
+    rubric_path: Path = RUBRIC_PATH,
+    link_graph: Any = None,
+    impact_table: Optional[Dict[str, List[float]]] = None,
+) -> dict:
     results = []
     for url in urls:
-        results.append(run(url))
+        results.append(run(url, timings, profiler, prober, rubric_path, link_graph, impact_table))
     return {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "count": len(results),
@@ -29,6 +68,181 @@ def build_report(urls: List[str]) -> dict:
     }
 
 
+def analyze_bounded(
+    url: str,
+    trace_malloc: bool = True,
+    image_cache: str = "",
+    rubric_path: Path = RUBRIC_PATH,
+    link_graph: str = "",
+    impact_table: str = "",
+) -> Dict[str, Any]:
+    # 워커 프로세스마다 prober 하나를 만들고, 결과는 SQLite 캐시로 워커 간에 공유된다.
+    prober = get_prober(Path(image_cache)) if image_cache else None
+    graph = get_link_graph(link_graph) if link_graph else None
+    table = get_impact_table(Path(impact_table)) if impact_table else None
+    if not trace_malloc:
+        result = run(url, prober=prober, rubric_path=rubric_path, link_graph=graph, impact_table=table)
+        result["memory"] = {"rss_bytes": current_rss_bytes()}
+        return result
+
+    # tracemalloc은 파싱 비용을 수 배 늘리므로 이 모드에서만 켠다.
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = run(url, prober=prober, rubric_path=rubric_path, link_graph=graph, impact_table=table)
+    _, peak = tracemalloc.get_traced_memory()
+    result["memory"] = {"peak_alloc_bytes": peak, "rss_bytes": current_rss_bytes()}
+    return result
+
+
+def iter_bounded_results(
+    urls: List[str],
+    workers: int,
+    max_rss_mb: int,
+    trace_malloc: bool = True,
+    image_cache: str = "",
+    rubric_path: Path = RUBRIC_PATH,
+    link_graph: str = "",
+    impact_table: str = "",
+) -> Iterator[Dict[str, Any]]:
+    # 완료 순서와 무관하게 입력 순서대로 내보낸다.
+    buffered: Dict[int, Dict[str, Any]] = {}
+    next_index = 0
+    analyze = partial(
+        analyze_bounded,
+        trace_malloc=trace_malloc,
+        image_cache=image_cache,
+        rubric_path=rubric_path,
+        link_graph=link_graph,
+        impact_table=impact_table,
+    )
+    for index, status, value in imap_recycling(
+        analyze, urls, workers, max_rss_mb * 1024 * 1024
+    ):
+        if status == "error":
+            value = {"url": urls[index], "error": value}
+        buffered[index] = value
+        while next_index in buffered:
+            yield buffered.pop(next_index)
+            next_index += 1
+
+
+def _feed_link_graph(results: Iterable[Dict[str, Any]], graph: LinkGraph) -> Iterator[Dict[str, Any]]:
+    for result in results:
+        graph.add_results([result])
+        yield result
+
+
+def _learn_canonical(
+    results: Iterable[Dict[str, Any]], canonicalizer: Canonicalizer
+) -> Iterator[Dict[str, Any]]:
+    for result in results:
+        canonicalizer.learn([(result["url"], result)])
+        yield result
+
+
+def _fan_out_results(
+    results: Iterable[Dict[str, Any]], groups: Dict[str, List[str]]
+) -> Iterator[Dict[str, Any]]:
+    for result in results:
+        yield from fan_out(result, groups.get(result["url"], [result["url"]]), result["url"])
+
+
+def _succeeded(result: Dict[str, Any]) -> bool:
+    return not (result.get("error") or result.get("article", {}).get("error"))
+
+
+def _track_analyzed(results: Iterable[Dict[str, Any]], analyzed: List[str]) -> Iterator[Dict[str, Any]]:
+    for result in results:
+        if _succeeded(result):
+            analyzed.append(result["url"])
+        yield result
+
+
+def write_report_stream(output_path: Path, results: Iterable[Dict[str, Any]]) -> int:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.write('{\n  "generated_at": ')
+        handle.write(json.dumps(datetime.utcnow().isoformat() + "Z"))
+        handle.write(',\n  "results": [')
+        for result in results:
+            handle.write(",\n    " if count else "\n    ")
+            handle.write(json.dumps(result, ensure_ascii=False))
+            count += 1
+        handle.write(f'\n  ],\n  "count": {count}\n}}\n')
+    return count
+
+
+def run_sampled(
+    args: argparse.Namespace,
+    urls: List[str],
+    lastmods: Dict[str, str],
+    output_path: Path,
+    rubric_path: Path,
+) -> None:
+    known = known_articles(iter_archive(Path(path) for path in args.strata_archive))
+    strata = build_strata(urls, lastmods, known)
+    sample = StratifiedSample(strata, args.seed, args.confidence)
+    prober = get_prober(Path(args.image_cache)) if args.probe_images else None
+    link_graph = get_link_graph(args.link_graph) if args.link_graph else None
+    impact_table = get_impact_table(Path(args.impact_table)) if args.impact_table else None
+    print(f"Sampling {sample.total} urls in {len(strata)} strata (target ±{args.target_margin:g} points)", flush=True)
+
+    def analyze(url: str) -> Dict[str, Any]:
+        return run(url, None, None, prober, rubric_path, link_graph, impact_table)
+
+    results = run_sample(sample, analyze, args.target_margin, args.sample_batch, args.max_sample)
+    estimate = sample.report()
+    report = {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "mode": "sample",
+        "estimate": estimate,
+        "count": len(results),
+        "results": results,
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    mean = estimate["mean_score"]
+    if mean["estimate"] is not None:
+        print(
+            f"Mean score {mean['estimate']:.1f} ± {mean['margin']:.1f} "
+            f"({estimate['confidence']:.0%} CI, {estimate['sampled']} of {estimate['population']} urls, "
+            f"{estimate['errors']} errors)"
+        )
+        for grade, share in estimate["grade_shares"].items():
+            print(f"  {grade}  {share['estimate']:.1%} ± {share['margin']:.1%}")
+    print(f"Saved report: {output_path} ({len(results)} urls)")
+
+
+def run_watch(args: argparse.Namespace, url_file: Path, output_path: Path, rubric_path: Path) -> None:
+    store = SeenStore(Path(args.seen_db))
+    source = DropDirWatcher(Path(args.watch_dir)) if args.watch_dir else FileTailer(url_file, store)
+    prober = get_prober(Path(args.image_cache)) if args.probe_images else None
+    link_graph = get_link_graph(args.link_graph) if args.link_graph else None
+    timings = True if args.timings else None
+
+    def analyze(url: str) -> Dict[str, Any]:
+        # 오래 도는 감시 모드는 다시 컴파일된 영향도 표를 이어서 반영한다.
+        impact_table = get_impact_table(Path(args.impact_table)) if args.impact_table else None
+        result = run(url, timings, None, prober, rubric_path, link_graph, impact_table)
+        if link_graph is not None:
+            link_graph.add_results([result])
+        return result
+
+    stop = threading.Event()
+    install_stop_handlers(stop)
+    print(f"Watching {args.watch_dir or url_file} -> {output_path}", flush=True)
+    try:
+        count = watch(source, store, analyze, output_path, stop, args.poll_interval, args.max_attempts)
+    finally:
+        store.close()
+        if link_graph is not None:
+            link_graph.save(Path(args.link_graph))
+    print(f"Stopped after {count} urls")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate SEO reports for multiple article URLs.")
     parser.add_argument(
@@ -38,20 +252,209 @@ def main() -> None:
     )
     parser.add_argument(
         "--output",
-        default="data/reports/sample_report.json",
-        help="Output path for report json.",
+        default="",
+        help=(
+            "Output path for report json (default data/reports/sample_report.json). "
+            "With --watch, results are appended as JSON lines (default data/reports/watch_results.jsonl)."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Attach per-stage timings to each result and print p50/p95/p99 per stage.",
     )
+    parser.add_argument(
+        "--metrics-file",
+        default="",
+        help="Write process-wide stage metrics in Prometheus text format to this path.",
+    )
+    parser.add_argument(
+        "--memory-bounded",
+        action="store_true",
+        help=(
+            "Analyze in recycling worker processes, record per-article tracemalloc peaks "
+            "and stream results to the output file instead of holding them in memory."
+        ),
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for --memory-bounded.")
+    parser.add_argument(
+        "--max-rss-mb",
+        type=int,
+        default=512,
+        help="Recycle a --memory-bounded worker once its RSS exceeds this many MB.",
+    )
+    parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="Skip per-article tracemalloc peaks in --memory-bounded mode (keeps only RSS).",
+    )
+    parser.add_argument(
+        "--frontier",
+        default="",
+        help="Analyze pending URLs from this discovery frontier (src.discovery) instead of --url-file.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and analyze URLs as they are appended to --url-file (or dropped into --watch-dir).",
+    )
+    parser.add_argument(
+        "--watch-dir",
+        default="",
+        help="With --watch, read new *.txt URL lists from this directory and move them to processed/.",
+    )
+    parser.add_argument(
+        "--seen-db",
+        default=str(DEFAULT_SEEN_DB),
+        help="SQLite file of already analyzed URLs and file offsets for --watch.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help="Seconds between checks for new URLs in --watch mode.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help="In --watch mode, analyze a failed URL again on later polls up to this many attempts in total.",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help=(
+            "Estimate site-wide SEO health from a stratified random sample (section x profile x age) "
+            "instead of analyzing every URL."
+        ),
+    )
+    parser.add_argument(
+        "--target-margin",
+        type=float,
+        default=2.0,
+        help="With --sample, stop once the mean score confidence interval is within ± this many points.",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level for --sample intervals.")
+    parser.add_argument("--sample-batch", type=int, default=20, help="URLs analyzed between --sample precision checks.")
+    parser.add_argument("--max-sample", type=int, default=0, help="Upper bound on sampled URLs (0 = no limit).")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for --sample.")
+    parser.add_argument(
+        "--strata-archive",
+        nargs="*",
+        default=[],
+        help="Earlier reports (.json/.jsonl) used to know each URL's profile and publish date for --sample strata.",
+    )
+    parser.add_argument(
+        "--canonical-rules",
+        default=str(CANONICAL_RULES_PATH),
+        help="URL normalization rules applied before fetching (tracking params, host aliases, slashes).",
+    )
+    parser.add_argument(
+        "--canonical-map",
+        default=str(DEFAULT_MAP_PATH),
+        help="SQLite map of learned redirect and rel=canonical targets.",
+    )
+    parser.add_argument(
+        "--no-canonicalize",
+        action="store_true",
+        help="Analyze every input URL as given, without canonicalization and deduplication.",
+    )
+    add_analysis_arguments(parser)
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    if args.memory_bounded:
+        # 워커 프로세스의 단계 시간/프로파일은 부모로 모이지 않으므로 함께 쓸 수 없다.
+        options = (("--timings", args.timings), ("--metrics-file", args.metrics_file), ("--profile", args.profile))
+        unsupported = [flag for flag, value in options if value]
+        if unsupported:
+            parser.error(f"--memory-bounded does not support {', '.join(unsupported)}")
 
     url_file = Path(args.url_file)
-    output_path = Path(args.output)
+    rubric_path = Path(args.rubric)
+    if args.watch:
+        run_watch(args, url_file, Path(args.output or "data/reports/watch_results.jsonl"), rubric_path)
+        return
 
-    urls = load_urls(url_file)
-    report = build_report(urls)
+    output_path = Path(args.output or "data/reports/sample_report.json")
+    frontier = Frontier(Path(args.frontier)) if args.frontier else None
+    # 프런티어를 쓰면 발견 단계에서 새로 생기거나 바뀐 URL만 분석한다.
+    # 실패한 URL은 pending으로 남겨 다음 실행에서 다시 시도한다.
+    if args.sample and frontier is not None:
+        # 표본 모드는 pending만이 아니라 프런티어 전체를 모집단으로 삼는다.
+        lastmods = frontier.lastmods()
+        inputs = list(lastmods)
+    else:
+        lastmods = {}
+        inputs = frontier.pending() if frontier is not None else load_urls(url_file)
+    canonicalizer: Optional[Canonicalizer] = None
+    groups: Dict[str, List[str]] = {}
+    urls = inputs
+    if not args.no_canonicalize:
+        # 같은 기사의 변형 URL은 대표 URL로 한 번만 분석하고 결과를 입력 URL마다 돌려준다.
+        canonicalizer = Canonicalizer(load_rules(Path(args.canonical_rules)), CanonicalMap(Path(args.canonical_map)))
+        urls, groups = dedupe(inputs, canonicalizer)
+        print(f"Canonicalized {len(inputs)} urls -> {len(urls)} unique")
+    if args.sample:
+        if lastmods and groups:
+            lastmods = {canonical: max(lastmods.get(url, "") for url in group) for canonical, group in groups.items()}
+        run_sampled(args, urls, lastmods, output_path, rubric_path)
+        return
+    if args.memory_bounded:
+        analyzed: List[str] = []
+        image_cache = args.image_cache if args.probe_images else ""
+        results = iter_bounded_results(
+            urls,
+            args.workers,
+            args.max_rss_mb,
+            not args.no_tracemalloc,
+            image_cache,
+            rubric_path,
+            args.link_graph,
+            args.impact_table,
+        )
+        if args.link_graph:
+            graph = LinkGraph.load(Path(args.link_graph))
+            results = _feed_link_graph(results, graph)
+        if canonicalizer is not None:
+            results = _fan_out_results(_learn_canonical(results, canonicalizer), groups)
+        count = write_report_stream(output_path, _track_analyzed(results, analyzed))
+        print(f"Saved report: {output_path} ({count} urls)")
+        if frontier is not None:
+            frontier.mark_done(analyzed)
+        if args.link_graph:
+            graph.save(Path(args.link_graph))
+            print(f"Updated link graph: {args.link_graph} ({len(graph)} nodes)")
+        return
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"Saved report: {output_path} ({report['count']} urls)")
+    timings = True if (args.timings or args.metrics_file) else None
+    with profiling(args.profile, Path(args.profile_dir), args.profile_top) as profiler:
+        prober = get_prober(Path(args.image_cache)) if args.probe_images else None
+        link_graph = get_link_graph(args.link_graph) if args.link_graph else None
+        impact_table = get_impact_table(Path(args.impact_table)) if args.impact_table else None
+        report = build_report(urls, timings, profiler, prober, rubric_path, link_graph, impact_table)
+        if link_graph is not None:
+            # 이번 배치의 점수는 이전 그래프 기준이고, 그래프는 배치가 끝난 뒤 갱신된다.
+            link_graph.add_results(report["results"])
+            link_graph.save(Path(args.link_graph))
+            print(f"Updated link graph: {args.link_graph} ({len(link_graph)} nodes)")
+        if canonicalizer is not None:
+            canonicalizer.learn((result["url"], result) for result in report["results"])
+            report["results"] = list(_fan_out_results(report["results"], groups))
+            report["count"] = len(report["results"])
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Saved report: {output_path} ({report['count']} urls)")
+        if frontier is not None:
+            frontier.mark_done(result["url"] for result in report["results"] if _succeeded(result))
+
+        if timings:
+            for name, quantiles in stage_quantiles().items():
+                summary = " ".join(f"{key}={value * 1000:.1f}ms" for key, value in quantiles.items())
+                print(f"  {name:<10} {summary}")
+        if args.metrics_file:
+            write_prometheus(Path(args.metrics_file))
+            print(f"Saved metrics: {args.metrics_file}")
 
 
 if __name__ == "__main__":
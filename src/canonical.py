@@ -0,0 +1,178 @@
+import argparse
+import fnmatch
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CANONICAL_RULES_PATH = Path(__file__).resolve().parents[1] / "configs" / "canonical.json"
+DEFAULT_MAP_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "canonical.sqlite"
+MAX_CHAIN = 8
+
+
+@lru_cache(maxsize=4)
+def load_rules(path: Path = CANONICAL_RULES_PATH) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def normalize(url: str, rules: Dict[str, Any]) -> str:
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return url.strip()
+    host = (parts.hostname or "").lower()
+    host = rules.get("host_aliases", {}).get(host, host)
+    # https로 올려도 되는 것으로 확인된 호스트만 바꾼다.
+    if scheme == "http" and host in rules.get("https_hosts", []):
+        scheme = "https"
+    port = parts.port
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+
+    path = parts.path or "/"
+    for index_name in rules.get("strip_index", []):
+        if path.endswith("/" + index_name):
+            path = path[: -len(index_name)]
+            break
+    if rules.get("strip_trailing_slash") and len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    drop = rules.get("drop_params", [])
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not any(fnmatch.fnmatchcase(key.lower(), pattern) for pattern in drop)
+    ]
+    if rules.get("sort_params"):
+        params.sort()
+    return urlunsplit((scheme, netloc, path, urlencode(params), ""))
+
+
+# 리다이렉트와 rel=canonical로 알게 된 "변형 URL -> 대표 URL" 대응을 영속 저장한다.
+class CanonicalMap:
+    def __init__(self, path: Path = DEFAULT_MAP_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS aliases (url TEXT PRIMARY KEY, canonical TEXT, source TEXT, learned_at REAL)"
+        )
+        self._conn.commit()
+
+    def resolve(self, url: str) -> str:
+        # 체인(a -> b -> c)을 따라가되 순환에 대비해 길이를 제한한다.
+        seen = {url}
+        with self._lock:
+            for _ in range(MAX_CHAIN):
+                row = self._conn.execute("SELECT canonical FROM aliases WHERE url = ?", (url,)).fetchone()
+                if row is None or row[0] in seen:
+                    break
+                url = row[0]
+                seen.add(url)
+        return url
+
+    def learn(self, pairs: Iterable[Tuple[str, str, str]]) -> int:
+        now = time.time()
+        learned = 0
+        with self._lock:
+            for url, canonical, source in pairs:
+                if url == canonical:
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO aliases (url, canonical, source, learned_at) VALUES (?, ?, ?, ?)",
+                    (url, canonical, source, now),
+                )
+                learned += 1
+            self._conn.commit()
+        return learned
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class Canonicalizer:
+    def __init__(self, rules: Dict[str, Any], mapping: Optional[CanonicalMap] = None) -> None:
+        self.rules = rules
+        self.mapping = mapping
+        self.trusted_hosts = set(rules.get("trust_canonical_hosts", []))
+
+    def canonicalize(self, url: str) -> str:
+        normalized = normalize(url, self.rules)
+        return self.mapping.resolve(normalized) if self.mapping is not None else normalized
+
+    def _trusted(self, page_url: str, canonical: str) -> bool:
+        # 다른 사이트를 가리키는 canonical(신디케이션 등)은 같은 기사로 합치지 않는다.
+        host = urlsplit(canonical).hostname or ""
+        return host == urlsplit(page_url).hostname or host in self.trusted_hosts
+
+    def _redirect_learnable(self, url: str, final: str) -> bool:
+        # 삭제 기사를 홈으로 보내거나 다른 호스트로 넘기는 리다이렉트는 일시적일 수 있어 배우지 않는다.
+        start, end = urlsplit(url), urlsplit(final)
+        return end.hostname == start.hostname and end.path not in ("", "/")
+
+    def mappings(self, url: str, result: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        article = result.get("article") or {}
+        if article.get("error"):
+            return []
+        normalized = normalize(url, self.rules)
+        final = normalize(article.get("url") or url, self.rules)
+        pairs = [(normalized, final, "redirect")] if self._redirect_learnable(normalized, final) else []
+        canonical = article.get("canonical_url") or ""
+        if canonical:
+            canonical = normalize(canonical, self.rules)
+            if self._trusted(final, canonical):
+                pairs.append((final, canonical, "canonical"))
+        return [pair for pair in pairs if pair[0] != pair[1]]
+
+    def learn(self, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        if self.mapping is None:
+            return 0
+        return self.mapping.learn(pair for url, result in results for pair in self.mappings(url, result))
+
+
+def dedupe(urls: Iterable[str], canonicalizer: Canonicalizer) -> Tuple[List[str], Dict[str, List[str]]]:
+    groups: Dict[str, List[str]] = {}
+    for url in urls:
+        groups.setdefault(canonicalizer.canonicalize(url), []).append(url)
+    return list(groups), groups
+
+
+def fan_out(result: Dict[str, Any], inputs: List[str], canonical: str) -> Iterator[Dict[str, Any]]:
+    # 대표 URL로 한 번만 분석하고 같은 결과를 입력 URL마다 돌려준다.
+    for url in inputs:
+        yield {**result, "url": url, "canonical_url": canonical}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Canonicalize and deduplicate a URL list.")
+    parser.add_argument("--url-file", required=True, help="Text file with one URL per line.")
+    parser.add_argument("--rules", default=str(CANONICAL_RULES_PATH), help="Canonicalization rules json.")
+    parser.add_argument("--map", default=str(DEFAULT_MAP_PATH), help="Learned redirect/canonical SQLite map.")
+    parser.add_argument("--output", default="", help="Write unique canonical URLs to this text file.")
+    args = parser.parse_args()
+
+    from src.batch_report import load_urls
+
+    urls = load_urls(Path(args.url_file))
+    mapping = CanonicalMap(Path(args.map))
+    unique, groups = dedupe(urls, Canonicalizer(load_rules(Path(args.rules)), mapping))
+    mapping.close()
+    for canonical, inputs in groups.items():
+        if len(inputs) > 1:
+            print(f"{len(inputs):>4}  {canonical}")
+    print(f"{len(urls)} urls -> {len(unique)} unique")
+    if args.output:
+        Path(args.output).write_text("\n".join(unique) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# 데몬과 같은 기본값을 쓰되, 무거운 모듈을 끌어오지 않도록 src.daemon은 import하지 않는다.
+DEFAULT_SOCKET = os.environ.get("TENASIA_SEO_SOCKET", "/tmp/tenasia-seo.sock")
+
+
+def send_request(payload: Dict[str, Any], path: str = DEFAULT_SOCKET, timeout: float = 60.0) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(path)
+        conn.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _run_locally(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from src.daemon import handle_request
+
+    return handle_request(payload)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Forward an analysis request to the warm daemon.")
+    parser.add_argument("--url", default="", help="Article URL to fetch and analyze")
+    parser.add_argument("--article-json", default="", help="Already-fetched article JSON file ('-' for stdin)")
+    parser.add_argument("--ping", action="store_true", help="Check that the daemon is up")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="Fail instead of analyzing in-process when the daemon is not running.",
+    )
+    args = parser.parse_args()
+
+    if args.ping:
+        payload: Dict[str, Any] = {"op": "ping"}
+    elif args.article_json:
+        if args.article_json == "-":
+            source = sys.stdin.read()
+        else:
+            source = Path(args.article_json).read_text(encoding="utf-8")
+        payload = {"op": "score", "article": json.loads(source)}
+    else:
+        payload = {"op": "run", "url": args.url or "https://example.com/article"}
+
+    try:
+        response = send_request(payload, args.socket)
+    except (OSError, ValueError, AttributeError) as exc:
+        # 데몬 없음(OSError), 빈/깨진 응답(ValueError), AF_UNIX가 없는 Windows(AttributeError).
+        if args.no_fallback:
+            sys.exit(f"Daemon unavailable at {args.socket}: {exc}")
+        response = _run_locally(payload)
+
+    if not response.get("ok"):
+        sys.exit(response.get("error", "request failed"))
+    print(json.dumps(response.get("result", response), ensure_ascii=False, indent=2))
@@ -0,0 +1,268 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.canonical import load_rules, normalize
+from src.crawler import article_from_page, fetch_page
+from src.main import RUBRIC_PATH, select_rubric
+from src.records import ArticleRecord
+from src.scorer import prepare_article, score_article
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "competitor_pages.sqlite"
+COMPARE_WORKERS = 8
+LATENCY_BUDGET = 8.0
+# 경쟁 매체 기사는 이슈가 살아 있는 동안(기본 6시간) 다시 가져오지 않는다.
+STORY_TTL = 6 * 3600
+
+FACT_FIELDS = ("word_count", "paragraph_count", "h2_count", "image_count", "internal_links", "external_links")
+
+
+class PageCache:
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, article TEXT, fetched_at REAL)")
+        self._conn.commit()
+
+    def get(self, url: str, max_age: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT article FROM pages WHERE url = ? AND fetched_at >= ?", (url, time.time() - max_age)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, url: str, article: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, article, fetched_at) VALUES (?, ?, ?)",
+                (url, json.dumps(article, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def fetch_article(url: str) -> Dict[str, Any]:
+    return ArticleRecord.from_dict(article_from_page(url, fetch_page(url))).to_dict()
+
+
+def facts(article: Dict[str, Any]) -> Dict[str, Any]:
+    values = {
+        "title_length": len(article.get("title") or ""),
+        "meta_description_length": len(article.get("meta_description") or ""),
+    }
+    for field in FACT_FIELDS:
+        values[field] = article.get(field) or 0
+    return values
+
+
+def rank(scores: List[Tuple[str, float]]) -> List[Dict[str, Any]]:
+    # 동점은 같은 순위를 주고 다음 순위는 건너뛴다(1, 2, 2, 4).
+    ordered = sorted(scores, key=lambda item: item[1], reverse=True)
+    rows: List[Dict[str, Any]] = []
+    for position, (url, score) in enumerate(ordered, start=1):
+        tied = rows and rows[-1]["score"] == score
+        rows.append({"url": url, "score": score, "rank": rows[-1]["rank"] if tied else position})
+    return rows
+
+
+def build_ranking(pages: List[Dict[str, Any]], ours: str) -> Dict[str, Any]:
+    scored = [page for page in pages if page["status"] == "ok"]
+    criteria: List[str] = []
+    for page in scored:
+        criteria.extend(key for key in page["scores"] if key not in criteria)
+    ranking: Dict[str, Any] = {}
+    for key in ["total_score"] + criteria:
+        values = [
+            (page["url"], page["total_score"] if key == "total_score" else page["scores"][key])
+            for page in scored
+            if key == "total_score" or key in page["scores"]
+        ]
+        rows = rank(values)
+        own = next((row for row in rows if row["url"] == ours), None)
+        ranking[key] = {
+            "order": rows,
+            "ours_rank": own["rank"] if own else None,
+            "leader": rows[0]["url"] if rows else None,
+            "gap": round(rows[0]["score"] - own["score"], 2) if own else None,
+        }
+    return ranking
+
+
+# 같은 이슈를 다룬 타사 기사와 우리 기사를 같은 루브릭으로 채점해 항목별 순위를 매긴다.
+# 스레드 풀과 진행 중인 요청은 프로세스 전체가 공유하므로,
+# 여러 편집자가 같은 URL을 비교해도 한 번만 가져온다.
+class StoryComparer:
+    def __init__(
+        self,
+        cache: PageCache,
+        fetch: Callable[[str], Dict[str, Any]] = fetch_article,
+        workers: int = COMPARE_WORKERS,
+    ) -> None:
+        self.cache = cache
+        self.fetch = fetch
+        self.rules = load_rules()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="competitor")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def _fetch(self, key: str, url: str, store: bool) -> Dict[str, Any]:
+        try:
+            article = self.fetch(url)
+        except Exception as exc:  # 한 매체의 실패가 비교 전체를 막지 않게 한다.
+            article = {"url": url, "error": str(exc)}
+        if store and not article.get("error"):
+            self.cache.put(key, article)
+        return article
+
+    def _submit(self, key: str, url: str, store: bool) -> Future:
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._pending[key] = self._executor.submit(self._fetch, key, url, store)
+        # 이미 끝난 future면 콜백이 바로 실행되므로 잠금 밖에서 등록한다.
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def compare(
+        self,
+        ours: str,
+        competitors: List[str],
+        rubric_path: Path = RUBRIC_PATH,
+        budget: float = LATENCY_BUDGET,
+        ttl: float = STORY_TTL,
+    ) -> Dict[str, Any]:
+        started = time.monotonic()
+        own_key = normalize(ours, self.rules)
+        keys: Dict[str, str] = {}
+        for url in competitors:
+            key = normalize(url, self.rules)
+            if key != own_key and key not in keys:
+                keys[key] = url
+
+        articles: Dict[str, Dict[str, Any]] = {}
+        cached: Dict[str, bool] = {}
+        # 우리 기사는 편집 중일 수 있으므로 항상 새로 가져온다.
+        futures = {own_key: self._submit(own_key, ours, store=False)}
+        for key, url in keys.items():
+            article = self.cache.get(key, ttl)
+            cached[key] = article is not None
+            if article is not None:
+                articles[key] = article
+            else:
+                futures[key] = self._submit(key, url, store=True)
+        # 예산을 넘긴 요청은 기다리지 않지만 계속 진행되어 다음 비교 때 캐시에서 쓰인다.
+        wait(list(futures.values()), timeout=max(0.0, budget - (time.monotonic() - started)))
+        for key, future in futures.items():
+            if future.done():
+                articles[key] = future.result()
+
+        own_article = articles.get(own_key)
+        profile = prepare_article(own_article).profile if own_article and not own_article.get("error") else None
+        rubric, routing = select_rubric(rubric_path, ours, profile)
+
+        pages = []
+        entries = [(own_key, ours, "ours")] + [(key, url, "competitor") for key, url in keys.items()]
+        for key, url, role in entries:
+            pages.append(self._page(url, role, articles.get(key), rubric, cached.get(key, False)))
+        report = {
+            "ours": ours,
+            "rubric": rubric.get("version", ""),
+            "budget": budget,
+            "elapsed": round(time.monotonic() - started, 3),
+            "pages": pages,
+            "ranking": build_ranking(pages, ours),
+        }
+        if routing is not None:
+            report["routing"] = routing
+        return report
+
+    def _page(
+        self, url: str, role: str, article: Optional[Dict[str, Any]], rubric: Dict[str, Any], cached: bool
+    ) -> Dict[str, Any]:
+        page: Dict[str, Any] = {"url": url, "role": role, "cached": cached}
+        if article is None:
+            page.update(status="timeout", error="latency budget exceeded")
+            return page
+        if article.get("error"):
+            page.update(status="error", error=article["error"])
+            return page
+        score = score_article(ArticleRecord.from_dict(article), rubric)
+        page.update(
+            status="ok",
+            title=article.get("title") or "",
+            total_score=score["total_score"],
+            grade=score["grade"],
+            scores={item["id"]: item["score"] for item in score["details"]},
+            issues=sorted({issue for item in score["details"] for issue in item.get("issues", [])}),
+            facts=facts(article),
+        )
+        return page
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.cache.close()
+
+
+_COMPARERS: Dict[str, StoryComparer] = {}
+_COMPARERS_LOCK = threading.Lock()
+
+
+def get_comparer(cache_path: Path = DEFAULT_CACHE_PATH) -> StoryComparer:
+    key = str(cache_path)
+    with _COMPARERS_LOCK:
+        comparer = _COMPARERS.get(key)
+        if comparer is None:
+            comparer = _COMPARERS[key] = StoryComparer(PageCache(cache_path))
+    return comparer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score our article and competitor coverage of the same story.")
+    parser.add_argument("--url", required=True, help="Our article URL.")
+    parser.add_argument("--competitor", action="append", default=[], help="Competitor article URL (repeatable).")
+    parser.add_argument("--competitor-file", default="", help="Text file with one competitor URL per line.")
+    parser.add_argument("--rubric", default=str(RUBRIC_PATH), help="Rubric json (or routes config) to score with.")
+    parser.add_argument("--budget", type=float, default=LATENCY_BUDGET, help="Seconds to wait for fetches.")
+    parser.add_argument("--ttl-hours", type=float, default=STORY_TTL / 3600, help="Competitor page cache lifetime.")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="Competitor page cache path.")
+    parser.add_argument("--output", default="", help="Write the full comparison json here.")
+    args = parser.parse_args()
+
+    competitors = list(args.competitor)
+    if args.competitor_file:
+        lines = Path(args.competitor_file).read_text(encoding="utf-8").splitlines()
+        competitors.extend(line.strip() for line in lines if line.strip() and not line.startswith("#"))
+
+    comparer = get_comparer(Path(args.cache))
+    report = comparer.compare(args.url, competitors, Path(args.rubric), args.budget, args.ttl_hours * 3600)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    for page in report["pages"]:
+        score = f"{page['total_score']:>6.1f} {page['grade']}" if page["status"] == "ok" else f"{page['status']:>8}"
+        print(f"{page['role']:<10} {score}  {page['url']}")
+    for key, entry in report["ranking"].items():
+        gap = "-" if entry["gap"] is None else entry["gap"]
+        print(f"{key:<18} ours {entry['ours_rank'] or '-'}/{len(entry['order'])}  gap {gap}")
+    print(f"elapsed {report['elapsed']}s")
+    comparer.close()
+
+
+if __name__ == "__main__":
+    main()
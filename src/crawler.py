@@ -1,9 +1,19 @@
-﻿import re
-from urllib.parse import urlparse
-from typing import Any, Dict, List
+﻿from __future__ import annotations
 
-import requests
-from bs4 import BeautifulSoup, Tag
+import re
+import socket
+import threading
+from urllib.parse import urldefrag, urljoin, urlparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.encoding import decode_html
+from src.metrics import StageTimer, stage
+from src.structured_data import extract_structured_data
+
+# requests/bs4/lxml은 import 비용이 커서 실제로 필요한 경로에서만 불러온다.
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup, Tag
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -13,6 +23,23 @@ DEFAULT_HEADERS = {
     )
 }
 
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    # 연결 재사용을 위해 프로세스 전역 세션을 쓴다. 벤치마크는 여기에 replay 어댑터를 마운트한다.
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+                _SESSION = session
+    return _SESSION
+
 
 def _clean_text(value: str) -> str:
     return re.sub(r"\s+", " ", value or "").strip()
@@ -37,6 +64,8 @@ def _extract_title(soup: BeautifulSoup) -> str:
 
 
 def _select_article_root(soup: BeautifulSoup) -> Tag:
+    from bs4 import Tag
+
     selectors = [
         "article",
         "[itemprop='articleBody']",
@@ -66,26 +95,66 @@ def _extract_paragraphs(root: Tag) -> List[str]:
     return [fallback] if fallback else []
 
 
-def _count_links(root: Tag, base_url: str) -> Dict[str, int]:
+def _link_target(base_url: str, href: str) -> str:
+    target, _ = urldefrag(urljoin(base_url, href))
+    if urlparse(target).scheme not in ("http", "https"):
+        return ""
+    return target
+
+
+def _count_links(root: Tag, base_url: str) -> Dict[str, Any]:
     base_domain = urlparse(base_url).netloc.lower()
     internal = 0
     external = 0
+    targets: Dict[str, None] = {}
     for link in root.find_all("a", href=True):
         href = link["href"].strip()
         if not href:
             continue
         parsed = urlparse(href)
-        if not parsed.netloc:
-            internal += 1
-            continue
-        if parsed.netloc.lower() == base_domain:
-            internal += 1
-        else:
+        if parsed.netloc and parsed.netloc.lower() != base_domain:
             external += 1
-    return {"internal_links": internal, "external_links": external}
+            continue
+        internal += 1
+        # 링크 그래프용으로 내부 링크 대상을 순서를 유지해 중복 없이 남긴다.
+        target = _link_target(base_url, href)
+        if target and target != base_url:
+            targets[target] = None
+    return {"internal_links": internal, "external_links": external, "internal_targets": list(targets)}
+
+
+def _extract_images(images: List[Tag], base_url: str) -> List[Dict[str, Any]]:
+    from src.image_probe import image_format
+
+    records: List[Dict[str, Any]] = []
+    for img in images:
+        # 지연 로딩 이미지의 src는 보통 자리표시자라 data-src 쪽이 실제 이미지다.
+        src = (img.get("data-src") or img.get("data-lazy-src") or img.get("src") or "").strip()
+        if not src or src.startswith("data:"):
+            continue
+        src = urljoin(base_url, src)
+        lazy = (
+            img.get("loading", "").lower() == "lazy"
+            or img.has_attr("data-src")
+            or img.has_attr("data-lazy-src")
+        )
+        records.append({"src": src, "lazy": lazy, "format": image_format(src), "bytes": None})
+    return records
+
+
+def _teardown(soup: BeautifulSoup) -> None:
+    from bs4 import Tag
+
+    # 트리의 부모/형제 순환 참조를 즉시 끊어 GC를 기다리지 않고 메모리를 돌려준다.
+    for child in list(soup.contents):
+        if isinstance(child, Tag):
+            child.decompose()
+    soup.decompose()
 
 
 def parse_article_html(url: str, html: str) -> Dict[str, Any]:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "lxml")
 
     title = _extract_title(soup)
@@ -94,6 +163,8 @@ def parse_article_html(url: str, html: str) -> Dict[str, Any]:
     )
     h1_node = soup.find("h1")
     h1 = _clean_text(h1_node.get_text(" ", strip=True)) if h1_node else ""
+    canonical_node = soup.find("link", rel="canonical", href=True)
+    canonical_url = _link_target(url, canonical_node["href"].strip()) if canonical_node else ""
 
     root = _select_article_root(soup)
     paragraphs = _extract_paragraphs(root)
@@ -102,46 +173,107 @@ def parse_article_html(url: str, html: str) -> Dict[str, Any]:
 
     images = root.find_all("img")
     images_missing_alt = sum(1 for img in images if not _clean_text(img.get("alt", "")))
+    image_records = _extract_images(images, url)
     link_counts = _count_links(root, url)
+    h2_count = len(root.find_all("h2"))
+    _teardown(soup)
 
     return {
         "url": url,
         "title": title,
         "meta_description": meta_description,
         "h1": h1,
-        "h2_count": len(root.find_all("h2")),
+        "h2_count": h2_count,
         "content": content,
         "paragraph_count": len(paragraphs),
         "word_count": words,
         "image_count": len(images),
         "images_missing_alt": images_missing_alt,
+        "images": image_records,
         "internal_links": link_counts["internal_links"],
         "external_links": link_counts["external_links"],
+        "internal_targets": link_counts["internal_targets"],
+        "canonical_url": canonical_url,
+        "structured_data": extract_structured_data(html),
         "error": "",
     }
 
 
-def fetch_article(url: str) -> Dict[str, Any]:
+def _error_article(url: str, error: str) -> Dict[str, Any]:
+    return {
+        "url": url,
+        "title": "",
+        "meta_description": "",
+        "h1": "",
+        "h2_count": 0,
+        "content": "",
+        "paragraph_count": 0,
+        "word_count": 0,
+        "image_count": 0,
+        "images_missing_alt": 0,
+        "images": [],
+        "internal_links": 0,
+        "external_links": 0,
+        "internal_targets": [],
+        "error": error,
+    }
+
+
+def _resolve_host(url: str) -> None:
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.getaddrinfo(parsed.hostname, port, proto=socket.IPPROTO_TCP)
+    except OSError:
+        pass
+
+
+def fetch_page(url: str, timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+    import requests
+
+    from src.politeness import FetchBlocked, get_controller
+
+    if timer is not None:
+        # requests는 DNS 시간을 따로 노출하지 않으므로 계측 시에만 요청 전에 한 번 더 조회해 잰다.
+        # 실제 요청 경로에 없는 조회라 dns_probe로 따로 보고하고 total에는 넣지 않는다.
+        with timer.stage("dns_probe"):
+            _resolve_host(url)
+
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=15)
+        # 호스트별 속도 제한, 재시도, 서킷 브레이커, robots.txt 검사를 거친다. ttfb 구간은 컨트롤러가 잰다.
+        response = get_controller().get(url, timeout=15, timer=timer, stream=True)
         response.raise_for_status()
-    except requests.RequestException as exc:
-        return {
-            "url": url,
-            "title": "",
-            "meta_description": "",
-            "h1": "",
-            "h2_count": 0,
-            "content": "",
-            "paragraph_count": 0,
-            "word_count": 0,
-            "image_count": 0,
-            "images_missing_alt": 0,
-            "internal_links": 0,
-            "external_links": 0,
-            "error": str(exc),
-        }
-
-    article = parse_article_html(response.url, response.text)
-    article["status_code"] = response.status_code
+        with stage(timer, "download"):
+            body = response.content
+            # response.text는 charset이 없으면 본문 전체에 통계 감지를 돌리므로 바이트에서 직접 디코딩한다.
+            html, encoding, encoding_source = decode_html(body, response.headers.get("Content-Type", ""))
+    except (requests.RequestException, FetchBlocked) as exc:
+        return {"url": url, "status_code": 0, "bytes": 0, "html": "", "error": str(exc)}
+
+    if timer is not None:
+        timer.bytes += len(body)
+    return {
+        "url": response.url,
+        "status_code": response.status_code,
+        "bytes": len(body),
+        "html": html,
+        "encoding": encoding,
+        "encoding_source": encoding_source,
+        "error": "",
+    }
+
+
+def article_from_page(url: str, page: Dict[str, Any]) -> Dict[str, Any]:
+    if page["error"]:
+        return _error_article(url, page["error"])
+    article = parse_article_html(page["url"], page["html"])
+    article["status_code"] = page["status_code"]
+    article["encoding"] = page.get("encoding", "")
+    article["encoding_source"] = page.get("encoding_source", "")
     return article
+
+
+def fetch_article(url: str) -> Dict[str, Any]:
+    return article_from_page(url, fetch_page(url))
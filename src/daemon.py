@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any, Dict
+
+from src.crawler import get_session, parse_article_html
+from src.main import analyze_article, load_rubric, run
+
+DEFAULT_SOCKET = os.environ.get("TENASIA_SEO_SOCKET", "/tmp/tenasia-seo.sock")
+
+
+def warm_up() -> None:
+    # 첫 요청이 import/컴파일 비용을 내지 않도록 파서, 루브릭, 세션을 미리 올려 둔다.
+    import src.draft  # noqa: F401
+
+    get_session()
+    load_rubric()
+    parse_article_html("warm://up", "<html><head><title>warm</title></head><body><p>up</p></body></html>")
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    op = request.get("op")
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if op == "run":
+        return {"ok": True, "result": run(str(request.get("url") or ""), request.get("timings"))}
+    if op == "score":
+        return {"ok": True, "result": analyze_article(request.get("article") or {})}
+    if op == "draft":
+        from src.draft import analyze_draft
+
+        return {"ok": True, "result": analyze_draft(**(request.get("draft") or {}))}
+    return {"ok": False, "error": f"unknown op: {op}"}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = handle_request(json.loads(line))
+            except Exception as exc:  # 요청 하나의 실패로 연결을 끊지 않고 오류 응답을 돌려준다.
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _socket_in_use(path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def serve(path: Path) -> None:
+    if path.exists():
+        if _socket_in_use(path):
+            raise SystemExit(f"Daemon already listening on {path}")
+        path.unlink()
+
+    warm_up()
+    server = DaemonServer(str(path), _RequestHandler)
+    os.chmod(path, 0o600)
+    print(f"Warm daemon listening on {path} (pid {os.getpid()})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep parser, rubric and caches warm behind a Unix socket.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    args = parser.parse_args()
+
+    serve(Path(args.socket))
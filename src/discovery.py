@@ -0,0 +1,259 @@
+import argparse
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import XMLPullParser
+
+from src.crawler import get_session
+
+DEFAULT_FRONTIER_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "frontier.sqlite"
+DISCOVERY_WORKERS = 8
+CHUNK_SIZE = 64 * 1024
+FETCH_TIMEOUT = 30
+
+# (kind, loc, lastmod): kind는 "sitemap"(하위 사이트맵) 또는 "url"(기사)이다.
+Entry = Tuple[str, str, str]
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def normalize_lastmod(value: str) -> str:
+    value = (value or "").strip()
+    if not value:
+        return ""
+    try:
+        if value[:4].isdigit():
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+ENTRY_TAGS = ("sitemap", "url", "item", "entry")
+
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[Entry]:
+    # 사이트맵 인덱스, (뉴스) 사이트맵, RSS, Atom을 모두 스트리밍으로 읽고 처리한 요소는 바로 비운다.
+    parser = XMLPullParser(events=("start", "end"))
+    loc = lastmod = ""
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            name = _local(element.tag)
+            if event == "start":
+                if name in ENTRY_TAGS:
+                    loc = lastmod = ""
+                continue
+            text = (element.text or "").strip()
+            # 이미지/비디오 사이트맵의 하위 loc보다 항목 자신의 첫 loc를 우선한다.
+            if name == "loc" and not loc:
+                loc = text
+            elif name == "link" and not loc and element.get("rel", "alternate") == "alternate":
+                loc = element.get("href") or text
+            elif name in ("lastmod", "publication_date", "pubdate", "updated", "published"):
+                # 뉴스 사이트맵은 lastmod 대신 news:publication_date만 둘 때가 있다.
+                if name == "lastmod" or not lastmod:
+                    lastmod = text
+            elif name in ENTRY_TAGS:
+                if loc:
+                    yield ("sitemap" if name == "sitemap" else "url", loc, normalize_lastmod(lastmod))
+                loc = lastmod = ""
+                element.clear()
+    parser.close()
+
+
+def _iter_body(url: str) -> Iterator[bytes]:
+    response = get_session().get(url, timeout=FETCH_TIMEOUT, stream=True)
+    response.raise_for_status()
+    # 서버가 Content-Encoding 없이 .gz 파일을 그대로 주면 직접 푼다.
+    inflater: Optional[Any] = None
+    for chunk in response.iter_content(CHUNK_SIZE):
+        if inflater is None and chunk[:2] == b"\x1f\x8b":
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        yield inflater.decompress(chunk) if inflater is not None else chunk
+
+
+def fetch_entries(url: str) -> Tuple[str, List[Entry], str]:
+    import requests
+
+    if url.rstrip("/").endswith("robots.txt"):
+        try:
+            text = b"".join(_iter_body(url)).decode("utf-8", errors="replace")
+        except requests.RequestException as exc:
+            return url, [], str(exc)
+        sitemaps = [
+            ("sitemap", line.split(":", 1)[1].strip(), "")
+            for line in text.splitlines()
+            if line.lower().startswith("sitemap:")
+        ]
+        return url, sitemaps, ""
+    try:
+        return url, list(iter_feed_entries(_iter_body(url))), ""
+    except requests.RequestException as exc:
+        return url, [], str(exc)
+    except SyntaxError as exc:
+        return url, [], f"xml error: {exc}"
+    except zlib.error as exc:
+        return url, [], f"gzip error: {exc}"
+
+
+# 발견한 URL과 lastmod, 처리 상태를 보관하는 영속 프런티어.
+class Frontier:
+    def __init__(self, path: Path = DEFAULT_FRONTIER_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "url TEXT PRIMARY KEY, lastmod TEXT, discovered_at REAL, pending INTEGER, done_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS urls_pending ON urls (pending)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sitemaps (url TEXT PRIMARY KEY, lastmod TEXT, fetched_at REAL)"
+        )
+        self._conn.commit()
+
+    def sitemap_changed(self, url: str, lastmod: str) -> bool:
+        if not lastmod:
+            return True
+        with self._lock:
+            row = self._conn.execute("SELECT lastmod FROM sitemaps WHERE url = ?", (url,)).fetchone()
+        return row is None or row[0] != lastmod
+
+    def record_sitemap(self, url: str, lastmod: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sitemaps (url, lastmod, fetched_at) VALUES (?, ?, ?)",
+                (url, lastmod, time.time()),
+            )
+            self._conn.commit()
+
+    def offer(self, entries: Iterable[Tuple[str, str]]) -> int:
+        # 새 URL이거나 lastmod가 바뀐 URL만 pending으로 올린다.
+        now = time.time()
+        enqueued = 0
+        with self._lock:
+            cursor = self._conn.cursor()
+            for url, lastmod in entries:
+                row = cursor.execute("SELECT lastmod, pending FROM urls WHERE url = ?", (url,)).fetchone()
+                if row is None:
+                    cursor.execute(
+                        "INSERT INTO urls (url, lastmod, discovered_at, pending) VALUES (?, ?, ?, 1)",
+                        (url, lastmod, now),
+                    )
+                    enqueued += 1
+                elif lastmod and lastmod != row[0]:
+                    # 아직 대기 중인 URL도 최신 lastmod는 남기고, 다시 올린 건수는 처리된 URL만 센다.
+                    cursor.execute("UPDATE urls SET lastmod = ?, pending = 1 WHERE url = ?", (lastmod, url))
+                    enqueued += 0 if row[1] else 1
+            self._conn.commit()
+        return enqueued
+
+    def pending(self, limit: int = 0) -> List[str]:
+        query = "SELECT url FROM urls WHERE pending = 1 ORDER BY lastmod DESC, discovered_at"
+        with self._lock:
+            rows = self._conn.execute(query + (" LIMIT ?" if limit else ""), (limit,) if limit else ())
+            return [url for (url,) in rows]
+
+    def lastmods(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT url, lastmod FROM urls"))
+
+    def mark_done(self, urls: Iterable[str]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE urls SET pending = 0, done_at = ? WHERE url = ?", [(now, url) for url in urls]
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, pending = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(pending), 0) FROM urls"
+            ).fetchone()
+        return {"urls": total, "pending": pending}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def discover(
+    seeds: List[str], frontier: Frontier, workers: int = DISCOVERY_WORKERS
+) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"fetched": 0, "skipped_sitemaps": 0, "enqueued": 0, "errors": []}
+    seen = set(seeds)
+    lastmods: Dict[str, str] = {}
+    with ThreadPoolExecutor(workers, thread_name_prefix="discovery") as executor:
+        running = {executor.submit(fetch_entries, seed) for seed in seeds}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, entries, error = future.result()
+                summary["fetched"] += 1
+                if error:
+                    summary["errors"].append(f"{url}: {error}")
+                    continue
+                # lastmod가 바뀌지 않은 하위 사이트맵은 다시 받지 않는다.
+                for kind, loc, lastmod in entries:
+                    if kind != "sitemap" or loc in seen:
+                        continue
+                    seen.add(loc)
+                    if not frontier.sitemap_changed(loc, lastmod):
+                        summary["skipped_sitemaps"] += 1
+                        continue
+                    lastmods[loc] = lastmod
+                    running.add(executor.submit(fetch_entries, loc))
+                summary["enqueued"] += frontier.offer(
+                    (loc, lastmod) for kind, loc, lastmod in entries if kind == "url"
+                )
+                if url in lastmods:
+                    frontier.record_sitemap(url, lastmods[url])
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Discover article URLs from robots.txt, sitemap indexes, news sitemaps and RSS/Atom feeds."
+    )
+    parser.add_argument("--seed", action="append", required=True, help="robots.txt, sitemap or feed URL.")
+    parser.add_argument("--frontier", default=str(DEFAULT_FRONTIER_PATH), help="Frontier SQLite path.")
+    parser.add_argument("--workers", type=int, default=DISCOVERY_WORKERS, help="Concurrent sitemap fetches.")
+    parser.add_argument("--export", default="", help="Also write pending URLs to this text file.")
+    args = parser.parse_args()
+
+    frontier = Frontier(Path(args.frontier))
+    started = time.perf_counter()
+    summary = discover(args.seed, frontier, args.workers)
+    for error in summary["errors"]:
+        print(f"  error {error}")
+    stats = frontier.stats()
+    print(
+        f"Fetched {summary['fetched']} feeds (skipped {summary['skipped_sitemaps']} unchanged sitemaps), "
+        f"enqueued {summary['enqueued']} urls; frontier {stats['urls']} urls, {stats['pending']} pending "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    if args.export:
+        export_path = Path(args.export)
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        export_path.write_text("\n".join(frontier.pending()) + "\n", encoding="utf-8")
+        print(f"Saved pending urls: {export_path}")
+    frontier.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import copy
+import json
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.crawler import _clean_text, parse_article_html
+from src.main import load_rubric
+from src.recommender import recommend_fixes
+from src.scorer import (
+    CRITERION_FIELDS,
+    SCORERS,
+    _criterion_rules,
+    _detect_profile,
+    summarize_scores,
+)
+
+DRAFT_URL = "draft://local"
+
+
+@lru_cache(maxsize=16)
+def _parse_cached(url: str, html: str) -> Dict[str, Any]:
+    return parse_article_html(url, html)
+
+
+def article_from_fields(
+    title: str = "",
+    meta_description: str = "",
+    body: str = "",
+    h1: str = "",
+    h2_count: int = 0,
+    url: str = DRAFT_URL,
+) -> Dict[str, Any]:
+    paragraphs = [p for p in (_clean_text(line) for line in (body or "").splitlines()) if p]
+    content = "\n".join(paragraphs)
+    return {
+        "url": url,
+        "title": _clean_text(title),
+        "meta_description": _clean_text(meta_description),
+        "h1": _clean_text(h1),
+        "h2_count": int(h2_count or 0),
+        "content": content,
+        "paragraph_count": len(paragraphs),
+        "word_count": len([token for token in re.split(r"\s+", content) if token]),
+        "image_count": 0,
+        "images_missing_alt": 0,
+        "internal_links": 0,
+        "external_links": 0,
+        "error": "",
+    }
+
+
+@lru_cache(maxsize=64)
+def _profile_cached(
+    title: str, url: str, content: str, word_count: int, paragraph_count: int
+) -> Tuple[Tuple[str, str], ...]:
+    profile = _detect_profile(
+        {
+            "title": title,
+            "url": url,
+            "content": content,
+            "word_count": word_count,
+            "paragraph_count": paragraph_count,
+        }
+    )
+    return tuple(profile.items())
+
+
+def _freeze_fields(
+    names: Tuple[str, ...], values: Dict[str, Any]
+) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[str, ...]]:
+    # images(list)/structured_data(dict)처럼 해시할 수 없는 값은 JSON 문자열로 바꿔 캐시 키에 넣는다.
+    fields, frozen = [], []
+    for name in names:
+        value = values.get(name)
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, sort_keys=True, ensure_ascii=False)
+            frozen.append(name)
+        fields.append((name, value))
+    return tuple(fields), tuple(frozen)
+
+
+@lru_cache(maxsize=512)
+def _score_section(
+    criterion_id: str,
+    weight: int,
+    rules_key: str,
+    fields: Tuple[Tuple[str, Any], ...],
+    frozen: Tuple[str, ...] = (),
+) -> Dict[str, Any]:
+    article = dict(fields)
+    for name in frozen:
+        article[name] = json.loads(article[name])
+    if "_profile" in article:
+        article["_profile"] = dict(article["_profile"])
+    return SCORERS[criterion_id](article, weight, json.loads(rules_key))
+
+
+def _score_draft(article: Dict[str, Any], rubric: Dict[str, Any]) -> Dict[str, Any]:
+    profile_items = _profile_cached(
+        article.get("title") or "",
+        article.get("url") or "",
+        article.get("content") or "",
+        int(article.get("word_count") or 0),
+        int(article.get("paragraph_count") or 0),
+    )
+    profile = dict(profile_items)
+    values = dict(article, _profile=profile_items)
+
+    details: List[Dict[str, Any]] = []
+    for criterion in rubric.get("criteria", []):
+        criterion_id = criterion.get("id")
+        weight = int(criterion.get("weight", 0))
+        if criterion_id not in SCORERS or weight <= 0:
+            continue
+        rules = _criterion_rules(criterion, rubric, profile)
+        fields, frozen = _freeze_fields(CRITERION_FIELDS[criterion_id], values)
+        item = _score_section(criterion_id, weight, json.dumps(rules, sort_keys=True), fields, frozen)
+        details.append(copy.deepcopy(item))
+
+    return summarize_scores(details, rubric, profile)
+
+
+def analyze_draft(
+    html: Optional[str] = None,
+    title: str = "",
+    meta_description: str = "",
+    body: str = "",
+    h1: str = "",
+    h2_count: int = 0,
+    url: str = DRAFT_URL,
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    if html is not None:
+        article = dict(_parse_cached(url, html))
+    else:
+        article = article_from_fields(title, meta_description, body, h1, h2_count, url)
+
+    score_result = _score_draft(article, load_rubric())
+    recommendations = recommend_fixes(score_result)
+    return {
+        "url": url,
+        "article": article,
+        "score": score_result,
+        "recommendations": recommendations,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,65 @@
+import codecs
+import re
+from typing import Optional, Tuple
+
+SNIFF_BYTES = 4096
+DEFAULT_ENCODING = "utf-8"
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# 브라우저와 같게 EUC-KR 계열 라벨은 상위 집합인 cp949로 디코딩한다.
+_ALIASES = {"euc-kr": "cp949", "euc_kr": "cp949", "ks_c_5601-1987": "cp949", "x-windows-949": "cp949"}
+_HEADER_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+
+
+def _codec(label: str) -> Optional[str]:
+    label = label.strip().lower()
+    label = _ALIASES.get(label, label)
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+
+def declared_encoding(body: bytes, content_type: str = "") -> Optional[Tuple[str, str]]:
+    for bom, name in _BOMS:
+        if body.startswith(bom):
+            return name, "bom"
+
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    codec = _codec(match.group(1)) if match else None
+    if codec:
+        return codec, "header"
+
+    match = _META_CHARSET_RE.search(body, 0, SNIFF_BYTES)
+    codec = _codec(match.group(1).decode("ascii", "ignore")) if match else None
+    if codec:
+        return codec, "meta"
+    return None
+
+
+def decode_html(body: bytes, content_type: str = "") -> Tuple[str, str, str]:
+    declared = declared_encoding(body, content_type)
+    if declared is not None:
+        encoding, source = declared
+        return body.decode(encoding, errors="replace"), encoding, source
+
+    # 선언이 없으면 UTF-8 엄격 디코딩을 먼저 시도한다. 통계 기반 감지는 마지막 수단이다.
+    try:
+        return body.decode("utf-8"), "utf-8", "utf8"
+    except UnicodeDecodeError:
+        pass
+
+    from charset_normalizer import from_bytes
+
+    best = from_bytes(body).best()
+    encoding = _codec(best.encoding) if best is not None else None
+    if encoding:
+        return body.decode(encoding, errors="replace"), encoding, "detected"
+    return body.decode(DEFAULT_ENCODING, errors="replace"), DEFAULT_ENCODING, "default"
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "image_probe.sqlite"
+PROBE_WORKERS = 8
+PROBE_TIMEOUT = 5
+# 같은 CDN 썸네일이 수천 기사에 반복되므로 URL 단위 결과를 일주일간 재사용한다.
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+MEMORY_CACHE_LIMIT = 50_000
+
+FORMAT_ALIASES = {"jpg": "jpeg", "svg+xml": "svg", "x-icon": "ico"}
+
+
+def image_format(url: str, content_type: str = "") -> str:
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    if content_type.startswith("image/"):
+        fmt = content_type[len("image/"):]
+    else:
+        suffix = Path(urlparse(url).path).suffix.lower().lstrip(".")
+        fmt = suffix if suffix.isalnum() else ""
+    return FORMAT_ALIASES.get(fmt, fmt)
+
+
+class ImageCache:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            "url TEXT PRIMARY KEY, bytes INTEGER, content_type TEXT, status INTEGER, checked_at REAL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, urls: List[str], max_age: float) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        cutoff = time.time() - max_age
+        with self._lock:
+            # SQLite 변수 개수 제한(999) 아래로 나눠 조회한다.
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT url, bytes, content_type, status FROM images "
+                    f"WHERE checked_at >= ? AND url IN ({','.join('?' * len(chunk))})",
+                    [cutoff, *chunk],
+                )
+                for url, size, content_type, status in rows:
+                    found[url] = {"bytes": size, "content_type": content_type, "status": status}
+        return found
+
+    def put_many(self, results: Dict[str, Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO images (url, bytes, content_type, status, checked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (url, info["bytes"], info["content_type"], info["status"], now)
+                    for url, info in results.items()
+                ],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _probe_session(workers: int) -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from src.crawler import DEFAULT_HEADERS
+
+    # 호스트별 연결 풀을 워커 수만큼 키워 같은 CDN으로 가는 요청이 연결을 재사용하게 한다.
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def probe_image(session: Any, url: str, timeout: float = PROBE_TIMEOUT) -> Dict[str, Any]:
+    import requests
+
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        length = response.headers.get("Content-Length")
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code >= 400 or not length:
+            # HEAD를 막거나 길이를 주지 않는 서버는 1바이트 범위 요청으로 전체 크기를 얻는다.
+            response = session.get(
+                url, headers={"Range": "bytes=0-0"}, timeout=timeout, stream=True, allow_redirects=True
+            )
+            response.close()
+            content_range = response.headers.get("Content-Range", "")
+            length = content_range.rsplit("/", 1)[-1] if "/" in content_range else response.headers.get(
+                "Content-Length"
+            )
+            content_type = response.headers.get("Content-Type", content_type)
+    except requests.RequestException:
+        return {"bytes": None, "content_type": "", "status": 0}
+
+    size = int(length) if length and str(length).isdigit() else None
+    if response.status_code >= 400:
+        size = None
+    return {"bytes": size, "content_type": content_type, "status": response.status_code}
+
+
+class ImageProber:
+    def __init__(
+        self,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        workers: int = PROBE_WORKERS,
+        ttl: float = CACHE_TTL_SECONDS,
+        session: Any = None,
+    ) -> None:
+        self.session = session if session is not None else _probe_session(workers)
+        self.cache = ImageCache(cache_path) if cache_path else None
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="image-probe")
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        wanted = list(dict.fromkeys(url for url in urls if url))
+        with self._lock:
+            results = {url: self._memory[url] for url in wanted if url in self._memory}
+        missing = [url for url in wanted if url not in results]
+        if missing and self.cache is not None:
+            results.update(self.cache.get_many(missing, self.ttl))
+            missing = [url for url in wanted if url not in results]
+
+        fetched: Dict[str, Dict[str, Any]] = {}
+        if missing:
+            for url, info in zip(missing, self._executor.map(lambda u: probe_image(self.session, u), missing)):
+                fetched[url] = info
+            # 네트워크 오류(status 0)는 캐시하지 않고 다음 배치에서 다시 확인한다.
+            cacheable = {url: info for url, info in fetched.items() if info["status"]}
+            if cacheable and self.cache is not None:
+                self.cache.put_many(cacheable)
+            results.update(fetched)
+
+        with self._lock:
+            if len(self._memory) > MEMORY_CACHE_LIMIT:
+                self._memory.clear()
+            self._memory.update({url: info for url, info in results.items() if info["status"]})
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self.cache is not None:
+            self.cache.close()
+
+
+def attach_probes(article: Any, prober: ImageProber) -> None:
+    images = article.get("images") or []
+    if not images:
+        return
+    results = prober.probe(image["src"] for image in images)
+    for image in images:
+        info = results.get(image["src"])
+        if not info:
+            continue
+        image["bytes"] = info["bytes"]
+        image["format"] = image_format(image["src"], info["content_type"]) or image.get("format", "")
+
+
+_PROBERS: Dict[str, ImageProber] = {}
+_PROBERS_LOCK = threading.Lock()
+
+
+def get_prober(cache_path: Path = DEFAULT_CACHE_PATH) -> ImageProber:
+    # 프로세스당 하나의 prober(스레드 풀, 연결 풀, 캐시 연결)를 공유한다.
+    key = str(cache_path)
+    with _PROBERS_LOCK:
+        prober = _PROBERS.get(key)
+        if prober is None:
+            prober = _PROBERS[key] = ImageProber(cache_path)
+    return prober
@@ -0,0 +1,205 @@
+import argparse
+import csv
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from src.canonical import load_rules, normalize
+from src.recommender import profile_key, score_bucket
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parents[1] / "data" / "index" / "impact_table.json"
+DEFAULT_STATS_PATH = Path(__file__).resolve().parents[1] / "data" / "index" / "impact_stats.sqlite"
+# 표본이 적은 칸은 profile 전체 평균 쪽으로 당겨(shrinkage) 과대 추정을 막는다.
+PRIOR_WEIGHT = 20.0
+MIN_ARTICLES = 3
+
+
+def issue_keys(score_result: Dict[str, Any]) -> List[str]:
+    profile = profile_key(score_result)
+    keys = set()
+    for item in score_result.get("details", []):
+        bucket = score_bucket(float(item.get("score", 0)), float(item.get("weight", 0)))
+        for issue in item.get("issues", []):
+            keys.add(f"{profile}|{issue}|{bucket}")
+    return sorted(keys)
+
+
+def iter_results(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    for path in paths:
+        if path.suffix == ".jsonl":
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+            continue
+        yield from json.loads(path.read_text(encoding="utf-8")).get("results", [])
+
+
+def load_analytics(path: Path, rules: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    # GA/Search Console 내보내기 대용 CSV: url, impressions, clicks (같은 URL 변형은 합산한다).
+    metrics: Dict[str, Tuple[float, float]] = {}
+    with path.open(encoding="utf-8-sig", newline="") as handle:
+        for row in csv.DictReader(handle):
+            url = normalize(row.get("url") or "", rules)
+            impressions = float(row.get("impressions") or 0)
+            clicks = float(row.get("clicks") or 0)
+            previous = metrics.get(url, (0.0, 0.0))
+            metrics[url] = (previous[0] + impressions, previous[1] + clicks)
+    return metrics
+
+
+# URL별 기여분과 칸별 누적합(기사 수, 노출, 클릭)을 저장해 새 데이터만 반영(증분)한다.
+class ImpactStats:
+    def __init__(self, path: Path = DEFAULT_STATS_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS observations ("
+            "url TEXT PRIMARY KEY, profile TEXT, keys TEXT, impressions REAL, clicks REAL, updated_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sums (key TEXT PRIMARY KEY, articles REAL, impressions REAL, clicks REAL)"
+        )
+        self._conn.commit()
+
+    def _add(self, keys: Iterable[str], sign: float, impressions: float, clicks: float) -> None:
+        self._conn.executemany(
+            "INSERT INTO sums (key, articles, impressions, clicks) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET articles = articles + excluded.articles, "
+            "impressions = impressions + excluded.impressions, clicks = clicks + excluded.clicks",
+            [(key, sign, sign * impressions, sign * clicks) for key in keys],
+        )
+
+    def update(self, url: str, profile: str, keys: List[str], impressions: float, clicks: float) -> bool:
+        encoded = json.dumps(keys)
+        row = self._conn.execute(
+            "SELECT profile, keys, impressions, clicks FROM observations WHERE url = ?", (url,)
+        ).fetchone()
+        if row is not None:
+            if row == (profile, encoded, impressions, clicks):
+                return False
+            # 같은 URL의 이전 기여분을 빼고 새 값으로 바꾼다.
+            self._add([row[0]] + json.loads(row[1]), -1.0, row[2], row[3])
+        self._add([profile] + keys, 1.0, impressions, clicks)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO observations (url, profile, keys, impressions, clicks, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, profile, encoded, impressions, clicks, time.time()),
+        )
+        return True
+
+    def sums(self) -> Dict[str, Tuple[float, float, float]]:
+        rows = self._conn.execute("SELECT key, articles, impressions, clicks FROM sums WHERE articles > 0")
+        return {key: (articles, impressions, clicks) for key, articles, impressions, clicks in rows}
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def ingest(
+    stats: ImpactStats,
+    results: Iterable[Dict[str, Any]],
+    analytics: Dict[str, Tuple[float, float]],
+    rules: Dict[str, Any],
+) -> int:
+    changed = 0
+    for result in results:
+        score = result.get("score") or {}
+        if score.get("error") or not score.get("details"):
+            continue
+        url = normalize(result.get("canonical_url") or result.get("url") or "", rules)
+        if url not in analytics:
+            continue
+        impressions, clicks = analytics[url]
+        if impressions <= 0:
+            continue
+        changed += stats.update(url, profile_key(score), issue_keys(score), impressions, clicks)
+    stats.commit()
+    return changed
+
+
+def _ctr(impressions: float, clicks: float) -> float:
+    return clicks / impressions if impressions > 0 else 0.0
+
+
+def compile_table(sums: Dict[str, Tuple[float, float, float]]) -> Dict[str, Any]:
+    # 이슈가 있는 기사와 같은 profile의 이슈 없는 기사의 CTR 차이를 개선 여지로 본다.
+    issue_totals: Dict[Tuple[str, str], List[float]] = {}
+    for key, (articles, impressions, clicks) in sums.items():
+        if key.count("|") != 2:
+            continue
+        profile, issue, _ = key.split("|")
+        total = issue_totals.setdefault((profile, issue), [0.0, 0.0, 0.0])
+        total[0] += articles
+        total[1] += impressions
+        total[2] += clicks
+
+    entries: Dict[str, List[float]] = {}
+    for key, (articles, impressions, clicks) in sums.items():
+        if key.count("|") != 2 or articles < MIN_ARTICLES:
+            continue
+        profile, issue, _ = key.split("|")
+        base = sums.get(profile)
+        if base is None:
+            continue
+        with_issue = issue_totals[(profile, issue)]
+        without = (base[0] - with_issue[0], base[1] - with_issue[1], base[2] - with_issue[2])
+        if without[0] < MIN_ARTICLES:
+            continue
+        uplift = max(0.0, _ctr(without[1], without[2]) - _ctr(impressions, clicks))
+        uplift *= articles / (articles + PRIOR_WEIGHT)
+        # [CTR 개선 %p, 노출 1천 회당 추가 클릭, 근거 기사 수]
+        entries[key] = [round(uplift * 100, 3), round(uplift * 1000, 2), int(articles)]
+
+    # 버킷이 없는 칸은 같은 profile/이슈 중 근거가 가장 많은 값으로 대신한다.
+    for key, entry in list(entries.items()):
+        profile, issue, _ = key.split("|")
+        fallback = f"{profile}|{issue}|*"
+        if fallback not in entries or entries[fallback][2] < entry[2]:
+            entries[fallback] = entry
+    return {
+        "version": 1,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "metric": "ctr",
+        "entries": dict(sorted(entries.items())),
+    }
+
+
+def write_table(table: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(".tmp")
+    temp.write_text(json.dumps(table, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    # 서빙 중인 프로세스가 반쯤 쓰인 파일을 읽지 않도록 교체는 원자적으로 한다.
+    temp.replace(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fit recommendation impact tables from stored results and an analytics CSV export."
+    )
+    parser.add_argument("--results", nargs="+", required=True, help="batch_report .json or .jsonl result files.")
+    parser.add_argument("--analytics", required=True, help="CSV with url, impressions, clicks columns.")
+    parser.add_argument("--stats", default=str(DEFAULT_STATS_PATH), help="Incremental sufficient statistics.")
+    parser.add_argument("--output", default=str(DEFAULT_TABLE_PATH), help="Compiled impact table path.")
+    args = parser.parse_args()
+
+    rules = load_rules()
+    stats = ImpactStats(Path(args.stats))
+    changed = ingest(
+        stats, iter_results(Path(path) for path in args.results), load_analytics(Path(args.analytics), rules), rules
+    )
+    table = compile_table(stats.sums())
+    stats.close()
+    write_table(table, Path(args.output))
+    print(f"Updated {changed} articles; wrote {len(table['entries'])} impact entries to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import heapq
+import json
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urldefrag
+
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parents[1] / "data" / "index" / "link_graph"
+# 변경분이 전체 간선의 이 비율을 넘으면 CSR 배열을 다시 만든다.
+COMPACT_RATIO = 0.5
+
+
+def normalize_url(url: str) -> str:
+    url = (url or "").strip()
+    return urldefrag(url)[0] if "#" in url else url
+
+
+# URL마다 정수 ID를 붙이고 나가는 링크를 CSR(offsets/targets) 배열로 보관한다.
+# 새 배치는 _delta에 쌓였다가 compact()에서 CSR로 합쳐지고, 들어오는 링크 수는 즉시 갱신된다.
+class LinkGraph:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.urls: List[str] = []
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        self.inlinks = array("I")
+        self.crawled = bytearray()
+        self.edge_count = 0
+        self._delta: Dict[int, array] = {}
+        self._delta_edges = 0
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def node_id(self, url: str) -> int:
+        node = self.ids.get(url)
+        if node is None:
+            node = self.ids[url] = len(self.urls)
+            self.urls.append(url)
+            self.inlinks.append(0)
+            self.crawled.append(0)
+        return node
+
+    def outlinks(self, node: int) -> array:
+        if node in self._delta:
+            return self._delta[node]
+        if node + 1 < len(self.offsets):
+            return self.targets[self.offsets[node]:self.offsets[node + 1]]
+        return array("I")
+
+    def add_page(self, url: str, targets: Iterable[str]) -> None:
+        node = self.node_id(normalize_url(url))
+        new = array("I")
+        seen = set()
+        for target in targets:
+            target_id = self.node_id(normalize_url(target))
+            if target_id != node and target_id not in seen:
+                seen.add(target_id)
+                new.append(target_id)
+
+        previous = self.outlinks(node)
+        for target_id in previous:
+            self.inlinks[target_id] -= 1
+        for target_id in new:
+            self.inlinks[target_id] += 1
+        if node in self._delta:
+            self._delta_edges -= len(self._delta[node])
+        self.edge_count += len(new) - len(previous)
+        self._delta[node] = new
+        self._delta_edges += len(new)
+        self.crawled[node] = 1
+
+        if self._delta_edges > max(1024, len(self.targets) * COMPACT_RATIO):
+            self.compact()
+
+    def add_results(self, results: Iterable[Dict[str, Any]]) -> int:
+        added = 0
+        for result in results:
+            article = result.get("article", result)
+            if article.get("error") or not article.get("url"):
+                continue
+            self.add_page(article["url"], article.get("internal_targets") or [])
+            added += 1
+        return added
+
+    def compact(self) -> None:
+        if not self._delta:
+            return
+        old_offsets, old_targets = self.offsets, self.targets
+        old_nodes = len(old_offsets) - 1
+        offsets = array("I", [0])
+        targets = array("I")
+        cursor = 0
+        for node in sorted(self._delta) + [len(self.urls)]:
+            # 바뀌지 않은 노드 구간은 기존 배열에서 한 번에 복사한다.
+            end = max(cursor, min(node, old_nodes))
+            if end > cursor:
+                shift = len(targets) - old_offsets[cursor]
+                targets.extend(old_targets[old_offsets[cursor]:old_offsets[end]])
+                offsets.extend(value + shift for value in old_offsets[cursor + 1:end + 1])
+            offsets.extend([len(targets)] * (node - end))
+            if node < len(self.urls):
+                targets.extend(self._delta[node])
+                offsets.append(len(targets))
+            cursor = node + 1
+        self.offsets, self.targets = offsets, targets
+        self._delta = {}
+        self._delta_edges = 0
+
+    def inlink_count(self, url: str) -> Optional[int]:
+        node = self.ids.get(normalize_url(url))
+        return None if node is None else self.inlinks[node]
+
+    def is_orphan(self, url: str) -> bool:
+        node = self.ids.get(normalize_url(url))
+        return node is not None and bool(self.crawled[node]) and self.inlinks[node] == 0
+
+    def orphans(self) -> List[str]:
+        return [self.urls[node] for node, flag in enumerate(self.crawled) if flag and not self.inlinks[node]]
+
+    def most_linked(self, limit: int = 20) -> List[Tuple[str, int]]:
+        top = heapq.nlargest(limit, range(len(self.urls)), key=self.inlinks.__getitem__)
+        return [(self.urls[node], self.inlinks[node]) for node in top]
+
+    def hubs(self, limit: int = 20) -> List[Tuple[str, int]]:
+        # 크롤링된 기사 중 다른 기사로 내보내는 내부 링크가 많은 허브 페이지.
+        crawled = (node for node, flag in enumerate(self.crawled) if flag)
+        top = heapq.nlargest(limit, ((len(self.outlinks(node)), node) for node in crawled))
+        return [(self.urls[node], degree) for degree, node in top]
+
+    def save(self, index_dir: Path) -> None:
+        self.compact()
+        index_dir.mkdir(parents=True, exist_ok=True)
+        (index_dir / "nodes.txt").write_text("\n".join(self.urls), encoding="utf-8")
+        for name in ("offsets", "targets", "inlinks"):
+            with (index_dir / f"{name}.bin").open("wb") as handle:
+                getattr(self, name).tofile(handle)
+        (index_dir / "crawled.bin").write_bytes(bytes(self.crawled))
+        meta = {"nodes": len(self.urls), "edges": len(self.targets), "itemsize": self.targets.itemsize}
+        (index_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "LinkGraph":
+        graph = cls()
+        meta_path = index_dir / "meta.json"
+        if not meta_path.exists():
+            return graph
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        text = (index_dir / "nodes.txt").read_text(encoding="utf-8")
+        graph.urls = text.split("\n") if meta["nodes"] else []
+        graph.ids = {url: node for node, url in enumerate(graph.urls)}
+        sizes = {"offsets": meta["nodes"] + 1, "targets": meta["edges"], "inlinks": meta["nodes"]}
+        for name, size in sizes.items():
+            values = array("I")
+            with (index_dir / f"{name}.bin").open("rb") as handle:
+                values.fromfile(handle, size)
+            setattr(graph, name, values)
+        graph.crawled = bytearray((index_dir / "crawled.bin").read_bytes())
+        graph.edge_count = meta["edges"]
+        return graph
+
+
+@lru_cache(maxsize=2)
+def get_link_graph(index_dir: str) -> LinkGraph:
+    return LinkGraph.load(Path(index_dir))
+
+
+def attach_inlinks(article: Any, graph: LinkGraph) -> None:
+    # 그래프에 없는 URL은 None으로 두어 고아 여부를 판단하지 않는다.
+    article["inlinks"] = graph.inlink_count(article.get("url") or "")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or update the internal link graph from batch reports.")
+    parser.add_argument("--reports", nargs="*", default=[], help="batch_report json files to add.")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX_DIR), help="Link graph index directory.")
+    parser.add_argument("--url", default="", help="Print inlink count and orphan status for this URL.")
+    parser.add_argument("--orphans", action="store_true", help="Print crawled articles with no inlinks.")
+    parser.add_argument("--hubs", type=int, default=0, help="Print the N articles with the most internal outlinks.")
+    parser.add_argument("--most-linked", type=int, default=0, help="Print the N most linked-to URLs.")
+    args = parser.parse_args()
+
+    index_dir = Path(args.index)
+    graph = LinkGraph.load(index_dir)
+    added = 0
+    for report_path in args.reports:
+        report = json.loads(Path(report_path).read_text(encoding="utf-8"))
+        added += graph.add_results(report.get("results", []))
+    if added:
+        graph.save(index_dir)
+    print(f"Link graph: {len(graph)} nodes, {graph.edge_count} edges ({added} pages added)")
+
+    if args.url:
+        print(f"{args.url}: inlinks={graph.inlink_count(args.url)} orphan={graph.is_orphan(args.url)}")
+    if args.orphans:
+        for url in graph.orphans():
+            print(f"orphan  {url}")
+    for url, degree in graph.hubs(args.hubs) if args.hubs else []:
+        print(f"hub     {degree:>6}  {url}")
+    for url, count in graph.most_linked(args.most_linked) if args.most_linked else []:
+        print(f"linked  {count:>6}  {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,216 @@
 ﻿import argparse
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from src.crawler import fetch_article
-from src.recommender import recommend_fixes
-from src.scorer import score_article
+from src.crawler import article_from_page, fetch_page
+from src.image_probe import DEFAULT_CACHE_PATH, attach_probes, get_prober
+from src.link_graph import attach_inlinks, get_link_graph
+from src.metrics import StageTimer, record, stage, timings_enabled
+from src.profiling import add_profile_arguments, profiling
+from src.records import ArticleRecord
+from src.recommender import get_impact_table, recommend_fixes
+from src.rubric_router import get_router, is_routes_config
+from src.scorer import (
+    error_score,
+    iter_criterion_scores,
+    prepare_article,
+    summarize_scores,
+)
 
+RUBRIC_PATH = Path(__file__).resolve().parents[1] / "configs" / "rubric.v1.json"
 
-def run(url: str) -> dict:
-    rubric_path = Path(__file__).resolve().parents[1] / "configs" / "rubric.v1.json"
-    rubric = json.loads(rubric_path.read_text(encoding="utf-8"))
 
-    article = fetch_article(url)
-    score_result = score_article(article, rubric)
-    recommendations = recommend_fixes(score_result)
+@lru_cache(maxsize=8)
+def load_rubric(path: Path = RUBRIC_PATH) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
 
-    return {
+
+def select_rubric(
+    rubric_path: Path, url: str, profile: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    # --rubric에 라우팅 설정을 주면 URL 섹션과 감지된 profile로 루브릭을 고른다.
+    config = load_rubric(rubric_path)
+    if not is_routes_config(config):
+        return config, None
+    return get_router(Path(rubric_path)).select(url, profile)
+
+
+def iter_analysis(
+    url: str,
+    timings: Optional[bool] = None,
+    profiler: Any = None,
+    prober: Any = None,
+    rubric_path: Path = RUBRIC_PATH,
+    link_graph: Any = None,
+    impact_table: Optional[Dict[str, List[float]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    timed = timings_enabled() if timings is None else timings
+    timer = StageTimer(profiler) if (timed or profiler is not None) else None
+
+    page = fetch_page(url, timer)
+    yield {
+        "event": "fetch",
+        "url": page["url"],
+        "status_code": page["status_code"],
+        "bytes": page["bytes"],
+        "error": page["error"],
+    }
+
+    with stage(timer, "parse"):
+        article = ArticleRecord.from_dict(article_from_page(url, page))
+    if prober is not None and not article.get("error"):
+        with stage(timer, "images"):
+            attach_probes(article, prober)
+    if link_graph is not None and not article.get("error"):
+        attach_inlinks(article, link_graph)
+    yield {
+        "event": "article",
+        "article": {key: article[key] for key in article.keys() if key != "content"},
+    }
+
+    with stage(timer, "score"):
+        prepared = prepare_article(article)
+        rubric, routing = select_rubric(rubric_path, article.get("url") or url, prepared.profile)
+    if prepared.get("error"):
+        score_result = error_score(prepared["error"], rubric)
+    else:
+        details = []
+        criteria = iter_criterion_scores(prepared, rubric)
+        while True:
+            # 스트림 소비자의 처리 시간이 섞이지 않도록 항목 계산 구간만 잰다.
+            with stage(timer, "score"):
+                item = next(criteria, None)
+            if item is None:
+                break
+            details.append(item)
+            yield {"event": "criterion", "criterion": item}
+        with stage(timer, "score"):
+            score_result = summarize_scores(details, rubric, prepared.profile)
+    if routing is not None:
+        score_result["routing"] = routing
+    yield {"event": "score", "score": score_result}
+
+    with stage(timer, "recommend"):
+        recommendations = recommend_fixes(score_result, impact_table=impact_table)
+    yield {"event": "recommendations", "recommendations": recommendations}
+
+    result = {
         "url": url,
-        "article": article,
+        "article": article.to_dict(),
         "score": score_result,
         "recommendations": recommendations,
     }
+    if timed and timer is not None:
+        record(timer)
+        result["timings"] = timer.as_dict()
+    yield {"event": "result", "result": result}
+
+
+def analyze_article(
+    article: Dict[str, Any],
+    rubric_path: Path = RUBRIC_PATH,
+    impact_table: Optional[Dict[str, List[float]]] = None,
+) -> Dict[str, Any]:
+    record = ArticleRecord.from_dict(article)
+    prepared = prepare_article(record)
+    rubric, routing = select_rubric(rubric_path, record.get("url", ""), prepared.profile)
+    if prepared.get("error"):
+        score_result = error_score(prepared["error"], rubric)
+    else:
+        score_result = summarize_scores(list(iter_criterion_scores(prepared, rubric)), rubric, prepared.profile)
+    if routing is not None:
+        score_result["routing"] = routing
+    return {
+        "url": record.get("url", ""),
+        "article": record.to_dict(),
+        "score": score_result,
+        "recommendations": recommend_fixes(score_result, impact_table=impact_table),
+    }
+
+
+def run(
+    url: str,
+    timings: Optional[bool] = None,
+    profiler: Any = None,
+    prober: Any = None,
+    rubric_path: Path = RUBRIC_PATH,
+    link_graph: Any = None,
+    impact_table: Optional[Dict[str, List[float]]] = None,
+) -> dict:
+    result: Dict[str, Any] = {}
+    for event in iter_analysis(url, timings, profiler, prober, rubric_path, link_graph, impact_table):
+        if event["event"] == "result":
+            result = event["result"]
+    return result
+
+
+def add_analysis_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rubric", default=str(RUBRIC_PATH), help="Rubric json to score with.")
+    parser.add_argument(
+        "--probe-images",
+        action="store_true",
+        help="Probe article images (HEAD/ranged GET) for bytes and format before scoring.",
+    )
+    parser.add_argument(
+        "--image-cache",
+        default=str(DEFAULT_CACHE_PATH),
+        help="SQLite cache of image probe results shared across runs.",
+    )
+    parser.add_argument(
+        "--link-graph",
+        default="",
+        help="Link graph index directory; adds inlink counts so orphan articles are flagged.",
+    )
+    parser.add_argument(
+        "--impact-table",
+        default="",
+        help="Compiled impact table json (src.impact_model); annotates and ranks recommendations by expected gain.",
+    )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Analyze one article URL and print SEO report.")
     parser.add_argument("--url", default="https://example.com/article", help="Article URL")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Attach per-stage timings and byte counts under the 'timings' key.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print one NDJSON event per completed stage instead of the final report.",
+    )
+    parser.add_argument(
+        "--article-json",
+        default="",
+        help="Score an already-fetched article dict from this JSON file ('-' for stdin) without fetching.",
+    )
+    add_analysis_arguments(parser)
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    rubric_path = Path(args.rubric)
+    prober = get_prober(Path(args.image_cache)) if args.probe_images else None
+    link_graph = get_link_graph(args.link_graph) if args.link_graph else None
+    impact_table = get_impact_table(Path(args.impact_table)) if args.impact_table else None
 
-    result = run(args.url)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    with profiling(args.profile, Path(args.profile_dir), args.profile_top) as profiler:
+        if args.article_json:
+            if args.article_json == "-":
+                source = sys.stdin.read()
+            else:
+                source = Path(args.article_json).read_text(encoding="utf-8")
+            result = analyze_article(json.loads(source), rubric_path, impact_table)
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        elif args.stream:
+            events = iter_analysis(
+                args.url, args.timings or None, profiler, prober, rubric_path, link_graph, impact_table
+            )
+            for event in events:
+                print(json.dumps(event, ensure_ascii=False), flush=True)
+        else:
+            result = run(args.url, args.timings or None, profiler, prober, rubric_path, link_graph, impact_table)
+            print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Deque, Dict, Iterator, List, Optional
+
+STAGES = ("dns_probe", "throttle", "ttfb", "download", "parse", "images", "score", "recommend", "total")
+QUANTILES = (0.5, 0.95, 0.99)
+# 요청 경로 밖에서 따로 재는 구간. 단계 값으로는 보고하지만 total에는 넣지 않는다.
+PROBE_STAGES = frozenset({"dns_probe"})
+# 분위수는 최근 표본 창에서 계산한다. sum/count는 프로세스 전체 누적값이다.
+SAMPLE_WINDOW = 4096
+
+_NULL_STAGE = nullcontext()
+_LOCK = threading.Lock()
+_SAMPLES: Dict[str, Deque[float]] = {}
+_SUMS: Dict[str, float] = {}
+_COUNTS: Dict[str, int] = {}
+_BYTES = {"total": 0}
+
+
+def timings_enabled() -> bool:
+    return os.environ.get("TENASIA_TIMINGS", "").lower() in ("1", "true", "yes")
+
+
+class StageTimer:
+    __slots__ = ("seconds", "bytes", "profiler")
+
+    def __init__(self, profiler: Any = None) -> None:
+        self.seconds: Dict[str, float] = {}
+        self.bytes = 0
+        self.profiler = profiler
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        profiled = self.profiler.stage(name) if self.profiler is not None else _NULL_STAGE
+        started = time.perf_counter()
+        try:
+            with profiled:
+                yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def total(self) -> float:
+        return sum(value for name, value in self.seconds.items() if name not in PROBE_STAGES)
+
+    def as_dict(self) -> Dict[str, Any]:
+        timings: Dict[str, Any] = {
+            f"{name}_ms": round(value * 1000, 3) for name, value in self.seconds.items()
+        }
+        timings["total_ms"] = round(self.total() * 1000, 3)
+        timings["bytes"] = self.bytes
+        return timings
+
+
+def stage(timer: Optional[StageTimer], name: str) -> ContextManager[None]:
+    if timer is None:
+        return _NULL_STAGE
+    return timer.stage(name)
+
+
+def observe(name: str, seconds: float) -> None:
+    with _LOCK:
+        samples = _SAMPLES.get(name)
+        if samples is None:
+            samples = _SAMPLES[name] = deque(maxlen=SAMPLE_WINDOW)
+        samples.append(seconds)
+        _SUMS[name] = _SUMS.get(name, 0.0) + seconds
+        _COUNTS[name] = _COUNTS.get(name, 0) + 1
+
+
+def record(timer: StageTimer) -> None:
+    for name, seconds in timer.seconds.items():
+        observe(name, seconds)
+    observe("total", timer.total())
+    with _LOCK:
+        _BYTES["total"] += timer.bytes
+
+
+def reset() -> None:
+    with _LOCK:
+        _SAMPLES.clear()
+        _SUMS.clear()
+        _COUNTS.clear()
+        _BYTES["total"] = 0
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def stage_quantiles() -> Dict[str, Dict[str, float]]:
+    with _LOCK:
+        snapshot = {name: sorted(samples) for name, samples in _SAMPLES.items()}
+    return {
+        name: {f"p{int(q * 100)}": _quantile(ordered, q) for q in QUANTILES}
+        for name, ordered in snapshot.items()
+    }
+
+
+def render_prometheus() -> str:
+    with _LOCK:
+        snapshot = {name: sorted(samples) for name, samples in _SAMPLES.items()}
+        sums = dict(_SUMS)
+        counts = dict(_COUNTS)
+        fetched_bytes = _BYTES["total"]
+
+    order = [name for name in STAGES if name in snapshot]
+    order += sorted(name for name in snapshot if name not in STAGES)
+
+    lines = [
+        "# HELP tenasia_stage_seconds Per-stage analysis latency in seconds.",
+        "# TYPE tenasia_stage_seconds summary",
+    ]
+    for name in order:
+        for q in QUANTILES:
+            value = _quantile(snapshot[name], q)
+            lines.append(f'tenasia_stage_seconds{{stage="{name}",quantile="{q}"}} {value:.6f}')
+        lines.append(f'tenasia_stage_seconds_sum{{stage="{name}"}} {sums[name]:.6f}')
+        lines.append(f'tenasia_stage_seconds_count{{stage="{name}"}} {counts[name]}')
+    lines += [
+        "# HELP tenasia_fetched_bytes_total Response bytes downloaded by instrumented runs.",
+        "# TYPE tenasia_fetched_bytes_total counter",
+        f"tenasia_fetched_bytes_total {fetched_bytes}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_prometheus(), encoding="utf-8")
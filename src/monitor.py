@@ -0,0 +1,152 @@
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+MONITOR_WORKERS = 4
+DEFAULT_REFRESH_INTERVAL = 60.0
+MIN_REFRESH_INTERVAL = 10.0
+# 아무 화면도 보지 않는 URL은 이 시간이 지나면 감시 목록에서 뺀다.
+IDLE_TTL = 600.0
+
+
+def _summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    score = result.get("score") or {}
+    article = result.get("article") or {}
+    return {
+        "title": article.get("title", ""),
+        "total_score": float(score.get("total_score", 0)),
+        "grade": score.get("grade", "-"),
+        "issues": sorted({issue for item in score.get("details", []) for issue in item.get("issues", [])}),
+        "error": score.get("error") or article.get("error") or result.get("error") or "",
+    }
+
+
+def diff_summaries(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> List[str]:
+    if old is None:
+        return []
+    changes = [key for key in ("title", "total_score", "grade", "error") if old.get(key) != new.get(key)]
+    if old.get("issues") != new.get("issues"):
+        changes.append("issues")
+    return changes
+
+
+# 여러 편집자 화면이 공유하는 감시 목록. URL마다 자기 주기로 백그라운드에서 한 번만 다시 분석하고,
+# 화면은 snapshot()으로 최신 결과만 읽어 네트워크를 기다리지 않는다.
+class WatchlistMonitor:
+    def __init__(
+        self,
+        analyze: Callable[[str], Dict[str, Any]],
+        workers: int = MONITOR_WORKERS,
+        idle_ttl: float = IDLE_TTL,
+    ) -> None:
+        self.analyze = analyze
+        self.idle_ttl = idle_ttl
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="watchlist")
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._in_flight: set = set()
+        self._dispatcher = threading.Thread(target=self._dispatch, name="watchlist-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def watch(self, urls: Iterable[str], interval: float = DEFAULT_REFRESH_INTERVAL) -> None:
+        interval = max(MIN_REFRESH_INTERVAL, interval)
+        now = time.monotonic()
+        with self._lock:
+            for url in urls:
+                entry = self._entries.get(url)
+                if entry is None:
+                    self._entries[url] = {
+                        "url": url,
+                        "interval": interval,
+                        "status": "pending",
+                        "summary": None,
+                        "result": None,
+                        "changes": [],
+                        "previous_score": None,
+                        "changed_at": None,
+                        "refreshed_at": None,
+                        "viewed": now,
+                        "due": now,
+                        "version": 0,
+                    }
+                    heapq.heappush(self._heap, (now, url))
+                else:
+                    # 같은 URL을 여러 화면이 감시하면 가장 짧은 주기를 따른다.
+                    entry["viewed"] = now
+                    if interval < entry["interval"]:
+                        entry["due"] = max(now, entry["due"] - entry["interval"] + interval)
+                        entry["interval"] = interval
+                        heapq.heappush(self._heap, (entry["due"], url))
+            self._wake.notify()
+
+    def snapshot(self, urls: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            keys = list(self._entries) if urls is None else [url for url in urls if url in self._entries]
+            rows = []
+            for url in keys:
+                entry = self._entries[url]
+                entry["viewed"] = now
+                rows.append({key: value for key, value in entry.items() if key not in ("viewed", "due")})
+        return rows
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                if not self._heap:
+                    self._wake.wait(1.0)
+                    continue
+                due, url = self._heap[0]
+                if due > now:
+                    self._wake.wait(min(due - now, 1.0))
+                    continue
+                heapq.heappop(self._heap)
+                entry = self._entries.get(url)
+                # 감시 해제 후 다시 등록된 URL의 오래된 항목은 버린다.
+                if entry is None or entry["due"] != due or url in self._in_flight:
+                    continue
+                if now - entry["viewed"] > self.idle_ttl:
+                    del self._entries[url]
+                    continue
+                self._in_flight.add(url)
+                self._executor.submit(self._refresh, url)
+
+    def _refresh(self, url: str) -> None:
+        try:
+            result = self.analyze(url)
+        except Exception as exc:  # 한 URL의 실패가 풀 전체를 멈추지 않게 한다.
+            result = {"url": url, "error": str(exc)}
+        summary = _summary(result)
+        with self._lock:
+            self._in_flight.discard(url)
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            changes = diff_summaries(entry["summary"], summary)
+            if changes:
+                entry["changed_at"] = time.time()
+                entry["previous_score"] = entry["summary"]["total_score"]
+            entry.update(
+                summary=summary,
+                result=result,
+                changes=changes,
+                status="error" if summary["error"] else "ok",
+                refreshed_at=time.time(),
+                version=entry["version"] + 1,
+            )
+            entry["due"] = time.monotonic() + entry["interval"]
+            heapq.heappush(self._heap, (entry["due"], url))
+            self._wake.notify()
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._lock:
+            self._wake.notify()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
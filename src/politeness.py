@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from src.crawler import DEFAULT_HEADERS, get_session
+from src.metrics import stage
+
+if TYPE_CHECKING:
+    import requests
+
+    from src.metrics import StageTimer
+
+HOST_RATE = 4.0
+HOST_BURST = 8
+MIN_HOST_RATE = 0.1
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+# Retry-After가 이보다 길면 기다리지 않고 실패로 돌려 다음 스케줄에 맡긴다.
+MAX_RETRY_AFTER = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+ROBOTS_TTL = 24 * 3600
+ROBOTS_ERROR_TTL = 600
+ROBOTS_TIMEOUT = 10
+
+
+class FetchBlocked(Exception):
+    pass
+
+
+def retry_after_seconds(value: str, now: Optional[float] = None) -> Optional[float]:
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        target = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, target - (time.time() if now is None else now))
+
+
+def backoff_delay(attempt: int) -> float:
+    # full jitter: 여러 워커가 같은 호스트에 동시에 재시도하지 않게 한다.
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        # 토큰을 먼저 차감하고 기다려야 할 시간을 돌려줘 잠금을 잡은 채 잠들지 않는다.
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def slow_down(self) -> None:
+        # 429를 받으면 해당 호스트 속도를 절반으로 줄인다.
+        with self._lock:
+            if self.rate > 0:
+                self.rate = max(MIN_HOST_RATE, self.rate / 2)
+                self.burst = max(1.0, min(self.burst, self.rate * 2))
+                self.tokens = min(self.tokens, self.burst)
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.failures < self.threshold:
+                return True
+            # 쿨다운이 지나면 요청 하나만 흘려 보내 호스트가 회복했는지 본다(half-open).
+            if self._probing or time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._probing = False
+            if ok:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: float) -> None:
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker()
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_expires = 0.0
+        self.robots_lock = threading.Lock()
+
+
+# 호스트별 요청 속도, 재시도, 서킷 브레이커, robots.txt 캐시를 한곳에서 관리한다.
+class FetchController:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        rate: float = HOST_RATE,
+        burst: float = HOST_BURST,
+        max_retries: int = MAX_RETRIES,
+        respect_robots: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.session = session
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.respect_robots = respect_robots
+        self.sleep = sleep
+        self.user_agent = DEFAULT_HEADERS["User-Agent"]
+        self._hosts: Dict[str, _HostState] = {}
+        self._rates: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        return self.session if self.session is not None else get_session()
+
+    def set_host_rate(self, host: str, rate: float, burst: Optional[float] = None) -> None:
+        # rate가 0이면 해당 호스트는 속도 제한을 두지 않는다(replay 벤치마크 등).
+        with self._lock:
+            self._rates[host] = (rate, burst if burst is not None else max(1.0, rate * 2))
+            self._hosts.pop(host, None)
+
+    def _host(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            with self._lock:
+                state = self._hosts.get(host)
+                if state is None:
+                    rate, burst = self._rates.get(host, (self.rate, self.burst))
+                    state = self._hosts[host] = _HostState(rate, burst)
+        return state
+
+    def robots(self, origin: str) -> RobotFileParser:
+        state = self._host(urlparse(origin).netloc)
+        with state.robots_lock:
+            if state.robots is not None and time.monotonic() < state.robots_expires:
+                return state.robots
+            import requests
+
+            parser = RobotFileParser(origin + "/robots.txt")
+            ttl = ROBOTS_TTL
+            try:
+                response = self._session().get(parser.url, timeout=ROBOTS_TIMEOUT)
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.status_code >= 500:
+                    # 일시적인 서버 오류는 막힌 것으로 보지 않되 짧게만 캐시한다.
+                    parser.allow_all = True
+                    ttl = ROBOTS_ERROR_TTL
+                elif response.status_code >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse(response.text.splitlines())
+            except requests.RequestException:
+                parser.allow_all = True
+                ttl = ROBOTS_ERROR_TTL
+            delay = parser.crawl_delay(self.user_agent)
+            if delay and state.bucket.rate > 0:
+                state.bucket.rate = min(state.bucket.rate, 1.0 / float(delay))
+                state.bucket.burst = 1
+                state.bucket.tokens = min(state.bucket.tokens, 1)
+            state.robots = parser
+            state.robots_expires = time.monotonic() + ttl
+            return parser
+
+    def get(
+        self, url: str, timeout: float = 15, timer: Optional[StageTimer] = None, **kwargs
+    ) -> requests.Response:
+        import requests
+
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        state = self._host(parsed.netloc)
+        # robots.txt 조회와 속도 제한/재시도 대기는 ttfb가 아니라 throttle 구간으로 잰다.
+        with stage(timer, "throttle"):
+            if self.respect_robots and not self.robots(origin).can_fetch(self.user_agent, url):
+                raise FetchBlocked(f"blocked by robots.txt: {url}")
+
+        attempt = 0
+        while True:
+            if not state.breaker.allow():
+                raise FetchBlocked(f"circuit open for {parsed.netloc}")
+            wait = state.bucket.reserve()
+            if wait:
+                with stage(timer, "throttle"):
+                    self.sleep(wait)
+            retry_after: Optional[float] = None
+            try:
+                with stage(timer, "ttfb"):
+                    response = self._session().get(url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                state.breaker.record(False)
+                if attempt >= self.max_retries:
+                    raise
+            except requests.RequestException:
+                # 재시도하지 않는 오류도 기록해야 half-open 시험 요청 상태가 풀린다.
+                state.breaker.record(False)
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    # 4xx는 요청 문제이므로 호스트 장애로 세지 않는다.
+                    state.breaker.record(True)
+                    return response
+                state.breaker.record(False)
+                if response.status_code == 429:
+                    state.bucket.slow_down()
+                retry_after = retry_after_seconds(response.headers.get("Retry-After", ""))
+                if attempt >= self.max_retries or (retry_after or 0) > MAX_RETRY_AFTER:
+                    return response
+                response.close()
+            with stage(timer, "throttle"):
+                self.sleep(retry_after if retry_after is not None else backoff_delay(attempt))
+            attempt += 1
+
+
+_CONTROLLER: Optional[FetchController] = None
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def get_controller() -> FetchController:
+    global _CONTROLLER
+    if _CONTROLLER is None:
+        with _CONTROLLER_LOCK:
+            if _CONTROLLER is None:
+                _CONTROLLER = FetchController()
+    return _CONTROLLER
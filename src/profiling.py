@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+# cProfile/pstats는 프로파일을 켰을 때만 불러와 CLI 시작 비용을 줄인다.
+if TYPE_CHECKING:
+    import cProfile
+
+# 세부 계측 구간을 프로파일 단계로 묶는다.
+STAGE_GROUPS = {"throttle": "fetch", "ttfb": "fetch", "download": "fetch"}
+PROFILE_MODES = ("cprofile", "sampling")
+MAX_STACK_DEPTH = 64
+
+FuncKey = Tuple[str, int, str]
+
+
+def _frame_label(filename: str, lineno: int, name: str) -> str:
+    module = Path(filename).stem if filename not in ("~", "") else "builtins"
+    return f"{module}:{name}:{lineno}" if lineno else f"{module}:{name}"
+
+
+def _func_label(func: FuncKey) -> str:
+    return _frame_label(*func)
+
+
+class StageProfiler:
+    mode = "cprofile"
+
+    def __init__(self) -> None:
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self._active: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        group = STAGE_GROUPS.get(name, name)
+        if self._active is not None:
+            yield
+            return
+        profile = self.profiles.get(group)
+        if profile is None:
+            import cProfile
+
+            profile = self.profiles[group] = cProfile.Profile()
+        self._active = group
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._active = None
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def _collapse(self, stage: str, stats: Dict[FuncKey, Any]) -> Counter:
+        children: Dict[FuncKey, Dict[FuncKey, float]] = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, {})[func] = edge[3]
+        roots = [func for func, value in stats.items() if not any(c in stats for c in value[4])]
+
+        collapsed: Counter = Counter()
+
+        def walk(func: FuncKey, budget: float, path: List[str]) -> None:
+            _, _, tottime, cumtime, _ = stats[func]
+            share = budget / cumtime if cumtime else 0.0
+            path = path + [_func_label(func)]
+            own = int(tottime * share * 1_000_000)
+            if own:
+                collapsed[";".join(path)] += own
+            if len(path) >= MAX_STACK_DEPTH:
+                return
+            for child, edge_time in children.get(func, {}).items():
+                label = _func_label(child)
+                child_budget = edge_time * share
+                if label in path or child_budget < 1e-6:
+                    continue
+                walk(child, child_budget, path)
+
+        for root in roots:
+            walk(root, stats[root][3], [stage])
+        return collapsed
+
+    def write(self, out_dir: Path) -> List[Path]:
+        import pstats
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+        collapsed: Counter = Counter()
+        for stage, profile in self.profiles.items():
+            path = out_dir / f"{stage}.pstats"
+            profile.dump_stats(str(path))
+            written.append(path)
+            collapsed.update(self._collapse(stage, pstats.Stats(profile).stats))
+        written.append(_write_collapsed(out_dir / "collapsed.txt", collapsed))
+        return written
+
+    def top(self, limit: int) -> List[Tuple[str, str, int, float, float]]:
+        import pstats
+
+        rows = []
+        for stage, profile in self.profiles.items():
+            for func, (_, calls, tottime, cumtime, _) in pstats.Stats(profile).stats.items():
+                rows.append((stage, _func_label(func), calls, tottime, cumtime))
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:limit]
+
+
+class SamplingProfiler:
+    mode = "sampling"
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stage = "other"
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        previous = self._stage
+        self._stage = STAGE_GROUPS.get(name, name)
+        try:
+            yield
+        finally:
+            self._stage = previous
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack: List[str] = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                stack.append(self._stage)
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name="stage-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def write(self, out_dir: Path) -> List[Path]:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        return [_write_collapsed(out_dir / "collapsed.txt", self.samples)]
+
+    def top(self, limit: int) -> List[Tuple[str, str, int, float, float]]:
+        own: Counter = Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(";")
+            own[(frames[0], frames[-1])] += count
+        return [
+            (stage, label, count, count * self.interval, 0.0)
+            for (stage, label), count in own.most_common(limit)
+        ]
+
+
+def _write_collapsed(path: Path, collapsed: Counter) -> Path:
+    lines = [f"{stack} {count}" for stack, count in sorted(collapsed.items()) if count > 0]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    return path
+
+
+def create_profiler(mode: str) -> Any:
+    if mode == "sampling":
+        return SamplingProfiler()
+    return StageProfiler()
+
+
+def format_top(profiler: Any, limit: int = 20) -> str:
+    header = f"{'stage':<10} {'calls':>8} {'self s':>9} {'cum s':>9}  function"
+    if profiler.mode == "sampling":
+        header = f"{'stage':<10} {'samples':>8} {'~self s':>9} {'':>9}  function"
+    lines = [header]
+    for stage, label, calls, tottime, cumtime in profiler.top(limit):
+        cum = f"{cumtime:>9.4f}" if profiler.mode != "sampling" else f"{'':>9}"
+        lines.append(f"{stage:<10} {calls:>8} {tottime:>9.4f} {cum}  {label}")
+    return "\n".join(lines)
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILE_MODES,
+        help="Profile per stage: 'cprofile' (deterministic, default) or 'sampling' for long runs.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="data/reports/profile",
+        help="Directory for pstats files and collapsed stacks (flamegraph input).",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of hot functions to print after the run.",
+    )
+
+
+@contextmanager
+def profiling(mode: Optional[str], out_dir: Path, limit: int = 20) -> Iterator[Optional[Any]]:
+    if not mode:
+        yield None
+        return
+    profiler = create_profiler(mode)
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        written = profiler.write(out_dir)
+        print(f"Profile ({profiler.mode}, {time.perf_counter() - started:.1f}s) written to {out_dir}:")
+        for path in written:
+            print(f"  {path}")
+        print(format_top(profiler, limit))
@@ -1,5 +1,14 @@
-from typing import Any, Dict, List, Tuple
-
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+IMPACT_TABLE_PATH = Path(__file__).resolve().parents[1] / "data" / "index" / "impact_table.json"
+# 노출 1천 회당 클릭이 이만큼 늘어나는 이슈는 감점 폭이 두 배인 이슈와 같은 순위로 본다.
+IMPACT_REFERENCE_CLICKS = 10.0
+IMPACT_RECHECK_SECONDS = 30.0
+BUCKETS = 4
 
 BASE_MESSAGES = {
     "title_missing": "제목이 없습니다. 핵심 인물과 사건이 보이도록 제목을 작성하세요.",
@@ -19,7 +28,17 @@ BASE_MESSAGES = {
     "content_missing_event": "본문의 사건 정보가 약합니다. 무엇이 있었는지 명확히 적으세요.",
     "content_missing_time_context": "본문의 시점 맥락이 약합니다. 날짜나 시점을 보강하세요.",
     "internal_links_insufficient": "내부 링크가 부족합니다. 관련 기사 링크를 추가하세요.",
+    "orphan_article": "이 기사로 들어오는 내부 링크가 없습니다. 관련 기사나 섹션 페이지에서 링크하세요.",
     "images_missing_alt": "이미지 alt가 누락되었습니다. 이미지 설명을 alt에 입력하세요.",
+    "images_oversized": "이미지 용량이 큽니다. 본문 폭에 맞게 리사이즈하고 압축하세요.",
+    "images_legacy_format": "JPEG/PNG 이미지가 있습니다. WebP나 AVIF로 변환해 용량을 줄이세요.",
+    "images_not_lazy": "첫 이미지 이후 이미지에 지연 로딩이 없습니다. loading=\"lazy\"를 추가하세요.",
+    "news_article_schema_missing": "NewsArticle JSON-LD가 없습니다. 구글 뉴스 노출을 위해 구조화 데이터를 추가하세요.",
+    "news_article_type_generic": "JSON-LD 타입이 일반 Article입니다. NewsArticle로 지정하세요.",
+    "news_article_fields_missing": "NewsArticle에 headline, datePublished, author, image 중 빠진 필드가 있습니다.",
+    "json_ld_invalid": "JSON-LD 블록을 해석할 수 없습니다. 문법 오류를 수정하세요.",
+    "open_graph_incomplete": "OpenGraph 태그(og:title, og:description, og:image)가 부족합니다.",
+    "twitter_card_missing": "twitter:card 메타 태그를 추가하면 공유 미리보기가 안정적입니다.",
     "sentences_too_short": "문장이 지나치게 짧습니다. 의미 단위로 묶어 흐름을 보강하세요.",
     "sentences_too_long": "문장이 깁니다. 핵심 문장과 보조 문장으로 분리하세요.",
     "sentence_length_not_ideal": "문장 길이 균형을 맞추면 읽기 흐름이 좋아집니다.",
@@ -40,6 +59,10 @@ BASE_EXAMPLES = {
     "content_missing_event": "수정 예시: 발표, 공개, 출연 같은 핵심 사건 문장을 명시",
     "content_missing_time_context": "수정 예시: 오늘, 지난, 방송일 같은 시점 문구 추가",
     "internal_links_insufficient": "수정 예시: 관련 기사 1~2건 내부 링크 삽입",
+    "orphan_article": "수정 예시: 같은 인물의 이전 기사 하단 관련 기사 목록에 추가",
+    "news_article_fields_missing": "수정 예시: \"datePublished\": \"2024-03-05T09:00:00+09:00\", \"author\": {\"name\": \"기자명\"}",
+    "images_oversized": "수정 예시: 가로 1200px 이하, 200KB 이하로 저장",
+    "images_not_lazy": "수정 예시: <img src=\"...\" loading=\"lazy\" alt=\"...\">",
 }
 
 ENTERTAINMENT_EXAMPLES = {
@@ -49,6 +72,46 @@ ENTERTAINMENT_EXAMPLES = {
 }
 
 
+_IMPACT: Dict[str, Dict[str, Any]] = {}
+_IMPACT_LOCK = threading.Lock()
+
+
+def get_impact_table(path: Path = IMPACT_TABLE_PATH) -> Optional[Dict[str, List[float]]]:
+    # src.impact_model이 미리 컴파일한 표를 한 번 읽어 두고, 파일이 바뀌었는지는 가끔만 확인한다.
+    # recommend_fixes는 표를 직접 읽지 않으므로 호출하는 쪽이 이 값을 넘겨야 영향도가 붙는다.
+    now = time.monotonic()
+    with _IMPACT_LOCK:
+        cached = _IMPACT.setdefault(str(path), {"entries": None, "mtime": None, "checked": None})
+        if cached["checked"] is not None and now - cached["checked"] < IMPACT_RECHECK_SECONDS:
+            return cached["entries"]
+        cached["checked"] = now
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            cached["entries"] = cached["mtime"] = None
+            return None
+        if mtime != cached["mtime"]:
+            try:
+                cached["entries"] = json.loads(path.read_text(encoding="utf-8")).get("entries") or None
+            except ValueError:
+                cached["entries"] = None
+            cached["mtime"] = mtime
+        return cached["entries"]
+
+
+def _impact(
+    table: Optional[Dict[str, List[float]]], profile: str, issue: str, bucket: int
+) -> Optional[List[float]]:
+    if not table:
+        return None
+    return table.get(f"{profile}|{issue}|{bucket}") or table.get(f"{profile}|{issue}|*")
+
+
+def _impact_text(entry: List[float]) -> str:
+    ctr_points, clicks_per_1k, articles = entry
+    return f"예상 영향: CTR +{ctr_points:.2f}%p (노출 1,000회당 클릭 +{clicks_per_1k:.1f}, 근거 기사 {int(articles)}건)"
+
+
 def _priority(item: Dict[str, Any]) -> float:
     return float(item.get("weight", 0)) - float(item.get("score", 0))
 
@@ -69,29 +132,56 @@ def _example(issue: str, domain: str) -> str:
     return BASE_EXAMPLES.get(issue, "")
 
 
-def _collect_issue_actions(details: List[Dict[str, Any]], domain: str) -> List[Tuple[float, str]]:
-    actions: List[Tuple[float, str]] = []
+def profile_key(score_result: Dict[str, Any]) -> str:
+    profile = score_result.get("profile") or {}
+    return f"{profile.get('domain', 'general_news')}/{profile.get('format', 'standard')}"
+
+
+def score_bucket(score: float, weight: float) -> int:
+    # 항목 점수 비율을 BUCKETS 구간으로 나눈 값. 영향도 표의 키로 쓴다.
+    if weight <= 0:
+        return 0
+    return min(BUCKETS - 1, max(0, int(score / weight * BUCKETS)))
+
+
+def _collect_issue_actions(
+    details: List[Dict[str, Any]],
+    domain: str,
+    profile: str = "",
+    table: Optional[Dict[str, List[float]]] = None,
+) -> List[Tuple[Tuple[float, float], str]]:
+    actions: List[Tuple[Tuple[float, float], str]] = []
     for item in details:
         gap = _priority(item)
         if gap <= 0:
             continue
+        bucket = score_bucket(float(item.get("score", 0)), float(item.get("weight", 0)))
         for issue in item.get("issues", []):
             msg = _message(issue, domain)
             if not msg:
                 continue
             ex = _example(issue, domain)
             full = f"{msg}\n{ex}" if ex else msg
-            actions.append((gap, full))
+            # 감점 폭에 기대 클릭 증가량을 가중해 한 척도로 정렬한다. 영향이 0이거나 표에 없으면 감점 폭 그대로다.
+            entry = _impact(table, profile, issue, bucket)
+            if entry is not None and round(float(entry[0]), 2) > 0:
+                full = f"{full}\n{_impact_text(entry)}"
+            uplift = max(0.0, float(entry[1])) if entry is not None else 0.0
+            actions.append(((gap * (1 + uplift / IMPACT_REFERENCE_CLICKS), gap), full))
     return actions
 
 
-def recommend_fixes(score_result: Dict[str, Any], max_items: int = 8) -> List[str]:
+def recommend_fixes(
+    score_result: Dict[str, Any],
+    max_items: int = 8,
+    impact_table: Optional[Dict[str, List[float]]] = None,
+) -> List[str]:
     if score_result.get("error"):
         return ["크롤링 오류를 먼저 해결하세요. URL 접근 가능 여부와 응답 상태 코드를 확인하세요."]
 
     domain = _profile_domain(score_result)
     details = score_result.get("details", [])
-    actions = _collect_issue_actions(details, domain)
+    actions = _collect_issue_actions(details, domain, profile_key(score_result), impact_table)
     actions.sort(key=lambda pair: pair[0], reverse=True)
 
     deduped: List[str] = []
@@ -0,0 +1,94 @@
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+ARTICLE_FIELDS = (
+    "url",
+    "title",
+    "meta_description",
+    "h1",
+    "h2_count",
+    "content",
+    "paragraph_count",
+    "word_count",
+    "image_count",
+    "images_missing_alt",
+    "images",
+    "internal_links",
+    "external_links",
+    "internal_targets",
+    "inlinks",
+    "canonical_url",
+    "structured_data",
+    "error",
+    "status_code",
+    "encoding",
+    "encoding_source",
+)
+
+
+# crawler 결과 dict와 같은 키를 갖는 고정 슬롯 레코드. scorer는 복사 없이 `.get()`으로 읽는다.
+class ArticleRecord:
+    __slots__ = ARTICLE_FIELDS + ("extra",)
+
+    def __init__(self, **fields: Any) -> None:
+        for name in ARTICLE_FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        self.extra: Optional[Dict[str, Any]] = fields or None
+
+    @classmethod
+    def from_dict(cls, article: Mapping[str, Any]) -> "ArticleRecord":
+        return cls(**article)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ARTICLE_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in ARTICLE_FIELDS and getattr(self, key) is not None:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in ARTICLE_FIELDS:
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(str(key)) is not None
+
+    def keys(self) -> Iterator[str]:
+        for name in ARTICLE_FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+        if self.extra is not None:
+            yield from self.extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self.keys()}
+
+
+# 원본 article을 복사하지 않고 감지된 profile만 덧붙여 보여준다.
+class ScoringView:
+    __slots__ = ("article", "profile")
+
+    def __init__(self, article: Any, profile: Dict[str, Any]) -> None:
+        self.article = article
+        self.profile = profile
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "_profile":
+            return self.profile
+        return self.article.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "_profile":
+            return self.profile
+        return self.article[key]
@@ -0,0 +1,261 @@
+import argparse
+import base64
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.impact_model import iter_results
+from src.recommender import profile_key
+
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[1] / "data" / "index" / "reports.sqlite"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+BUILTIN_SORTS = {"total_score": "r.total_score", "url": "r.url"}
+_CRITERION_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, title TEXT, total_score REAL, grade TEXT, "
+    "profile TEXT, summary TEXT)",
+    "CREATE INDEX IF NOT EXISTS results_score ON results (total_score)",
+    "CREATE INDEX IF NOT EXISTS results_grade ON results (grade, total_score)",
+    "CREATE INDEX IF NOT EXISTS results_profile ON results (profile, total_score)",
+    "CREATE TABLE IF NOT EXISTS criterion_scores ("
+    "criterion TEXT, score REAL, result_id INTEGER, PRIMARY KEY (criterion, score, result_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS criterion_scores_result ON criterion_scores (result_id)",
+    "CREATE TABLE IF NOT EXISTS issues ("
+    "issue TEXT, result_id INTEGER, PRIMARY KEY (issue, result_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS issues_result ON issues (result_id)",
+)
+
+
+def summarize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    # 목록 화면용 요약. 본문/HTML/이미지 목록은 싣지 않는다.
+    score = result.get("score") or {}
+    article = result.get("article") or {}
+    details = score.get("details", [])
+    return {
+        "url": result.get("url") or article.get("url", ""),
+        "title": article.get("title") or "",
+        "total_score": float(score.get("total_score", 0)),
+        "grade": score.get("grade", "F"),
+        "profile": profile_key(score),
+        "scores": {item["id"]: item.get("score", 0) for item in details},
+        "issues": sorted({issue for item in details for issue in item.get("issues", [])}),
+        "error": score.get("error") or article.get("error") or result.get("error") or "",
+    }
+
+
+def encode_cursor(value: Any, row_id: int) -> str:
+    raw = json.dumps([value, row_id], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        row_id = int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    # 정렬 키는 SQLite에 그대로 바인딩되므로 스칼라 값만 받는다.
+    if value is not None and not isinstance(value, (str, int, float)):
+        raise ValueError("invalid cursor")
+    return value, row_id
+
+
+# 저장된 배치 결과의 조회용 인덱스. 정렬 키 + id로 이어 읽는 keyset 페이지네이션이라
+# 몇 번째 페이지든 인덱스를 한 번 타고 limit 행만 읽는다.
+class ReportIndex:
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def add(self, results: Iterable[Dict[str, Any]]) -> int:
+        added = 0
+        with self._lock:
+            for result in results:
+                summary = summarize_result(result)
+                if not summary["url"]:
+                    continue
+                # 같은 URL은 최신 결과로 바꾼다.
+                row = self._conn.execute("SELECT id FROM results WHERE url = ?", (summary["url"],)).fetchone()
+                values = (
+                    summary["title"],
+                    summary["total_score"],
+                    summary["grade"],
+                    summary["profile"],
+                    json.dumps(summary, ensure_ascii=False, separators=(",", ":")),
+                )
+                if row is None:
+                    row_id = self._conn.execute(
+                        "INSERT INTO results (url, title, total_score, grade, profile, summary) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (summary["url"], *values),
+                    ).lastrowid
+                else:
+                    row_id = row[0]
+                    self._conn.execute(
+                        "UPDATE results SET title = ?, total_score = ?, grade = ?, profile = ?, summary = ? "
+                        "WHERE id = ?",
+                        (*values, row_id),
+                    )
+                    self._conn.execute("DELETE FROM criterion_scores WHERE result_id = ?", (row_id,))
+                    self._conn.execute("DELETE FROM issues WHERE result_id = ?", (row_id,))
+                self._conn.executemany(
+                    "INSERT INTO criterion_scores (criterion, score, result_id) VALUES (?, ?, ?)",
+                    [(key, float(score), row_id) for key, score in summary["scores"].items()],
+                )
+                self._conn.executemany(
+                    "INSERT INTO issues (issue, result_id) VALUES (?, ?)",
+                    [(issue, row_id) for issue in summary["issues"]],
+                )
+                added += 1
+            self._conn.commit()
+        return added
+
+    def query(
+        self,
+        grades: Optional[List[str]] = None,
+        profile: str = "",
+        issues: Optional[List[str]] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        url_prefix: str = "",
+        sort: str = "total_score",
+        descending: bool = True,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str = "",
+    ) -> Dict[str, Any]:
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        joins, tiebreak = "", "r.id"
+        where: List[str] = []
+        params: List[Any] = []
+        if sort in BUILTIN_SORTS:
+            key = BUILTIN_SORTS[sort]
+        elif _CRITERION_RE.match(sort):
+            # 항목 점수 정렬은 (criterion, score, result_id) 기본 키를 그대로 따라 읽는다.
+            joins = " JOIN criterion_scores c ON c.result_id = r.id AND c.criterion = ?"
+            params.append(sort)
+            key, tiebreak = "c.score", "c.result_id"
+        else:
+            raise ValueError(f"unknown sort: {sort}")
+
+        if grades:
+            where.append(f"r.grade IN ({','.join('?' * len(grades))})")
+            params.extend(grades)
+        if profile:
+            where.append("r.profile = ?")
+            params.append(profile)
+        for issue in issues or []:
+            where.append("r.id IN (SELECT result_id FROM issues WHERE issue = ?)")
+            params.append(issue)
+        if min_score is not None:
+            where.append("r.total_score >= ?")
+            params.append(float(min_score))
+        if max_score is not None:
+            where.append("r.total_score <= ?")
+            params.append(float(max_score))
+        if url_prefix:
+            where.append("r.url >= ? AND r.url < ?")
+            params.extend([url_prefix, url_prefix + "\U0010ffff"])
+        if cursor:
+            value, row_id = decode_cursor(cursor)
+            where.append(f"({key}, {tiebreak}) {'<' if descending else '>'} (?, ?)")
+            params.extend([value, row_id])
+
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT r.id, {key}, r.summary FROM results r{joins}"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + f" ORDER BY {key} {direction}, {tiebreak} {direction} LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, [*params, limit + 1]).fetchall()
+        page = rows[:limit]
+        next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(rows) > limit else None
+        return {
+            "items": [json.loads(row[2]) for row in page],
+            "next_cursor": next_cursor,
+            "sort": sort,
+            "order": direction.lower(),
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_INDEXES: Dict[str, ReportIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_report_index(path: Path = DEFAULT_INDEX_PATH) -> ReportIndex:
+    key = str(path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = ReportIndex(path)
+    return index
+
+
+def query_from_params(index: ReportIndex, params: Dict[str, List[str]]) -> Dict[str, Any]:
+    # /api/results 쿼리스트링(parse_qs 결과)을 query() 인자로 바꾼다. 잘못된 값은 ValueError.
+    def first(name: str) -> str:
+        return (params.get(name) or [""])[0].strip()
+
+    grades = [grade for value in params.get("grade", []) for grade in value.split(",") if grade]
+    issues = [issue for value in params.get("issue", []) for issue in value.split(",") if issue]
+    order = first("order") or "desc"
+    if order not in ("asc", "desc"):
+        raise ValueError(f"unknown order: {order}")
+    return index.query(
+        grades=grades,
+        profile=first("profile"),
+        issues=issues,
+        min_score=float(first("min_score")) if first("min_score") else None,
+        max_score=float(first("max_score")) if first("max_score") else None,
+        url_prefix=first("url_prefix"),
+        sort=first("sort") or "total_score",
+        descending=order == "desc",
+        limit=int(first("limit") or DEFAULT_PAGE_SIZE),
+        cursor=first("cursor"),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index stored batch results for paginated queries.")
+    parser.add_argument("--reports", nargs="*", default=[], help="batch_report .json or .jsonl result files to add.")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX_PATH), help="Report index path.")
+    parser.add_argument("--grade", action="append", default=[], help="Print results with this grade.")
+    parser.add_argument("--issue", action="append", default=[], help="Print results with this issue id.")
+    parser.add_argument("--sort", default="total_score", help="total_score, url or a criterion id.")
+    parser.add_argument("--asc", action="store_true", help="Sort ascending.")
+    parser.add_argument("--limit", type=int, default=0, help="Print this many matching results.")
+    args = parser.parse_args()
+
+    index = ReportIndex(Path(args.index))
+    added = index.add(iter_results(Path(path) for path in args.reports))
+    print(f"Report index: {index.count()} results ({added} added or updated)")
+    if args.limit:
+        page = index.query(
+            grades=args.grade, issues=args.issue, sort=args.sort, descending=not args.asc, limit=args.limit
+        )
+        for item in page["items"]:
+            print(f"{item['total_score']:>6.1f} {item['grade']}  {item['url']}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
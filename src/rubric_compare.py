@@ -0,0 +1,234 @@
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.main import load_rubric
+from src.records import ArticleRecord
+from src.scorer import SCORERS, _criterion_rules, prepare_article, summarize_scores
+
+GRADES = ("A", "B", "C", "D", "F")
+SCORE_BUCKET = 10
+DELTA_PRECISION = 1
+
+RubricScore = Tuple[float, str, Dict[str, float]]
+
+_RUBRICS: List[Dict[str, Any]] = []
+
+
+def iter_archive(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    # .jsonl은 한 줄에 {"url", "html"} 원문 또는 article dict, .json은 batch_report 결과 파일이다.
+    for path in paths:
+        if path.suffix == ".jsonl":
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+            continue
+        report = json.loads(path.read_text(encoding="utf-8"))
+        for result in report.get("results", []):
+            article = result.get("article")
+            if article:
+                yield article
+
+
+def _init_worker(rubric_paths: List[str]) -> None:
+    global _RUBRICS
+    _RUBRICS = [load_rubric(Path(path)) for path in rubric_paths]
+
+
+def score_under_rubrics(item: Dict[str, Any]) -> Optional[Tuple[str, List[RubricScore]]]:
+    if "html" in item:
+        from src.crawler import parse_article_html
+
+        article: Any = parse_article_html(item.get("url", ""), item["html"])
+    else:
+        article = ArticleRecord.from_dict(item)
+    if article.get("error"):
+        return None
+
+    prepared = prepare_article(article)
+    shared: Dict[str, Dict[str, Any]] = {}
+    scores: List[RubricScore] = []
+    for rubric in _RUBRICS:
+        details = []
+        for criterion in rubric.get("criteria", []):
+            criterion_id = criterion.get("id")
+            weight = int(criterion.get("weight", 0))
+            scorer = SCORERS.get(criterion_id)
+            if not scorer or weight <= 0:
+                continue
+            rules = _criterion_rules(criterion, rubric, prepared.profile)
+            # 루브릭 간 동일한 항목(가중치·규칙 포함)은 한 번만 계산한다.
+            key = json.dumps([criterion_id, weight, rules], sort_keys=True)
+            if key not in shared:
+                shared[key] = scorer(prepared, weight, rules)
+            details.append(shared[key])
+        summary = summarize_scores(details, rubric, prepared.profile)
+        scores.append(
+            (summary["total_score"], summary["grade"], {d["id"]: float(d["score"]) for d in details})
+        )
+    return str(article.get("url") or ""), scores
+
+
+def _quantiles(histogram: Counter, points: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[str, float]:
+    total = sum(histogram.values())
+    if not total:
+        return {}
+    ordered = sorted(histogram.items())
+    result: Dict[str, float] = {}
+    for point in points:
+        target = point * (total - 1)
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if seen > target:
+                result[f"p{int(point * 100)}"] = value
+                break
+    return result
+
+
+class RubricComparison:
+    def __init__(self, names: List[str], top: int = 20) -> None:
+        self.names = names
+        self.top = top
+        self.count = 0
+        self.skipped = 0
+        pairs = len(names) - 1
+        self.grade_matrix: List[Counter] = [Counter() for _ in range(pairs)]
+        self.score_matrix: List[Counter] = [Counter() for _ in range(pairs)]
+        self.total_delta_sum = [0.0] * pairs
+        self.criterion_deltas: List[Dict[str, Counter]] = [{} for _ in range(pairs)]
+        self.movers: List[List[Tuple[float, str, float, float]]] = [[] for _ in range(pairs)]
+
+    def add(self, scored: Optional[Tuple[str, List[RubricScore]]]) -> None:
+        if scored is None:
+            self.skipped += 1
+            return
+        url, scores = scored
+        self.count += 1
+        base_total, base_grade, base_criteria = scores[0]
+        for pair, (total, grade, criteria) in enumerate(scores[1:]):
+            self.grade_matrix[pair][(base_grade, grade)] += 1
+            self.score_matrix[pair][
+                (int(base_total // SCORE_BUCKET) * SCORE_BUCKET, int(total // SCORE_BUCKET) * SCORE_BUCKET)
+            ] += 1
+            delta = total - base_total
+            self.total_delta_sum[pair] += delta
+            for criterion_id in set(base_criteria) | set(criteria):
+                change = criteria.get(criterion_id, 0.0) - base_criteria.get(criterion_id, 0.0)
+                histogram = self.criterion_deltas[pair].setdefault(criterion_id, Counter())
+                histogram[round(change, DELTA_PRECISION)] += 1
+            entry = (abs(delta), url, base_total, total)
+            if len(self.movers[pair]) < self.top:
+                heapq.heappush(self.movers[pair], entry)
+            elif entry > self.movers[pair][0]:
+                heapq.heapreplace(self.movers[pair], entry)
+
+    def report(self) -> Dict[str, Any]:
+        comparisons = []
+        for pair, name in enumerate(self.names[1:]):
+            grade_matrix = {
+                base: {other: self.grade_matrix[pair][(base, other)] for other in GRADES} for base in GRADES
+            }
+            buckets = sorted({key for keys in self.score_matrix[pair] for key in keys})
+            comparisons.append(
+                {
+                    "baseline": self.names[0],
+                    "candidate": name,
+                    "mean_total_delta": round(self.total_delta_sum[pair] / self.count, 3) if self.count else 0.0,
+                    "grade_transitions": grade_matrix,
+                    "score_transitions": {
+                        str(base): {str(other): self.score_matrix[pair][(base, other)] for other in buckets}
+                        for base in buckets
+                    },
+                    "criterion_deltas": {
+                        criterion_id: {
+                            "mean": round(
+                                sum(value * count for value, count in histogram.items()) / self.count, 3
+                            ),
+                            "changed": sum(count for value, count in histogram.items() if value),
+                            **_quantiles(histogram),
+                        }
+                        for criterion_id, histogram in sorted(self.criterion_deltas[pair].items())
+                    },
+                    "top_movers": [
+                        {"url": url, "baseline": base, "candidate": total, "delta": round(total - base, 2)}
+                        for _, url, base, total in sorted(self.movers[pair], reverse=True)
+                    ],
+                }
+            )
+        return {"articles": self.count, "skipped": self.skipped, "comparisons": comparisons}
+
+
+def compare_rubrics(
+    items: Iterable[Dict[str, Any]],
+    rubric_paths: List[str],
+    workers: int = 1,
+    top: int = 20,
+    chunksize: int = 64,
+) -> Dict[str, Any]:
+    comparison = RubricComparison([Path(path).name for path in rubric_paths], top)
+    if workers <= 1:
+        _init_worker(rubric_paths)
+        for item in items:
+            comparison.add(score_under_rubrics(item))
+        return comparison.report()
+
+    with multiprocessing.get_context().Pool(workers, _init_worker, (rubric_paths,)) as pool:
+        for scored in pool.imap_unordered(score_under_rubrics, items, chunksize):
+            comparison.add(scored)
+    return comparison.report()
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    print(f"Articles: {report['articles']} (skipped {report['skipped']})")
+    for item in report["comparisons"]:
+        print(f"\n{item['baseline']} -> {item['candidate']}: mean delta {item['mean_total_delta']:+.2f}")
+        print("grade  " + " ".join(f"{grade:>6}" for grade in GRADES))
+        for base, row in item["grade_transitions"].items():
+            print(f"{base:<6} " + " ".join(f"{row[grade]:>6}" for grade in GRADES))
+        for criterion_id, stats in item["criterion_deltas"].items():
+            print(f"  {criterion_id:<18} mean {stats['mean']:+.2f}  changed {stats['changed']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score archived articles under several rubrics in one pass.")
+    parser.add_argument(
+        "--archive",
+        nargs="+",
+        required=True,
+        help="batch_report json files or .jsonl files of {url, html} / article dicts.",
+    )
+    parser.add_argument(
+        "--rubric",
+        action="append",
+        required=True,
+        help="Rubric json; repeat for each version. The first one is the baseline.",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--top", type=int, default=20, help="Top movers to keep per comparison.")
+    parser.add_argument(
+        "--output",
+        default="data/reports/rubric_compare.json",
+        help="Output path for comparison json.",
+    )
+    args = parser.parse_args()
+
+    if len(args.rubric) < 2:
+        parser.error("at least two --rubric files are required")
+
+    report = compare_rubrics(iter_archive(Path(path) for path in args.archive), args.rubric, args.workers, args.top)
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    _print_summary(report)
+    print(f"\nSaved comparison: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ROUTES_PATH = Path(__file__).resolve().parents[1] / "configs" / "rubric_routes.json"
+
+# (경로 깊이, 호스트 지정 여부, profile 조건 수, -설정 순서): 클수록 구체적인 규칙이다.
+Specificity = Tuple[int, int, int, int]
+
+
+class _Node:
+    __slots__ = ("children", "routes")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.routes: List[Dict[str, Any]] = []
+
+
+def _segments(path: str) -> List[str]:
+    return [segment for segment in path.lower().split("/") if segment]
+
+
+def is_routes_config(config: Dict[str, Any]) -> bool:
+    return "routes" in config and "criteria" not in config
+
+
+# 호스트별 경로 세그먼트 트라이. 규칙이 수백 개여도 조회는 경로 길이만큼만 내려간다.
+class RubricRouter:
+    def __init__(self, config: Dict[str, Any], base_dir: Path) -> None:
+        from src.main import load_rubric
+
+        self._hosts: Dict[str, _Node] = {}
+        self.rubrics: Dict[str, Dict[str, Any]] = {}
+        self.default = str(config.get("default", "rubric.v1.json"))
+        for order, route in enumerate(config.get("routes", [])):
+            host = str(route.get("host") or "*").lower()
+            node = self._hosts.setdefault(host, _Node())
+            for segment in _segments(str(route.get("path_prefix") or "")):
+                node = node.children.setdefault(segment, _Node())
+            node.routes.append(
+                {
+                    "name": str(route.get("name") or route["rubric"]),
+                    "rubric": str(route["rubric"]),
+                    "profile": dict(route.get("profile") or {}),
+                    "order": order,
+                    "host": host,
+                }
+            )
+        # 규칙이 가리키는 루브릭은 라우터를 만들 때 한 번만 읽어 둔다.
+        for name in {self.default, *(route["rubric"] for node in self._iter_nodes() for route in node.routes)}:
+            self.rubrics[name] = load_rubric(base_dir / name)
+
+    def _iter_nodes(self) -> List[_Node]:
+        nodes, stack = [], list(self._hosts.values())
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children.values())
+        return nodes
+
+    def route(self, url: str, profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        profile = profile or {}
+        segments = _segments(parts.path)
+        best: Optional[Tuple[Specificity, Dict[str, Any], str]] = None
+        for candidate_host in (host, "*") if host != "*" else ("*",):
+            node = self._hosts.get(candidate_host)
+            depth, prefix = 0, ""
+            while node is not None:
+                for route in node.routes:
+                    if any(profile.get(key) != value for key, value in route["profile"].items()):
+                        continue
+                    rank = (depth, int(candidate_host != "*"), len(route["profile"]), -route["order"])
+                    if best is None or rank > best[0]:
+                        best = (rank, route, prefix or "/")
+                if depth >= len(segments):
+                    break
+                prefix += "/" + segments[depth]
+                node = node.children.get(segments[depth])
+                depth += 1
+        if best is None:
+            return {"route": "default", "rubric": self.default, "host": host, "path_prefix": "", "profile": {}}
+        _, route, prefix = best
+        return {
+            "route": route["name"],
+            "rubric": route["rubric"],
+            "host": route["host"],
+            "path_prefix": prefix if best[0][0] else "",
+            "profile": route["profile"],
+        }
+
+    def select(self, url: str, profile: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        routing = self.route(url, profile)
+        return self.rubrics[routing["rubric"]], routing
+
+    def default_rubric(self) -> Dict[str, Any]:
+        return self.rubrics[self.default]
+
+
+@lru_cache(maxsize=4)
+def get_router(path: Path = ROUTES_PATH) -> RubricRouter:
+    config = json.loads(Path(path).read_text(encoding="utf-8"))
+    return RubricRouter(config, Path(path).parent)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show which rubric a URL is routed to.")
+    parser.add_argument("--routes", default=str(ROUTES_PATH), help="Rubric routes json.")
+    parser.add_argument("--url", action="append", required=True, help="URL to route.")
+    parser.add_argument("--domain", default="", help="Detected profile domain, e.g. entertainment_news.")
+    parser.add_argument("--format", default="", help="Detected profile format, e.g. short_form.")
+    args = parser.parse_args()
+
+    router = get_router(Path(args.routes))
+    profile = {key: value for key, value in (("domain", args.domain), ("format", args.format)) if value}
+    for url in args.url:
+        routing = router.route(url, profile)
+        print(f"{routing['route']:<16} {routing['rubric']:<24} {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import math
+import random
+import re
+import time
+from datetime import datetime, timezone
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.scheduler import published_at
+from src.scorer import prepare_article
+
+GRADES = ("A", "B", "C", "D", "F")
+AGE_BUCKETS = ((1, "1d"), (7, "7d"), (30, "30d"), (365, "1y"))
+GENERIC_SEGMENTS = {"article", "articles", "news", "view", "amp", "m", "www"}
+DEFAULT_SCORE_SD = 15.0
+MIN_PER_STRATUM = 2
+_URL_DATE_RE = re.compile(r"(?<!\d)(20\d{2})(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])")
+
+
+def section_of(url: str) -> str:
+    for segment in urlsplit(url).path.lower().split("/"):
+        if segment and segment not in GENERIC_SEGMENTS and not segment[0].isdigit():
+            return segment
+    return "other"
+
+
+def url_date(url: str) -> Optional[float]:
+    # 텐아시아형 기사 번호(2024010112345)처럼 경로에 들어 있는 날짜를 쓴다.
+    match = _URL_DATE_RE.search(urlsplit(url).path)
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    try:
+        return datetime(year, month, day, tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def age_bucket(published: Optional[float], now: float) -> str:
+    if published is None:
+        return "unknown"
+    days = (now - published) / 86400
+    for limit, label in AGE_BUCKETS:
+        if days < limit:
+            return label
+    return "older"
+
+
+def lastmod_timestamp(value: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() if value else None
+    except ValueError:
+        return None
+
+
+def known_articles(items: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    # 이전 보고서에 남아 있는 기사로 URL별 profile과 발행 시각을 미리 알아 둔다.
+    known: Dict[str, Dict[str, Any]] = {}
+    for article in items:
+        if article.get("error") or "html" in article:
+            continue
+        profile = prepare_article(article).profile
+        known[article.get("url", "")] = {
+            "profile": f"{profile['domain']}/{profile['format']}",
+            "published": published_at(article),
+        }
+    return known
+
+
+def build_strata(
+    urls: Iterable[str],
+    lastmods: Optional[Dict[str, str]] = None,
+    known: Optional[Dict[str, Dict[str, Any]]] = None,
+    now: Optional[float] = None,
+) -> Dict[str, List[str]]:
+    now = time.time() if now is None else now
+    lastmods = lastmods or {}
+    known = known or {}
+    strata: Dict[str, List[str]] = {}
+    for url in urls:
+        info = known.get(url, {})
+        published = info.get("published") or url_date(url) or lastmod_timestamp(lastmods.get(url, ""))
+        key = f"{section_of(url)}|{info.get('profile', 'unknown')}|{age_bucket(published, now)}"
+        strata.setdefault(key, []).append(url)
+    return strata
+
+
+def _variance(values: List[float], pooled: float) -> float:
+    # 표본이 1개뿐인 층은 전체 합동 분산으로 대신한다.
+    if len(values) < 2:
+        return pooled
+    mean = sum(values) / len(values)
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+
+
+# 층화 표본: 층마다 무작위 순서로 뽑고, 추정 분산을 가장 많이 줄이는 층에 다음 표본을 배정한다.
+class StratifiedSample:
+    def __init__(
+        self, strata: Dict[str, List[str]], seed: Optional[int] = None, confidence: float = 0.95
+    ) -> None:
+        rng = random.Random(seed)
+        self.population = {key: len(urls) for key, urls in strata.items() if urls}
+        self.total = sum(self.population.values())
+        self.remaining: Dict[str, List[str]] = {}
+        for key in self.population:
+            shuffled = list(strata[key])
+            rng.shuffle(shuffled)
+            self.remaining[key] = shuffled
+        self.scores: Dict[str, List[float]] = {key: [] for key in self.population}
+        self.grades: Dict[str, List[str]] = {key: [] for key in self.population}
+        self.issues: Dict[str, List[set]] = {key: [] for key in self.population}
+        self.errors = 0
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.confidence = confidence
+
+    @property
+    def sampled(self) -> int:
+        return sum(len(values) for values in self.scores.values())
+
+    def exhausted(self) -> bool:
+        return not any(self.remaining.values())
+
+    def _weight(self, key: str) -> float:
+        return self.population[key] / self.total
+
+    def _pooled_variance(self) -> float:
+        values = [score for scores in self.scores.values() for score in scores]
+        return _variance(values, DEFAULT_SCORE_SD ** 2) if len(values) >= 2 else DEFAULT_SCORE_SD ** 2
+
+    def next_batch(self, size: int) -> List[Tuple[str, str]]:
+        pooled = self._pooled_variance()
+        planned = {key: len(self.scores[key]) for key in self.population}
+        batch: List[Tuple[str, str]] = []
+        for _ in range(size):
+            best_key, best_gain = "", -1.0
+            for key, urls in self.remaining.items():
+                if not urls:
+                    continue
+                count = planned[key]
+                if count < MIN_PER_STRATUM:
+                    # 모든 층에 최소 표본을 먼저 채운다. 큰 층이 우선이다.
+                    gain = math.inf if count == 0 else 1e12 + self.population[key]
+                else:
+                    variance = _variance(self.scores[key], pooled)
+                    gain = self._weight(key) ** 2 * variance * (1 / count - 1 / (count + 1))
+                if gain > best_gain:
+                    best_key, best_gain = key, gain
+            if not best_key:
+                break
+            batch.append((best_key, self.remaining[best_key].pop()))
+            planned[best_key] += 1
+        return batch
+
+    def add(self, key: str, result: Dict[str, Any]) -> None:
+        score = result.get("score") or {}
+        if result.get("error") or score.get("error") or (result.get("article") or {}).get("error"):
+            # 가져오지 못한 기사는 무응답으로 보고 추정에서 뺀다.
+            self.errors += 1
+            return
+        self.scores[key].append(float(score.get("total_score", 0)))
+        self.grades[key].append(score.get("grade", "F"))
+        self.issues[key].append({issue for item in score.get("details", []) for issue in item.get("issues", [])})
+
+    def _estimate(
+        self,
+        per_stratum: Dict[str, List[float]],
+        stratum_variance: Callable[[List[float]], float],
+        bounds: Tuple[float, float],
+    ) -> Dict[str, Any]:
+        covered = [key for key, values in per_stratum.items() if values]
+        coverage = sum(self._weight(key) for key in covered)
+        if not coverage:
+            return {"estimate": None, "margin": None, "low": None, "high": None}
+        mean = variance = 0.0
+        for key in covered:
+            values = per_stratum[key]
+            # 아직 뽑히지 않은 층은 추정에서 빠지므로 표본이 있는 층의 가중치를 다시 정규화한다.
+            weight = self._weight(key) / coverage
+            count, size = len(values), self.population[key]
+            mean += weight * sum(values) / count
+            variance += weight ** 2 * (1 - count / size) * stratum_variance(values) / count
+        margin = self.z * math.sqrt(variance)
+        low, high = max(bounds[0], mean - margin), min(bounds[1], mean + margin)
+        return {"estimate": round(mean, 4), "margin": round(margin, 4), "low": round(low, 4), "high": round(high, 4)}
+
+    def _agresti_coull_variance(self, values: List[float]) -> float:
+        # 층 안의 표본이 모두 0이거나 1이어도 분산이 0이 되지 않도록 z²/2개씩 성공/실패를 더해 보정한다.
+        adjusted = (sum(values) + self.z ** 2 / 2) / (len(values) + self.z ** 2)
+        return adjusted * (1 - adjusted)
+
+    def _proportion(self, per_stratum: Dict[str, List[float]]) -> Dict[str, Any]:
+        return self._estimate(per_stratum, self._agresti_coull_variance, (0.0, 1.0))
+
+    def _score_estimate(self) -> Dict[str, Any]:
+        pooled = self._pooled_variance()
+        return self._estimate(self.scores, lambda values: _variance(values, pooled), (0.0, math.inf))
+
+    def score_margin(self) -> Optional[float]:
+        return self._score_estimate()["margin"]
+
+    def report(self) -> Dict[str, Any]:
+        seen_issues = sorted({issue for sets in self.issues.values() for issues in sets for issue in issues})
+        issues = {
+            issue: self._proportion({key: [float(issue in item) for item in sets] for key, sets in self.issues.items()})
+            for issue in seen_issues
+        }
+        return {
+            "population": self.total,
+            "sampled": self.sampled,
+            "errors": self.errors,
+            "confidence": self.confidence,
+            "strata": {
+                key: {"population": size, "sampled": len(self.scores[key])}
+                for key, size in sorted(self.population.items())
+            },
+            "mean_score": self._score_estimate(),
+            "grade_shares": {
+                grade: self._proportion(
+                    {key: [float(item == grade) for item in values] for key, values in self.grades.items()}
+                )
+                for grade in GRADES
+            },
+            "issue_prevalence": dict(
+                sorted(issues.items(), key=lambda item: item[1]["estimate"] or 0, reverse=True)
+            ),
+            # 표본에서 한 번도 보지 못한 이슈의 비율 상한.
+            "unseen_issue_upper": self._proportion(
+                {key: [0.0] * len(values) for key, values in self.scores.items()}
+            )["high"],
+        }
+
+
+def run_sample(
+    sample: StratifiedSample,
+    analyze: Callable[[str], Dict[str, Any]],
+    target_margin: float,
+    batch_size: int = 20,
+    max_sample: int = 0,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    while not sample.exhausted():
+        size = batch_size if not max_sample else min(batch_size, max_sample - len(results))
+        if size <= 0:
+            break
+        for key, url in sample.next_batch(size):
+            result = analyze(url)
+            result["stratum"] = key
+            sample.add(key, result)
+            results.append(result)
+        # 모든 층에 최소 표본이 찼고 평균 점수 구간이 목표 폭 이내면 멈춘다.
+        filled = all(
+            len(sample.scores[key]) >= min(MIN_PER_STRATUM, population) or not sample.remaining[key]
+            for key, population in sample.population.items()
+        )
+        margin = sample.score_margin()
+        if filled and margin is not None and margin <= target_margin:
+            break
+    return results
@@ -0,0 +1,279 @@
+import argparse
+import hashlib
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_STATE_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "recrawl.sqlite"
+DEFAULT_BUDGET_PER_MINUTE = 60
+MIN_INTERVAL = 5 * 60
+MAX_INTERVAL = 7 * 24 * 3600
+INITIAL_INTERVAL = 3600
+# 바뀐 기사는 간격을 줄이고, 그대로인 기사는 늘린다.
+SHRINK_ON_CHANGE = 0.5
+GROW_ON_STABLE = 1.5
+# 발행 직후 기사는 자주 고쳐지므로 나이에 따라 간격 상한을 둔다. (최대 나이 초, 간격 상한 초)
+AGE_CAPS = ((24 * 3600, 30 * 60), (7 * 24 * 3600, 6 * 3600))
+LOW_SCORE = 60.0
+LOW_SCORE_FACTOR = 0.7
+
+
+def content_hash(article: Dict[str, Any]) -> str:
+    digest = hashlib.sha1()
+    for key in ("title", "meta_description", "h1", "h2_count", "content", "image_count", "internal_links"):
+        digest.update(str(article.get(key, "")).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def published_at(article: Dict[str, Any]) -> Optional[float]:
+    value = (article.get("structured_data") or {}).get("date_published") or ""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() if value else None
+    except ValueError:
+        return None
+
+
+def next_interval(
+    interval: float, changed: bool, score: Optional[float], published: Optional[float], now: float
+) -> float:
+    interval *= SHRINK_ON_CHANGE if changed else GROW_ON_STABLE
+    if score is not None and score < LOW_SCORE:
+        interval *= LOW_SCORE_FACTOR
+    if published is not None:
+        age = now - published
+        for max_age, cap in AGE_CAPS:
+            if age < max_age:
+                interval = min(interval, cap)
+                break
+    return max(MIN_INTERVAL, min(MAX_INTERVAL, interval))
+
+
+class FetchBudget:
+    def __init__(self, per_minute: float) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, per_minute / 60.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop: threading.Event) -> bool:
+        # 분당 예산을 토큰 버킷으로 나눠 써서 요청이 한꺼번에 몰리지 않게 한다.
+        while not stop.is_set():
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            stop.wait(wait)
+        return False
+
+
+# URL별 재방문 상태(콘텐츠 해시, 변경 빈도, 최근 점수, 발행 시각)를 SQLite에 두고,
+# 다음 방문 시각 순 우선순위 큐로 fetch를 배분한다.
+class RecrawlScheduler:
+    def __init__(self, path: Path = DEFAULT_STATE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_state ("
+            "url TEXT PRIMARY KEY, content_hash TEXT, last_fetch REAL, next_due REAL, interval REAL, "
+            "checks INTEGER, changes INTEGER, last_score REAL, published REAL)"
+        )
+        self._conn.commit()
+        self._heap: List[Tuple[float, float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._in_flight: set = set()
+        for url, next_due, last_score in self._conn.execute("SELECT url, next_due, last_score FROM url_state"):
+            self._push(url, next_due, last_score)
+
+    def _push(self, url: str, next_due: float, score: Optional[float]) -> None:
+        # 같은 시각이면 점수가 낮은 기사부터 꺼낸다. 이전 항목은 꺼낼 때 버린다.
+        self._due[url] = next_due
+        heapq.heappush(self._heap, (next_due, score if score is not None else 0.0, url))
+
+    def add(self, urls: Iterable[str], now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        added = 0
+        with self._lock:
+            for url in urls:
+                if url in self._due or url in self._in_flight:
+                    continue
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO url_state (url, next_due, interval, checks, changes) "
+                    "VALUES (?, ?, ?, 0, 0)",
+                    (url, now, INITIAL_INTERVAL),
+                )
+                self._push(url, now, None)
+                added += 1
+            self._conn.commit()
+        return added
+
+    def __len__(self) -> int:
+        return len(self._due) + len(self._in_flight)
+
+    def pop_due(self, now: Optional[float] = None) -> Tuple[Optional[str], float]:
+        now = time.time() if now is None else now
+        with self._lock:
+            while self._heap:
+                next_due, _, url = self._heap[0]
+                if self._due.get(url) != next_due:
+                    heapq.heappop(self._heap)
+                    continue
+                if next_due > now:
+                    return None, next_due - now
+                heapq.heappop(self._heap)
+                del self._due[url]
+                self._in_flight.add(url)
+                return url, 0.0
+        return None, float("inf")
+
+    def add_back(self, url: str) -> None:
+        with self._lock:
+            self._in_flight.discard(url)
+            self._push(url, time.time(), None)
+
+    def record(self, url: str, result: Dict[str, Any], now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        article = result.get("article") or {}
+        failed = bool(result.get("error") or article.get("error"))
+        score = (result.get("score") or {}).get("total_score")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, interval, checks, changes, last_score, published FROM url_state WHERE url = ?",
+                (url,),
+            ).fetchone() or (None, INITIAL_INTERVAL, 0, 0, None, None)
+            old_hash, interval, checks, changes, last_score, published = row
+            if failed:
+                # 실패는 변경으로 보지 않고 간격만 유지해 다시 시도한다.
+                new_hash, changed, score = old_hash, False, last_score
+                interval = max(MIN_INTERVAL, interval)
+            else:
+                new_hash = content_hash(article)
+                changed = old_hash is not None and new_hash != old_hash
+                published = published_at(article) or published
+                interval = next_interval(interval, changed, score, published, now)
+                checks += 1
+                changes += int(changed)
+            next_due = now + interval
+            self._conn.execute(
+                "UPDATE url_state SET content_hash = ?, last_fetch = ?, next_due = ?, interval = ?, checks = ?, "
+                "changes = ?, last_score = ?, published = ? WHERE url = ?",
+                (new_hash, now, next_due, interval, checks, changes, score, published, url),
+            )
+            self._conn.commit()
+            self._in_flight.discard(url)
+            self._push(url, next_due, score)
+        return interval
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, checks, changes, avg_interval = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(checks), 0), COALESCE(SUM(changes), 0), AVG(interval) FROM url_state"
+            ).fetchone()
+        return {"urls": count, "checks": checks, "changes": changes, "avg_interval_s": round(avg_interval or 0, 1)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def run(
+        self,
+        analyze: Callable[[str], Dict[str, Any]],
+        budget: FetchBudget,
+        stop: threading.Event,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        workers: int = 1,
+        once: bool = False,
+    ) -> int:
+        processed = [0]
+
+        def loop() -> None:
+            while not stop.is_set():
+                url, wait = self.pop_due()
+                if url is None:
+                    if once:
+                        return
+                    stop.wait(min(wait, 5.0))
+                    continue
+                if not budget.acquire(stop):
+                    self.add_back(url)
+                    return
+                try:
+                    result = analyze(url)
+                except Exception as exc:  # 예외가 나도 실패로 기록해 URL이 다시 예약되게 한다.
+                    result = {"url": url, "error": f"{type(exc).__name__}: {exc}"}
+                self.record(url, result)
+                if on_result is not None:
+                    on_result(result)
+                with self._lock:
+                    processed[0] += 1
+
+        threads = [threading.Thread(target=loop, name=f"recrawl-{index}") for index in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return processed[0]
+
+
+def main() -> None:
+    from src.batch_report import load_urls
+    from src.main import run
+    from src.watch import install_stop_handlers
+
+    parser = argparse.ArgumentParser(description="Re-crawl articles adaptively under a global fetch budget.")
+    parser.add_argument("--url-file", default="", help="Add URLs from this text file to the schedule.")
+    parser.add_argument("--frontier", default="", help="Add all URLs from this discovery frontier.")
+    parser.add_argument("--state", default=str(DEFAULT_STATE_PATH), help="Scheduler state SQLite path.")
+    parser.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET_PER_MINUTE, help="Maximum fetches per minute."
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent fetches.")
+    parser.add_argument(
+        "--output", default="data/reports/recrawl_results.jsonl", help="Append results as JSON lines."
+    )
+    parser.add_argument("--once", action="store_true", help="Process URLs that are due now, then exit.")
+    args = parser.parse_args()
+
+    scheduler = RecrawlScheduler(Path(args.state))
+    if args.url_file:
+        scheduler.add(load_urls(Path(args.url_file)))
+    if args.frontier:
+        from src.discovery import Frontier
+
+        frontier = Frontier(Path(args.frontier))
+        scheduler.add(frontier.pending())
+        frontier.close()
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_lock = threading.Lock()
+    stop = threading.Event()
+    install_stop_handlers(stop)
+
+    with output_path.open("a", encoding="utf-8") as handle:
+
+        def on_result(result: Dict[str, Any]) -> None:
+            with write_lock:
+                handle.write(json.dumps(result, ensure_ascii=False) + "\n")
+                handle.flush()
+
+        print(f"Scheduling {len(scheduler)} urls at {args.budget:g} fetches/min", flush=True)
+        count = scheduler.run(run, FetchBudget(args.budget), stop, on_result, args.workers, args.once)
+    print(f"Fetched {count} urls; {scheduler.stats()}")
+    scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.records import ScoringView
+from src.structured_data import NEWS_TYPES
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -110,6 +113,18 @@ def _apply_profile_rules(
     return adjusted
 
 
+def _criterion_rules(
+    criterion: Dict[str, Any],
+    rubric: Dict[str, Any],
+    profile: Dict[str, Any],
+) -> Dict[str, Any]:
+    rules = criterion.get("rules", {})
+    # 섹션 루브릭처럼 기준값을 직접 정한 루브릭은 profile 보정을 덮어쓰지 않는다.
+    if not rubric.get("profile_rules", True):
+        return dict(rules)
+    return _apply_profile_rules(criterion.get("id"), rules, profile)
+
+
 def _content_signals(article: Dict[str, Any]) -> Dict[str, bool]:
     title = (article.get("title") or "").lower()
     content = (article.get("content") or "").lower()
@@ -321,13 +336,21 @@ def _score_links(article: Dict[str, Any], weight: int, rules: Dict[str, Any]) ->
     ):
         score -= weight * 0.5
         issues.append("external_links_missing")
+    metrics = {"internal_links": internal_links, "external_links": external_links}
+    # inlinks는 링크 그래프로 보강된 경우에만 있다. 없으면 고아 여부를 판단하지 않는다.
+    inlinks = article.get("inlinks")
+    if inlinks is not None:
+        metrics["inlinks"] = int(inlinks)
+        if int(inlinks) < int(rules.get("min_inlinks", 1)):
+            score -= weight * 0.3
+            issues.append("orphan_article")
 
     return {
         "id": "links",
         "weight": weight,
         "score": round(_clamp(score, 0, weight), 2),
         "issues": issues,
-        "metrics": {"internal_links": internal_links, "external_links": external_links},
+        "metrics": metrics,
     }
 
 
@@ -352,6 +375,93 @@ def _score_images_alt(article: Dict[str, Any], weight: int, rules: Dict[str, Any
     }
 
 
+def _score_image_weight(article: Dict[str, Any], weight: int, rules: Dict[str, Any]) -> Dict[str, Any]:
+    images = article.get("images") or []
+    max_bytes = int(rules.get("max_image_kb", 200)) * 1024
+    modern_formats = tuple(rules.get("modern_formats", ("webp", "avif", "svg")))
+    # 첫 이미지는 LCP 후보라 즉시 로드를 허용한다.
+    eager_allowed = int(rules.get("eager_images_allowed", 1))
+    issues: List[str] = []
+    score = float(weight)
+
+    oversized = sum(1 for image in images if (image.get("bytes") or 0) > max_bytes)
+    legacy = sum(1 for image in images if image.get("format") and image["format"] not in modern_formats)
+    not_lazy = sum(1 for image in images[eager_allowed:] if not image.get("lazy"))
+    total_bytes = sum(image.get("bytes") or 0 for image in images)
+    unprobed = sum(1 for image in images if image.get("bytes") is None)
+
+    if oversized:
+        score -= weight * 0.5 * oversized / len(images)
+        issues.append("images_oversized")
+    if legacy:
+        score -= weight * 0.3 * legacy / len(images)
+        issues.append("images_legacy_format")
+    if not_lazy:
+        score -= weight * 0.2 * not_lazy / (len(images) - eager_allowed)
+        issues.append("images_not_lazy")
+
+    return {
+        "id": "image_weight",
+        "weight": weight,
+        "score": round(_clamp(score, 0, weight), 2),
+        "issues": issues,
+        "metrics": {
+            "image_count": len(images),
+            "total_kb": round(total_bytes / 1024, 1),
+            "oversized": oversized,
+            "legacy_format": legacy,
+            "not_lazy": not_lazy,
+            "unprobed": unprobed,
+        },
+    }
+
+
+def _score_structured_data(article: Dict[str, Any], weight: int, rules: Dict[str, Any]) -> Dict[str, Any]:
+    data = article.get("structured_data") or {}
+    required_fields = rules.get("required_fields", ["headline", "date_published", "authors", "image"])
+    required_og = rules.get("required_og", ["og:title", "og:description", "og:image"])
+    article_type = data.get("article_type", "")
+    issues: List[str] = []
+    score = float(weight)
+
+    missing_fields = [field for field in required_fields if not data.get(field)]
+    if not article_type:
+        score -= weight * 0.6
+        issues.append("news_article_schema_missing")
+    else:
+        if rules.get("require_news_article", True) and article_type not in NEWS_TYPES:
+            score -= weight * 0.1
+            issues.append("news_article_type_generic")
+        if missing_fields:
+            score -= weight * 0.1 * len(missing_fields)
+            issues.append("news_article_fields_missing")
+    if data.get("invalid_blocks"):
+        score -= weight * 0.1
+        issues.append("json_ld_invalid")
+
+    og = data.get("og") or {}
+    missing_og = [key for key in required_og if not og.get(key)]
+    if missing_og:
+        score -= weight * 0.1
+        issues.append("open_graph_incomplete")
+    if rules.get("require_twitter_card", True) and not (data.get("twitter") or {}).get("twitter:card"):
+        score -= weight * 0.05
+        issues.append("twitter_card_missing")
+
+    return {
+        "id": "structured_data",
+        "weight": weight,
+        "score": round(_clamp(score, 0, weight), 2),
+        "issues": issues,
+        "metrics": {
+            "article_type": article_type,
+            "missing_fields": missing_fields if article_type else required_fields,
+            "missing_og": missing_og,
+            "invalid_blocks": int(data.get("invalid_blocks") or 0),
+        },
+    }
+
+
 def _sentence_stats(content: str) -> Tuple[int, float]:
     text = (content or "").strip()
     if not text:
@@ -406,61 +516,90 @@ SCORERS = {
     "content": _score_content,
     "links": _score_links,
     "images_alt": _score_images_alt,
+    "image_weight": _score_image_weight,
+    "structured_data": _score_structured_data,
     "readability": _score_readability,
 }
 
+# Article fields each scorer reads; lets callers cache a criterion result per field values.
+CRITERION_FIELDS = {
+    "title": ("title",),
+    "meta_description": ("meta_description",),
+    "headings": ("h1", "h2_count", "title"),
+    "content": ("word_count", "title", "content", "_profile"),
+    "links": ("internal_links", "external_links", "inlinks"),
+    "images_alt": ("image_count", "images_missing_alt"),
+    "image_weight": ("images",),
+    "structured_data": ("structured_data",),
+    "readability": ("content",),
+}
 
-def score_article(article: Dict[str, Any], rubric: Dict[str, Any]) -> Dict[str, Any]:
-    criteria = rubric.get("criteria", [])
-    details: List[Dict[str, Any]] = []
-    total_score = 0.0
-    total_weight = 0.0
-    profile = _detect_profile(article)
-    article = dict(article)
-    article["_profile"] = profile
 
-    if article.get("error"):
-        return {
-            "total_score": 0,
-            "max_score": rubric.get("total", 100),
-            "grade": "F",
-            "details": [],
-            "error": article["error"],
-        }
+def prepare_article(article: Any) -> ScoringView:
+    return ScoringView(article, _detect_profile(article))
+
+
+def error_score(error: str, rubric: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "total_score": 0,
+        "max_score": rubric.get("total", 100),
+        "grade": "F",
+        "details": [],
+        "error": error,
+    }
+
 
-    for criterion in criteria:
+def iter_criterion_scores(article: Any, rubric: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    profile = article["_profile"]
+    for criterion in rubric.get("criteria", []):
         criterion_id = criterion.get("id")
         weight = int(criterion.get("weight", 0))
-        rules = _apply_profile_rules(criterion_id, criterion.get("rules", {}), profile)
+        rules = _criterion_rules(criterion, rubric, profile)
         scorer = SCORERS.get(criterion_id)
         if not scorer or weight <= 0:
             continue
 
-        item = scorer(article, weight, rules)
-        details.append(item)
-        total_score += float(item["score"])
-        total_weight += weight
+        yield scorer(article, weight, rules)
+
+
+def _grade(normalized: float) -> str:
+    if normalized >= 90:
+        return "A"
+    if normalized >= 80:
+        return "B"
+    if normalized >= 70:
+        return "C"
+    if normalized >= 60:
+        return "D"
+    return "F"
+
+
+def summarize_scores(
+    details: List[Dict[str, Any]],
+    rubric: Dict[str, Any],
+    profile: Dict[str, Any],
+) -> Dict[str, Any]:
+    total_score = sum(float(item["score"]) for item in details)
+    total_weight = float(sum(item["weight"] for item in details))
 
     max_score = float(rubric.get("total", total_weight or 100))
     normalized = (total_score / total_weight * max_score) if total_weight else 0.0
     normalized = round(_clamp(normalized, 0, max_score), 2)
 
-    if normalized >= 90:
-        grade = "A"
-    elif normalized >= 80:
-        grade = "B"
-    elif normalized >= 70:
-        grade = "C"
-    elif normalized >= 60:
-        grade = "D"
-    else:
-        grade = "F"
-
     return {
         "total_score": normalized,
         "max_score": max_score,
-        "grade": grade,
+        "grade": _grade(normalized),
         "details": details,
         "profile": profile,
         "error": "",
     }
+
+
+def score_article(article: Any, rubric: Dict[str, Any]) -> Dict[str, Any]:
+    prepared = prepare_article(article)
+    if prepared.get("error"):
+        return error_score(prepared["error"], rubric)
+
+    details = list(iter_criterion_scores(prepared, rubric))
+    return summarize_scores(details, rubric, prepared.profile)
@@ -0,0 +1,156 @@
+import argparse
+import json
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.main import iter_analysis, run
+from src.metrics import render_prometheus
+from src.report_index import DEFAULT_INDEX_PATH, get_report_index, query_from_params
+
+WEB_DIR = Path(__file__).resolve().parents[1] / "web"
+
+
+def format_sse(event: Dict[str, Any]) -> bytes:
+    payload = json.dumps(event, ensure_ascii=False)
+    return f"event: {event['event']}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def format_ndjson(event: Dict[str, Any]) -> bytes:
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def encode_stream(events: Iterable[Dict[str, Any]], sse: bool) -> Iterator[bytes]:
+    formatter = format_sse if sse else format_ndjson
+    for event in events:
+        yield formatter(event)
+
+
+class AnalyzeHandler(SimpleHTTPRequestHandler):
+    timings: Optional[bool] = None
+    report_index: Path = DEFAULT_INDEX_PATH
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_url(self) -> str:
+        query = parse_qs(urlparse(self.path).query)
+        if query.get("url"):
+            return query["url"][0].strip()
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return ""
+        try:
+            body = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return ""
+        return str(body.get("url") or "").strip() if isinstance(body, dict) else ""
+
+    def _wants_sse(self) -> bool:
+        query = parse_qs(urlparse(self.path).query)
+        if query.get("format"):
+            return query["format"][0] == "sse"
+        return "text/event-stream" in (self.headers.get("Accept") or "")
+
+    def _stream(self, url: str) -> None:
+        sse = self._wants_sse()
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            "text/event-stream; charset=utf-8" if sse else "application/x-ndjson; charset=utf-8",
+        )
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        for chunk in encode_stream(iter_analysis(url, self.timings), sse):
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    def _send_results(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            page = query_from_params(get_report_index(self.report_index), query)
+        except ValueError as exc:
+            self._send_json(400, {"error": "bad_query", "detail": str(exc)})
+            return
+        self._send_json(200, page)
+
+    def _route(self) -> None:
+        path = urlparse(self.path).path
+        if path == "/api/results":
+            self._send_results()
+            return
+        if path not in ("/api/analyze", "/api/analyze/stream"):
+            self._send_json(404, {"error": "not_found"})
+            return
+
+        url = self._read_url()
+        if not url:
+            self._send_json(400, {"error": "url_required"})
+            return
+
+        if path == "/api/analyze/stream":
+            self._stream(url)
+        else:
+            self._send_json(200, run(url, self.timings))
+
+    def _send_metrics(self) -> None:
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        path = urlparse(self.path).path
+        if path == "/metrics":
+            self._send_metrics()
+        elif path.startswith("/api/"):
+            self._route()
+        else:
+            super().do_GET()
+
+    def do_POST(self) -> None:
+        self._route()
+
+
+def serve(
+    host: str, port: int, timings: Optional[bool] = None, report_index: Path = DEFAULT_INDEX_PATH
+) -> None:
+    AnalyzeHandler.timings = timings
+    AnalyzeHandler.report_index = report_index
+    handler = partial(AnalyzeHandler, directory=str(WEB_DIR))
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the dashboard and the analysis API.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Instrument every analysis and expose stage quantiles on /metrics.",
+    )
+    parser.add_argument(
+        "--report-index",
+        default=str(DEFAULT_INDEX_PATH),
+        help="Report index (python -m src.report_index) served on /api/results.",
+    )
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.timings or None, Path(args.report_index))
@@ -0,0 +1,123 @@
+import html as html_lib
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+NEWS_TYPES = ("NewsArticle", "ReportageNewsArticle", "AnalysisNewsArticle", "OpinionNewsArticle")
+ARTICLE_TYPES = NEWS_TYPES + ("Article", "BlogPosting")
+
+# "+json"은 페이지에 드물어 먼저 빠르게 찾고, 그 자리가 ld+json script 시작 태그 안인지만 확인한다.
+# 인라인 JS 문자열 속 표기는 무시하고, type 값은 대소문자를 가리지 않는다.
+_LD_HINT_RE = re.compile(r"\+[jJ][sS][oO][nN]")
+_LD_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*?\btype\s*=\s*["']?application/ld\+json\b[^>]*>""", re.IGNORECASE
+)
+_SCRIPT_END_RE = re.compile(r"</script", re.IGNORECASE)
+_META_TAG_RE = re.compile(
+    r"""<meta\s[^>]*?(?:property|name)\s*=\s*["']?((?:og|twitter):[\w:.-]+)[^>]*>""", re.IGNORECASE
+)
+_CONTENT_RE = re.compile(r"""content\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL)
+
+
+def _iter_ld_blocks(source: str) -> Iterator[str]:
+    # 트리를 다시 순회하지 않고 원문 문자열 검색으로 script 블록 위치만 찾는다.
+    position = 0
+    while True:
+        hint = _LD_HINT_RE.search(source, position)
+        if hint is None:
+            return
+        tag_start = source.rfind("<", 0, hint.start())
+        tag = _LD_SCRIPT_RE.match(source, tag_start) if tag_start >= 0 else None
+        if tag is None or tag.end() <= hint.start():
+            position = hint.end()
+            continue
+        end = _SCRIPT_END_RE.search(source, tag.end())
+        if end is None:
+            return
+        yield source[tag.end():end.start()]
+        position = end.end()
+
+
+def _iter_nodes(data: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_nodes(data["@graph"])
+
+
+def _types(node: Dict[str, Any]) -> List[str]:
+    value = node.get("@type") or []
+    return [value] if isinstance(value, str) else [str(item) for item in value]
+
+
+def _names(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [name for item in value for name in _names(item)]
+    if isinstance(value, dict):
+        return [str(value["name"]).strip()] if value.get("name") else []
+    return [str(value).strip()] if value else []
+
+
+def _image_url(value: Any) -> str:
+    if isinstance(value, list):
+        return next((url for url in (_image_url(item) for item in value) if url), "")
+    if isinstance(value, dict):
+        return str(value.get("url") or value.get("contentUrl") or "")
+    return str(value or "")
+
+
+def _meta_tags(source: str) -> Dict[str, Dict[str, str]]:
+    tags: Dict[str, Dict[str, str]] = {"og": {}, "twitter": {}}
+    if "og:" not in source and "twitter:" not in source:
+        return tags
+    # OG/Twitter 태그는 head에 있으므로 head 구간만 검사한다.
+    head_end = source.find("</head")
+    for match in _META_TAG_RE.finditer(source, 0, head_end if head_end >= 0 else len(source)):
+        content = _CONTENT_RE.search(match.group(0))
+        if not content:
+            continue
+        key = match.group(1).lower()
+        tags[key.split(":", 1)[0]].setdefault(key, html_lib.unescape(content.group(2)).strip())
+    return tags
+
+
+def extract_structured_data(source: str) -> Dict[str, Any]:
+    article_node: Optional[Dict[str, Any]] = None
+    types: List[str] = []
+    invalid_blocks = 0
+    for block in _iter_ld_blocks(source):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            invalid_blocks += 1
+            continue
+        for node in _iter_nodes(data):
+            node_types = _types(node)
+            types.extend(node_types)
+            if not any(item in ARTICLE_TYPES for item in node_types):
+                continue
+            # NewsArticle 계열을 일반 Article보다 우선한다.
+            if article_node is None or (
+                any(item in NEWS_TYPES for item in node_types)
+                and not any(item in NEWS_TYPES for item in _types(article_node))
+            ):
+                article_node = node
+
+    node = article_node or {}
+    tags = _meta_tags(source)
+    return {
+        "types": types,
+        "article_type": next((item for item in _types(node) if item in ARTICLE_TYPES), ""),
+        "headline": str(node.get("headline") or "").strip(),
+        "date_published": str(node.get("datePublished") or "").strip(),
+        "date_modified": str(node.get("dateModified") or "").strip(),
+        "authors": _names(node.get("author")),
+        "image": _image_url(node.get("image")),
+        "publisher": (_names(node.get("publisher")) or [""])[0],
+        "invalid_blocks": invalid_blocks,
+        "og": tags["og"],
+        "twitter": tags["twitter"],
+    }
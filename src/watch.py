@@ -0,0 +1,209 @@
+import json
+import os
+import signal
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_SEEN_DB = Path(__file__).resolve().parents[1] / "data" / "cache" / "watch_seen.sqlite"
+DEFAULT_POLL_INTERVAL = 1.0
+# 실패한 URL은 일시적 오류일 수 있어 이 간격(초) 뒤 다음 폴링에서 최대 이 횟수까지 다시 분석한다.
+DEFAULT_RETRY_DELAY = 60.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _clean_lines(lines: Iterable[str]) -> List[str]:
+    urls: List[str] = []
+    for line in lines:
+        cleaned = line.strip()
+        if cleaned and not cleaned.startswith("#"):
+            urls.append(cleaned)
+    return urls
+
+
+# 처리한 URL과 파일별 읽은 위치를 SQLite에 남겨 재시작해도 중복 분석하지 않는다.
+class SeenStore:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, seen_at REAL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS offsets (path TEXT PRIMARY KEY, inode INTEGER, offset INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS failures (url TEXT PRIMARY KEY, attempts INTEGER, failed_at REAL)"
+        )
+        self._conn.commit()
+
+    def unseen(self, urls: List[str]) -> List[str]:
+        unique = list(dict.fromkeys(urls))
+        found = set()
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            # 실패 이력이 있는 URL은 retries()가 횟수 제한에 맞춰 다시 내보낸다.
+            rows = self._conn.execute(
+                f"SELECT url FROM seen WHERE url IN ({placeholders}) "
+                f"UNION SELECT url FROM failures WHERE url IN ({placeholders})",
+                chunk + chunk,
+            )
+            found.update(url for (url,) in rows)
+        return [url for url in unique if url not in found]
+
+    def mark(self, url: str) -> None:
+        self._conn.execute("INSERT OR IGNORE INTO seen (url, seen_at) VALUES (?, ?)", (url, time.time()))
+        self._conn.execute("DELETE FROM failures WHERE url = ?", (url,))
+        self._conn.commit()
+
+    def record_failure(self, url: str) -> int:
+        self._conn.execute(
+            "INSERT INTO failures (url, attempts, failed_at) VALUES (?, 1, ?) "
+            "ON CONFLICT(url) DO UPDATE SET attempts = attempts + 1, failed_at = excluded.failed_at",
+            (url, time.time()),
+        )
+        self._conn.commit()
+        return self._conn.execute("SELECT attempts FROM failures WHERE url = ?", (url,)).fetchone()[0]
+
+    def retries(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS, delay: float = DEFAULT_RETRY_DELAY) -> List[str]:
+        rows = self._conn.execute(
+            "SELECT url FROM failures WHERE attempts < ? AND failed_at <= ? ORDER BY failed_at",
+            (max_attempts, time.time() - delay),
+        )
+        return [url for (url,) in rows]
+
+    def offset(self, path: Path) -> Optional[tuple]:
+        return self._conn.execute(
+            "SELECT inode, offset FROM offsets WHERE path = ?", (str(path),)
+        ).fetchone()
+
+    def save_offset(self, path: Path, inode: int, offset: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO offsets (path, inode, offset) VALUES (?, ?, ?)", (str(path), inode, offset)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class FileTailer:
+    def __init__(self, path: Path, store: SeenStore) -> None:
+        self.path = path
+        self.store = store
+        saved = store.offset(path)
+        self.inode, self.offset = saved if saved else (0, 0)
+        self._pending = self.offset
+
+    def poll(self) -> List[str]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        # 파일이 교체(rotate)되거나 잘리면 처음부터 다시 읽는다.
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.inode, self.offset = stat.st_ino, 0
+        if stat.st_size == self.offset:
+            return []
+        with self.path.open("rb") as handle:
+            handle.seek(self.offset)
+            chunk = handle.read(stat.st_size - self.offset)
+        # 아직 줄바꿈으로 끝나지 않은 마지막 줄은 다음 폴링에서 읽는다.
+        complete = chunk.rfind(b"\n") + 1
+        self._pending = self.offset + complete
+        return _clean_lines(chunk[:complete].decode("utf-8", errors="replace").splitlines())
+
+    def commit(self) -> None:
+        # 읽은 위치는 해당 URL들을 모두 처리한 뒤에 저장한다.
+        if self._pending != self.offset:
+            self.offset = self._pending
+            self.store.save_offset(self.path, self.inode, self.offset)
+
+
+class DropDirWatcher:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.processed = directory / "processed"
+        self._pending: List[Path] = []
+
+    def poll(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        urls: List[str] = []
+        self._pending = sorted(self.directory.glob("*.txt"))
+        for path in self._pending:
+            urls.extend(_clean_lines(path.read_text(encoding="utf-8", errors="replace").splitlines()))
+        return urls
+
+    def commit(self) -> None:
+        if self._pending:
+            self.processed.mkdir(exist_ok=True)
+        for path in self._pending:
+            path.replace(self.processed / path.name)
+        self._pending = []
+
+
+def iter_new_urls(
+    source: Any,
+    store: SeenStore,
+    stop: threading.Event,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+) -> Iterator[List[str]]:
+    while not stop.is_set():
+        urls = store.unseen(source.poll()) + store.retries(max_attempts, retry_delay)
+        if urls:
+            # 소비자가 배치를 모두 처리한 뒤 source.commit()을 호출한다.
+            yield urls
+        else:
+            source.commit()
+            stop.wait(interval)
+
+
+def install_stop_handlers(stop: threading.Event) -> None:
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+
+def watch(
+    source: Any,
+    store: SeenStore,
+    analyze: Callable[[str], Dict[str, Any]],
+    output_path: Path,
+    stop: threading.Event,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+) -> int:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with output_path.open("a", encoding="utf-8") as handle:
+        for urls in iter_new_urls(source, store, stop, interval, max_attempts, retry_delay):
+            for url in urls:
+                if stop.is_set():
+                    break
+                try:
+                    result = analyze(url)
+                except Exception as exc:  # 한 URL의 실패가 상주 감시를 멈추지 않게 한다.
+                    result = {"url": url, "error": f"{type(exc).__name__}: {exc}"}
+                result["analyzed_at"] = time.time()
+                handle.write(json.dumps(result, ensure_ascii=False) + "\n")
+                handle.flush()
+                count += 1
+                error = result.get("error") or (result.get("article") or {}).get("error")
+                if error:
+                    # 실패한 URL은 seen으로 표시하지 않고 시도 횟수만 남겨 나중에 다시 분석한다.
+                    attempts = store.record_failure(url)
+                    retry = "retrying later" if attempts < max_attempts else "giving up"
+                    print(f"  error {url}: {error} (attempt {attempts}/{max_attempts}, {retry})", flush=True)
+                    continue
+                # 결과를 쓴 뒤에 seen으로 표시해 중단되어도 URL을 잃지 않는다.
+                store.mark(url)
+                score = result.get("score") or {}
+                print(f"{score.get('total_score', 0):>6} {score.get('grade', '-')}  {url}", flush=True)
+            else:
+                source.commit()
+    return count
@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import queue
+import sys
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        # Windows에는 resource 모듈이 없다. RSS를 알 수 없으면 워커 교체 기준에 걸리지 않는다.
+        return 0
+    # /proc이 없는 환경에서는 최대 RSS로 대신한다 (macOS는 bytes, Linux는 KB).
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _worker_loop(
+    func: Callable[[Any], Any],
+    inbox: Any,
+    results: Any,
+    max_rss_bytes: int,
+) -> None:
+    pid = os.getpid()
+    while True:
+        task = inbox.get()
+        if task is None:
+            results.put(("exit", pid, None, None, True))
+            return
+        index, payload = task
+        try:
+            kind, value = "done", func(payload)
+        except Exception as exc:  # noqa: BLE001 - 한 건의 실패가 배치 전체를 멈추지 않게 한다.
+            kind, value = "error", f"{type(exc).__name__}: {exc}"
+        # 결과와 함께 종료 여부를 알려, 부모가 곧 끝날 워커에 다음 작업을 넘기지 않게 한다.
+        recycle = bool(max_rss_bytes) and current_rss_bytes() > max_rss_bytes
+        results.put((kind, pid, index, value, recycle))
+        if recycle:
+            return
+
+
+def imap_recycling(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 1,
+    max_rss_bytes: int = 0,
+) -> Iterator[Tuple[int, str, Any]]:
+    # (index, status, value)를 완료 순서대로 돌려준다. status는 'done' 또는 'error'.
+    # 작업 후 RSS가 max_rss_bytes를 넘은 워커는 스스로 종료하고 새 워커로 교체된다.
+    ctx = multiprocessing.get_context()
+    results = ctx.Queue()
+    todo = deque(enumerate(items))
+    workers = max(1, min(workers, len(todo) or 1))
+
+    # 워커마다 작업 큐를 따로 두고 한 번에 한 건만 넘겨, 어느 워커가 어떤 작업을 가졌는지 안다.
+    processes: Dict[int, Tuple[Any, Any]] = {}
+    assigned: Dict[int, int] = {}
+
+    def dispatch(pid: int) -> None:
+        inbox = processes[pid][1]
+        if todo:
+            index, item = todo.popleft()
+            assigned[pid] = index
+            inbox.put((index, item))
+        else:
+            inbox.put(None)
+
+    def spawn() -> None:
+        inbox = ctx.Queue()
+        process = ctx.Process(target=_worker_loop, args=(func, inbox, results, max_rss_bytes))
+        process.daemon = True
+        process.start()
+        processes[process.pid] = (process, inbox)
+        dispatch(process.pid)
+
+    for _ in range(workers):
+        spawn()
+
+    try:
+        while todo or assigned:
+            try:
+                kind, pid, index, value, retiring = results.get(timeout=1.0)
+            except queue.Empty:
+                # 메시지 없이 죽은 워커(OOM kill 등)의 작업은 오류로 돌려주고 워커를 새로 띄운다.
+                dead: List[int] = [pid for pid, (proc, _) in processes.items() if not proc.is_alive()]
+                for pid in dead:
+                    processes.pop(pid)[0].join()
+                    lost = assigned.pop(pid, None)
+                    if lost is not None:
+                        yield lost, "error", "worker process died"
+                    if todo:
+                        spawn()
+                continue
+
+            if kind in ("done", "error") and assigned.get(pid) == index:
+                assigned.pop(pid)
+                yield index, kind, value
+            if pid not in processes:
+                # 죽은 것으로 처리한 워커의 늦은 메시지는 버린다.
+                continue
+            if retiring:
+                processes.pop(pid)[0].join()
+                if kind != "exit" and todo:
+                    spawn()
+            else:
+                dispatch(pid)
+    finally:
+        for process, _ in processes.values():
+            process.terminate()
+            process.join()
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import streamlit as st
 from streamlit_autorefresh import st_autorefresh
 
-from src.main import run
+from src.draft import analyze_draft
+from src.main import iter_analysis, run
+from src.monitor import WatchlistMonitor
 
 
 st.set_page_config(
@@ -21,6 +23,8 @@ LABELS = {
     "content": "\ubcf8\ubb38 \ud488\uc9c8",
     "links": "\ub0b4\ubd80 \ub9c1\ud06c \uad6c\uc131",
     "images_alt": "\uc774\ubbf8\uc9c0 ALT",
+    "image_weight": "\uc774\ubbf8\uc9c0 \uc6a9\ub7c9",
+    "structured_data": "\uad6c\uc870\ud654 \ub370\uc774\ud130",
     "readability": "\uac00\ub3c5\uc131",
 }
 
@@ -133,8 +137,45 @@ def _score_state(score: float, weight: float) -> str:
     return "\uac1c\uc120 \ud544\uc694"
 
 
+def _partial_rows(details: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    rows = []
+    for item in details:
+        score = float(item.get("score", 0))
+        weight = float(item.get("weight", 0))
+        rows.append(
+            {
+                "\ud56d\ubaa9": LABELS.get(item.get("id", ""), item.get("id", "")),
+                "\uc810\uc218": f"{score:.1f}/{weight:.0f}",
+                "\uc0c1\ud0dc": _score_state(score, weight),
+            }
+        )
+    return rows
+
+
 def analyze(url: str) -> Dict[str, Any]:
-    return run(url)
+    status = st.empty()
+    partial = st.empty()
+    details: List[Dict[str, Any]] = []
+    result: Dict[str, Any] = {}
+
+    status.info("\uae30\uc0ac\ub97c \ubd88\ub7ec\uc624\ub294 \uc911\uc785\ub2c8\ub2e4...")
+    for event in iter_analysis(url):
+        kind = event["event"]
+        if kind == "fetch":
+            status.info(
+                f"\uc218\uc9d1 \uc644\ub8cc: HTTP {event['status_code']} / {event['bytes']:,} bytes"
+            )
+        elif kind == "article":
+            status.info("\ubcf8\ubb38 \ucd94\ucd9c \uc644\ub8cc. \ud56d\ubaa9\ubcc4 \uc810\uc218\ub97c \uacc4\uc0b0\ud558\ub294 \uc911\uc785\ub2c8\ub2e4...")
+        elif kind == "criterion":
+            details.append(event["criterion"])
+            partial.dataframe(_partial_rows(details), use_container_width=True, hide_index=True)
+        elif kind == "result":
+            result = event["result"]
+
+    status.empty()
+    partial.empty()
+    return result
 
 
 def render_header() -> None:
@@ -221,28 +262,7 @@ def render_article_overview(result: Dict[str, Any]) -> None:
         st.write(f"\uba54\ud0c0 \uc124\uba85: {article.get('meta_description', '')}")
 
 
-def main() -> None:
-    render_style()
-    render_header()
-
-    with st.sidebar:
-        st.header("\ubd84\uc11d \uc81c\uc5b4")
-        url = st.text_input("\uae30\uc0ac URL", value="https://example.com/article")
-        auto_refresh = st.checkbox("60\ucd08 \uc790\ub3d9 \uc7ac\ubd84\uc11d", value=False)
-        run_now = st.button("\uc9c0\uae08 \ubd84\uc11d", type="primary", use_container_width=True)
-        st.caption("\ud301: \uae30\uc0ac \ucd08\uace0 \uc218\uc815 \ud6c4 \uc989\uc2dc \ub2e4\uc2dc \ubd84\uc11d\ud558\uc138\uc694.")
-        if auto_refresh:
-            st_autorefresh(interval=60_000, key="auto_refresh")
-
-    if not (run_now or auto_refresh):
-        st.info(
-            "\uc0ac\uc774\ub4dc\ubc14\uc5d0 URL\uc744 \uc785\ub825\ud558\uace0 `\uc9c0\uae08 \ubd84\uc11d` \ubc84\ud2bc\uc744 \ub20c\ub7ec\uc8fc\uc138\uc694."
-        )
-        return
-
-    with st.spinner("\ud150\uc544\uc2dc\uc544 \uae30\uc0ac SEO\ub97c \ubd84\uc11d \uc911\uc785\ub2c8\ub2e4..."):
-        result = analyze(url)
-
+def render_result(result: Dict[str, Any]) -> None:
     if result["score"].get("error"):
         st.error(f"\ubd84\uc11d \uc2e4\ud328: {result['score']['error']}")
         return
@@ -262,5 +282,137 @@ def main() -> None:
     render_article_overview(result)
 
 
+def draft_sidebar() -> Dict[str, Any]:
+    source = st.radio("\ucd08\uace0 \uc785\ub825 \ubc29\uc2dd", ["\ud544\ub4dc", "HTML"], horizontal=True)
+    if source == "HTML":
+        html = st.text_area("\ucd08\uace0 HTML", height=240)
+        return {"html": html} if html.strip() else {}
+
+    title = st.text_input("\uc81c\ubaa9")
+    meta_description = st.text_area("\uba54\ud0c0 \uc124\uba85", height=80)
+    h1 = st.text_input("H1")
+    body = st.text_area("\ubcf8\ubb38 (\ube48 \uc904\ub85c \ubb38\ub2e8 \uad6c\ubd84)", height=240)
+    if not (title or meta_description or body):
+        return {}
+    return {"title": title, "meta_description": meta_description, "h1": h1, "body": body}
+
+
+WATCH_INTERVALS = {"30\ucd08": 30, "1\ubd84": 60, "5\ubd84": 300}
+WATCH_RENDER_MS = 5_000
+RECENT_CHANGE_SECONDS = 600
+
+
+@st.cache_resource
+def get_monitor() -> WatchlistMonitor:
+    return WatchlistMonitor(run)
+
+
+def watchlist_sidebar() -> Dict[str, Any]:
+    text = st.text_area("\uac10\uc2dc\ud560 \uae30\uc0ac URL (\ud55c \uc904\uc5d0 \ud558\ub098)", height=220, key="watchlist_urls")
+    label = st.selectbox("\uac31\uc2e0 \uc8fc\uae30", list(WATCH_INTERVALS), index=1)
+    st.caption("\uac19\uc740 URL\uc740 \uc5ec\ub7ec \ud3b8\uc9d1\uc790\uac00 \ubd10\ub3c4 \uc11c\ubc84\uc5d0\uc11c \ud55c \ubc88\ub9cc \uc218\uc9d1\ud569\ub2c8\ub2e4.")
+    urls = [line.strip() for line in text.splitlines() if line.strip() and not line.strip().startswith("#")]
+    return {"urls": list(dict.fromkeys(urls)), "interval": WATCH_INTERVALS[label]}
+
+
+def _format_time(timestamp: Any) -> str:
+    if not timestamp:
+        return "-"
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%H:%M:%S")
+
+
+def _watch_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    now = datetime.now(timezone.utc).timestamp()
+    table = []
+    for row in rows:
+        summary = row["summary"] or {}
+        recent = bool(row["changed_at"]) and now - row["changed_at"] < RECENT_CHANGE_SECONDS
+        delta = ""
+        if recent and row["previous_score"] is not None:
+            delta = f"{summary.get('total_score', 0) - row['previous_score']:+.1f}"
+        table.append(
+            {
+                "\ubcc0\uacbd": "\U0001F534" if recent else "",
+                "\uc81c\ubaa9": summary.get("title") or row["url"],
+                "\uc810\uc218": f"{summary['total_score']:.1f}" if summary else "-",
+                "\ub4f1\uae09": summary.get("grade", "-"),
+                "\uc810\uc218 \ubcc0\ud654": delta,
+                "\ubcc0\uacbd \ud56d\ubaa9": ", ".join(row["changes"]) if recent else "",
+                "\ub9c8\uc9c0\ub9c9 \uac31\uc2e0 (UTC)": _format_time(row["refreshed_at"]),
+                "\uc0c1\ud0dc": {"pending": "\uc218\uc9d1 \ub300\uae30", "ok": "\uc815\uc0c1", "error": "\uc624\ub958"}[row["status"]],
+                "URL": row["url"],
+            }
+        )
+    return table
+
+
+def render_watchlist(urls: List[str], interval: int) -> None:
+    monitor = get_monitor()
+    monitor.watch(urls, interval)
+    # 화면은 공유 저장소의 최신 스냅샷만 다시 그리고, 수집은 백그라운드 풀이 맡는다.
+    st_autorefresh(interval=WATCH_RENDER_MS, key="watchlist_refresh")
+    rows = monitor.snapshot(urls)
+
+    st.markdown('<div class="panel"><p class="panel-title">\uc6cc\uce58\ub9ac\uc2a4\ud2b8</p></div>', unsafe_allow_html=True)
+    done = sum(1 for row in rows if row["status"] != "pending")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("\uac10\uc2dc \uae30\uc0ac", len(rows))
+    col2.metric("\uc218\uc9d1 \uc644\ub8cc", f"{done}/{len(rows)}")
+    scored = [row["summary"]["total_score"] for row in rows if row["status"] == "ok"]
+    col3.metric("\ud3c9\uade0 \uc810\uc218", f"{sum(scored) / len(scored):.1f}" if scored else "-")
+    st.dataframe(_watch_rows(rows), use_container_width=True, hide_index=True)
+
+    ready = [row for row in rows if row["result"] and row["result"].get("score")]
+    if not ready:
+        return
+    titles = {row["url"]: (row["summary"] or {}).get("title") or row["url"] for row in ready}
+    selected = st.selectbox("\uc0c1\uc138 \ubcf4\uae30", list(titles), format_func=lambda url: titles[url])
+    render_result(next(row["result"] for row in ready if row["url"] == selected))
+
+
+def main() -> None:
+    render_style()
+    render_header()
+
+    with st.sidebar:
+        st.header("\ubd84\uc11d \uc81c\uc5b4")
+        mode = st.radio("\ubd84\uc11d \ub300\uc0c1", ["URL", "\ucd08\uace0", "\uc6cc\uce58\ub9ac\uc2a4\ud2b8"], horizontal=True)
+        if mode == "\uc6cc\uce58\ub9ac\uc2a4\ud2b8":
+            watch_input = watchlist_sidebar()
+        elif mode == "\ucd08\uace0":
+            draft_input = draft_sidebar()
+            st.caption("\uc785\ub825\uc744 \ub9c8\uce58\uba74 \ub124\ud2b8\uc6cc\ud06c \uc5c6\uc774 \uc989\uc2dc \uc7ac\ubd84\uc11d\ub429\ub2c8\ub2e4.")
+        else:
+            url = st.text_input("\uae30\uc0ac URL", value="https://example.com/article")
+            auto_refresh = st.checkbox("60\ucd08 \uc790\ub3d9 \uc7ac\ubd84\uc11d", value=False)
+            run_now = st.button("\uc9c0\uae08 \ubd84\uc11d", type="primary", use_container_width=True)
+            st.caption("\ud301: \uae30\uc0ac \ucd08\uace0 \uc218\uc815 \ud6c4 \uc989\uc2dc \ub2e4\uc2dc \ubd84\uc11d\ud558\uc138\uc694.")
+            if auto_refresh:
+                st_autorefresh(interval=60_000, key="auto_refresh")
+
+    if mode == "\uc6cc\uce58\ub9ac\uc2a4\ud2b8":
+        if not watch_input["urls"]:
+            st.info("\uc0ac\uc774\ub4dc\ubc14\uc5d0 \uac10\uc2dc\ud560 \uae30\uc0ac URL\uc744 \ud55c \uc904\uc5d0 \ud558\ub098\uc529 \uc785\ub825\ud558\uc138\uc694.")
+            return
+        render_watchlist(watch_input["urls"], watch_input["interval"])
+        return
+
+    if mode == "\ucd08\uace0":
+        if not draft_input:
+            st.info("\uc0ac\uc774\ub4dc\ubc14\uc5d0 \ucd08\uace0 \uc81c\ubaa9\uacfc \ubcf8\ubb38\uc744 \uc785\ub825\ud558\uc138\uc694.")
+            return
+        result = analyze_draft(**draft_input)
+        st.caption(f"\ucd08\uace0 \ubd84\uc11d {result['elapsed_ms']:.1f} ms")
+        render_result(result)
+        return
+
+    if not (run_now or auto_refresh):
+        st.info(
+            "\uc0ac\uc774\ub4dc\ubc14\uc5d0 URL\uc744 \uc785\ub825\ud558\uace0 `\uc9c0\uae08 \ubd84\uc11d` \ubc84\ud2bc\uc744 \ub20c\ub7ec\uc8fc\uc138\uc694."
+        )
+        return
+
+    render_result(analyze(url))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,31 @@
+from benchmarks.corpus import build_corpus, generate_page
+from benchmarks.run import compare
+from src.crawler import parse_article_html
+
+
+def test_generate_page_is_deterministic_and_sized() -> None:
+    first = generate_page("100kb", 100_000, 5)
+
+    assert first == generate_page("100kb", 100_000, 5)
+    assert first != generate_page("100kb", 100_000, 5, seed=1)
+    assert 100_000 <= len(first.encode("utf-8")) < 115_000
+
+    article = parse_article_html("https://bench.tenasia.local/article/100kb", first)
+    assert article["image_count"] == 5
+    assert article["word_count"] > 1000
+
+
+def test_corpus_spans_sizes_and_image_counts() -> None:
+    corpus = build_corpus()
+
+    assert [page["image_count"] for page in corpus.values()] == [0, 5, 20, 40]
+    assert len(corpus["2mb"]["html"].encode("utf-8")) >= 2_000_000
+
+
+def test_compare_flags_slowdown_and_memory_growth() -> None:
+    baseline = {"benchmarks": {"parse_10kb": {"median_ms": 10.0, "peak_kb": 100.0}}}
+    within = {"benchmarks": {"parse_10kb": {"median_ms": 11.0, "peak_kb": 110.0}}}
+    slower = {"benchmarks": {"parse_10kb": {"median_ms": 14.0, "peak_kb": 140.0}}}
+
+    assert compare(within, baseline, 0.25) == []
+    assert len(compare(slower, baseline, 0.25)) == 2
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from src.canonical import CanonicalMap, Canonicalizer, dedupe, fan_out, load_rules, normalize
+from src.crawler import parse_article_html
+
+
+def test_rules_collapse_tracking_host_and_slash_variants() -> None:
+    rules = load_rules()
+    variants = [
+        "https://www.tenasia.co.kr/article/2024010112345",
+        "http://m.tenasia.co.kr/article/2024010112345/?utm_source=naver&utm_medium=news",
+        "https://tenasia.co.kr/article/2024010112345#comments",
+        "https://www.tenasia.co.kr/article/2024010112345?fbclid=abc",
+    ]
+    assert {normalize(url, rules) for url in variants} == {"https://www.tenasia.co.kr/article/2024010112345"}
+    assert normalize("https://www.tenasia.co.kr/search?q=b&page=2", rules) == (
+        "https://www.tenasia.co.kr/search?page=2&q=b"
+    )
+
+
+def test_learned_redirect_and_canonical_resolve_without_fetch(tmp_path: Path) -> None:
+    canonicalizer = Canonicalizer(load_rules(), CanonicalMap(tmp_path / "canonical.sqlite"))
+    html = (
+        '<html><head><link rel="canonical" href="/article/100"></head>'
+        "<body><article><p>본문</p></article></body></html>"
+    )
+    article = parse_article_html("https://www.tenasia.co.kr/article/100?page=1", html)
+    assert article["canonical_url"] == "https://www.tenasia.co.kr/article/100"
+    canonicalizer.learn([("https://www.tenasia.co.kr/news/view?id=100", {"article": article})])
+
+    urls = [
+        "https://www.tenasia.co.kr/news/view?id=100&utm_campaign=x",
+        "https://www.tenasia.co.kr/article/100",
+        "https://www.tenasia.co.kr/article/200",
+    ]
+    unique, groups = dedupe(urls, canonicalizer)
+    assert unique == ["https://www.tenasia.co.kr/article/100", "https://www.tenasia.co.kr/article/200"]
+    results = list(fan_out({"url": unique[0], "score": {"total_score": 70}}, groups[unique[0]], unique[0]))
+    assert [result["url"] for result in results] == urls[:2]
+    assert all(result["canonical_url"] == unique[0] for result in results)
+
+
+def test_redirects_to_site_root_or_other_host_are_not_learned(tmp_path: Path) -> None:
+    canonicalizer = Canonicalizer(load_rules(), CanonicalMap(tmp_path / "canonical.sqlite"))
+    removed = "https://www.tenasia.co.kr/article/300"
+    moved = "https://www.tenasia.co.kr/article/400"
+    legacy = "https://www.tenasia.co.kr/news/view?id=500"
+    learned = canonicalizer.learn(
+        [
+            (removed, {"article": {"url": "https://www.tenasia.co.kr/"}}),
+            (moved, {"article": {"url": "https://login.example.com/article/400"}}),
+            (legacy, {"article": {"url": "https://www.tenasia.co.kr/article/500"}}),
+        ]
+    )
+    assert learned == 1
+    assert canonicalizer.canonicalize(removed) == removed
+    assert canonicalizer.canonicalize(moved) == moved
+    assert canonicalizer.canonicalize(legacy) == "https://www.tenasia.co.kr/article/500"
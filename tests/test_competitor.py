@@ -0,0 +1,65 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.competitor import PageCache, StoryComparer, rank
+from src.crawler import parse_article_html
+
+
+def _html(title: str, paragraphs: int) -> str:
+    body = "".join(f"<p>배우 A가 {index}번째 장면을 공개했다. 팬들의 반응이 뜨겁다.</p>" for index in range(paragraphs))
+    return (
+        f"<html><head><title>{title}</title><meta name=\"description\" content=\"{title} 요약\" /></head>"
+        f"<body><article><h1>{title}</h1>{body}</article></body></html>"
+    )
+
+
+PAGES = {
+    "https://www.tenasia.co.kr/article/1": _html("배우 A 신작 첫 스틸 공개, 팬들 기대감 폭발", 12),
+    "https://rival.example.com/news/1": _html("A 신작", 2),
+    "https://other.example.com/story/1": _html("배우 A 신작 스틸 공개", 6),
+}
+
+
+def test_rank_shares_ties() -> None:
+    rows = rank([("a", 5.0), ("b", 9.0), ("c", 5.0), ("d", 1.0)])
+    assert [(row["url"], row["rank"]) for row in rows] == [("b", 1), ("a", 2), ("c", 2), ("d", 4)]
+
+
+def test_compare_ranks_criteria_and_caches_competitors(tmp_path: Path) -> None:
+    calls: List[str] = []
+    slow = threading.Event()
+
+    def fetch(url: str) -> Dict[str, Any]:
+        calls.append(url)
+        if url.startswith("https://slow."):
+            slow.wait(5)
+            return {"url": url, "error": "late"}
+        return parse_article_html(url, PAGES[url.split("?")[0]])
+
+    comparer = StoryComparer(PageCache(tmp_path / "pages.sqlite"), fetch=fetch, workers=4)
+    ours = "https://www.tenasia.co.kr/article/1"
+    competitors = [
+        "https://rival.example.com/news/1?utm_source=x",
+        "https://rival.example.com/news/1",
+        "https://other.example.com/story/1",
+        "https://slow.example.com/a",
+    ]
+    report = comparer.compare(ours, competitors, budget=1.0)
+    slow.set()
+
+    statuses = {page["url"]: page["status"] for page in report["pages"]}
+    assert len(report["pages"]) == 4
+    assert statuses["https://slow.example.com/a"] == "timeout"
+    total = report["ranking"]["total_score"]
+    own = next(row for row in total["order"] if row["url"] == ours)
+    assert len(total["order"]) == 3 and total["leader"] == "https://rival.example.com/news/1?utm_source=x"
+    assert total["ours_rank"] == own["rank"] == 2
+    assert total["gap"] == round(total["order"][0]["score"] - own["score"], 2)
+    assert report["ranking"]["headings"]["ours_rank"] == 2 and report["ranking"]["title"]["ours_rank"] == 1
+
+    second = comparer.compare(ours, competitors[:3], budget=5.0)
+    assert [page["cached"] for page in second["pages"]] == [False, True, True]
+    assert calls.count("https://rival.example.com/news/1?utm_source=x") == 1
+    assert calls.count(ours) == 2
+    comparer.close()
@@ -0,0 +1,50 @@
+import json
+import subprocess
+import sys
+import threading
+
+from src import daemon
+from src.client import send_request
+from src.daemon import DaemonServer, _RequestHandler
+
+ARTICLE = {
+    "url": "https://example.com/post",
+    "title": "Short",
+    "content": "One short sentence.",
+    "word_count": 3,
+    "error": "",
+}
+
+
+def test_importing_main_does_not_load_heavy_parsers() -> None:
+    code = "import sys, src.main; print(json.dumps([m in sys.modules for m in ('requests', 'bs4', 'lxml')]))"
+    output = subprocess.run(
+        [sys.executable, "-c", "import json; " + code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert json.loads(output) == [False, False, False]
+
+
+def test_daemon_scores_article_over_unix_socket(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "seo.sock")
+    server = DaemonServer(path, _RequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert send_request({"op": "ping"}, path)["ok"]
+        response = send_request({"op": "score", "article": ARTICLE}, path)
+        assert response["ok"]
+        assert response["result"]["score"]["grade"] == "F"
+        assert response["result"]["recommendations"]
+        assert not send_request({"op": "nope"}, path)["ok"]
+
+        def broken(request):
+            raise RuntimeError("parser crashed")
+
+        # 처리 중 어떤 예외가 나도 연결을 끊지 않고 오류 응답을 준다.
+        monkeypatch.setattr(daemon, "handle_request", broken)
+        failed = send_request({"op": "ping"}, path)
+        assert failed == {"ok": False, "error": "RuntimeError: parser crashed"}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import List, Tuple
+
+from src import discovery
+from src.discovery import Frontier, discover, fetch_entries, iter_feed_entries
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/news.xml</loc><lastmod>2024-03-05T09:00:00+09:00</lastmod></sitemap>
+  <sitemap><loc>https://example.com/old.xml</loc><lastmod>2024-01-01</lastmod></sitemap>
+</sitemapindex>"""
+
+NEWS = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+  xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+  xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url><loc>https://example.com/a</loc>
+    <news:news><news:publication_date>2024-03-05T08:00:00Z</news:publication_date></news:news>
+    <image:image><image:loc>https://cdn.example.com/a.jpg</image:loc></image:image></url>
+  <url><loc>https://example.com/b</loc><lastmod>2024-03-04</lastmod></url>
+</urlset>"""
+
+RSS = b"""<rss version="2.0"><channel><link>https://example.com/</link>
+  <item><title>c</title><link>https://example.com/c</link><pubDate>Tue, 05 Mar 2024 10:00:00 +0900</pubDate></item>
+</channel></rss>"""
+
+
+def test_stream_parses_sitemaps_and_feeds_in_small_chunks() -> None:
+    chunks = [NEWS[i:i + 7] for i in range(0, len(NEWS), 7)]
+
+    assert list(iter_feed_entries(chunks)) == [
+        ("url", "https://example.com/a", "2024-03-05T08:00:00Z"),
+        ("url", "https://example.com/b", "2024-03-04T00:00:00Z"),
+    ]
+    assert list(iter_feed_entries([RSS])) == [("url", "https://example.com/c", "2024-03-05T01:00:00Z")]
+
+
+def test_discover_enqueues_only_new_or_changed(tmp_path: Path, monkeypatch) -> None:
+    feeds = {
+        "https://example.com/sitemap.xml": INDEX,
+        "https://example.com/news.xml": NEWS,
+        "https://example.com/old.xml": RSS,
+    }
+    fetched: List[str] = []
+
+    def fake_fetch(url: str) -> Tuple[str, list, str]:
+        fetched.append(url)
+        return url, list(iter_feed_entries([feeds[url]])), ""
+
+    monkeypatch.setattr(discovery, "fetch_entries", fake_fetch)
+    frontier = Frontier(tmp_path / "frontier.sqlite")
+
+    first = discover(["https://example.com/sitemap.xml"], frontier, workers=2)
+    assert first["enqueued"] == 3
+    assert set(frontier.pending()) == {"https://example.com/a", "https://example.com/b", "https://example.com/c"}
+    frontier.mark_done(frontier.pending())
+
+    fetched.clear()
+    feeds["https://example.com/sitemap.xml"] = INDEX.replace(b"2024-03-05T09:00:00", b"2024-03-06T09:00:00")
+    feeds["https://example.com/news.xml"] = NEWS.replace(b"2024-03-04", b"2024-03-06")
+    second = discover(["https://example.com/sitemap.xml"], frontier, workers=2)
+
+    assert "https://example.com/old.xml" not in fetched
+    assert second["skipped_sitemaps"] == 1
+    assert frontier.pending() == ["https://example.com/b"]
+    frontier.close()
+
+
+def test_pending_urls_keep_the_latest_lastmod(tmp_path: Path) -> None:
+    frontier = Frontier(tmp_path / "frontier.sqlite")
+    assert frontier.offer([("https://example.com/a", "2024-03-04T00:00:00Z")]) == 1
+    # 아직 분석 전인 URL의 lastmod가 바뀌면 다시 세지는 않지만 새 값은 남긴다.
+    assert frontier.offer([("https://example.com/a", "2024-03-05T00:00:00Z")]) == 0
+    assert frontier.lastmods() == {"https://example.com/a": "2024-03-05T00:00:00Z"}
+    frontier.mark_done(["https://example.com/a"])
+    assert frontier.offer([("https://example.com/a", "2024-03-05T00:00:00Z"), ("https://example.com/a", "")]) == 0
+    assert frontier.offer([("https://example.com/a", "2024-03-06T00:00:00Z")]) == 1
+    assert frontier.pending() == ["https://example.com/a"]
+    frontier.close()
+
+
+class _GzipResponse:
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, size: int) -> List[bytes]:
+        # gzip 헤더 뒤의 deflate 블록 형식이 깨진 본문.
+        return [b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff"]
+
+
+class _GzipSession:
+    def get(self, url: str, **kwargs) -> _GzipResponse:
+        return _GzipResponse()
+
+
+def test_corrupt_gzip_sitemap_is_reported_not_raised(monkeypatch) -> None:
+    monkeypatch.setattr(discovery, "get_session", lambda: _GzipSession())
+    url, entries, error = fetch_entries("https://example.com/sitemap.xml.gz")
+
+    assert (url, entries) == ("https://example.com/sitemap.xml.gz", [])
+    assert error.startswith("gzip error:")
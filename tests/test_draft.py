@@ -0,0 +1,57 @@
+from src.crawler import parse_article_html
+from src.draft import _score_draft, _score_section, analyze_draft, article_from_fields
+from src.main import RUBRIC_PATH, load_rubric
+from src.scorer import score_article
+
+HTML = """
+<html>
+  <head><title>Draft Title</title><meta name="description" content="draft meta" /></head>
+  <body>
+    <article>
+      <h1>Draft Heading</h1>
+      <p>아이돌 A가 오늘 신곡을 공개했다. 팬 반응이 이어졌다.</p>
+      <a href="/related">related</a>
+    </article>
+  </body>
+</html>
+"""
+
+
+def test_analyze_draft_html_matches_full_scoring() -> None:
+    result = analyze_draft(html=HTML, url="https://example.com/draft")
+    expected = score_article(parse_article_html("https://example.com/draft", HTML), load_rubric())
+
+    assert result["score"] == expected
+    assert result["recommendations"]
+
+
+def test_analyze_draft_fields_reuses_unchanged_sections() -> None:
+    body = "배우 B가 지난 3월 5일 드라마 출연을 발표했다.\n\n현장 반응도 전해졌다."
+    first = analyze_draft(title="배우 B 드라마 출연 발표", meta_description="요약", body=body)
+    hits_before = _score_section.cache_info().hits
+
+    second = analyze_draft(title="배우 B 드라마 출연 확정 발표", meta_description="요약", body=body)
+
+    assert _score_section.cache_info().hits - hits_before >= 4
+    assert first["article"]["paragraph_count"] == 2
+    assert second["score"]["details"][1] == first["score"]["details"][1]
+    assert second["score"] == score_article(
+        article_from_fields("배우 B 드라마 출연 확정 발표", "요약", body), load_rubric()
+    )
+
+
+def test_draft_scores_rubric_with_image_and_structured_data_criteria() -> None:
+    html = HTML.replace(
+        "</head>",
+        '<script type="application/ld+json">{"@type": "NewsArticle", "headline": "Draft Title"}</script>'
+        '<meta property="og:title" content="Draft Title" /></head>',
+    ).replace("</article>", '<img src="/a.jpg" alt="a" /><img data-src="/b.png" /></article>')
+    article = parse_article_html("https://example.com/draft", html)
+    rubric = load_rubric(RUBRIC_PATH.with_name("rubric.v2.json"))
+    ids = {item["id"] for item in rubric["criteria"]}
+    assert {"image_weight", "structured_data"} <= ids
+
+    assert article["structured_data"]
+    result = _score_draft(article, rubric)
+    assert result == score_article(parse_article_html("https://example.com/draft", html), rubric)
+    assert _score_draft(article, rubric) == result
@@ -0,0 +1,27 @@
+import codecs
+
+from src.encoding import decode_html
+
+TEXT = "<html><head>{meta}</head><body><p>배우 A가 오늘 신곡을 공개했다.</p></body></html>"
+
+
+def test_declared_encodings_take_priority() -> None:
+    euc_kr = TEXT.format(meta='<meta charset="euc-kr">').encode("euc-kr")
+    assert decode_html(euc_kr)[1:] == ("cp949", "meta")
+    assert "신곡" in decode_html(euc_kr)[0]
+
+    assert decode_html(euc_kr, "text/html; charset=EUC-KR")[1:] == ("cp949", "header")
+
+    with_bom = codecs.BOM_UTF8 + TEXT.format(meta='<meta charset="euc-kr">').encode("utf-8")
+    text, encoding, source = decode_html(with_bom)
+    assert (encoding, source) == ("utf-8-sig", "bom")
+    assert text.startswith("<html>")
+
+
+def test_undeclared_body_tries_utf8_then_detection() -> None:
+    assert decode_html(TEXT.format(meta="").encode("utf-8"), "text/html")[1:] == ("utf-8", "utf8")
+
+    body = (TEXT.format(meta="") * 20).encode("cp949")
+    text, encoding, source = decode_html(body, "text/html")
+    assert source == "detected"
+    assert "신곡" in text
@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.crawler import parse_article_html
+from src.image_probe import ImageProber, attach_probes
+from src.scorer import SCORERS
+
+HTML = """
+<html><body><article>
+  <h1>포토</h1>
+  <img src="/img/hero.jpg" alt="hero" />
+  <img src="https://cdn.example.com/a.webp" alt="a" loading="lazy" />
+  <img src="/img/blank.gif" data-src="https://cdn.example.com/b.png" alt="b" />
+  <img src="https://cdn.example.com/c.png" alt="c" />
+  <p>본문</p>
+</article></body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: Dict[str, str]) -> None:
+        self.status_code = status_code
+        self.headers = headers
+
+    def close(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def head(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append(url)
+        if url.endswith(".png"):
+            return FakeResponse(405, {})
+        return FakeResponse(200, {"Content-Length": "512000", "Content-Type": "image/jpeg"})
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append(url)
+        return FakeResponse(206, {"Content-Range": "bytes 0-0/2048", "Content-Type": "image/png"})
+
+
+def test_probe_results_are_cached_across_probers(tmp_path: Path) -> None:
+    cache = tmp_path / "images.sqlite"
+    article = parse_article_html("https://example.com/news/1", HTML)
+    assert [image["lazy"] for image in article["images"]] == [False, True, True, False]
+    assert article["images"][0]["src"] == "https://example.com/img/hero.jpg"
+
+    session = FakeSession()
+    prober = ImageProber(cache, workers=2, session=session)
+    attach_probes(article, prober)
+    prober.close()
+    assert article["images"][0]["bytes"] == 512000
+    assert article["images"][2] == {
+        "src": "https://cdn.example.com/b.png", "lazy": True, "format": "png", "bytes": 2048
+    }
+
+    second = FakeSession()
+    reloaded = ImageProber(cache, workers=2, session=second)
+    results = reloaded.probe(image["src"] for image in article["images"])
+    assert results["https://cdn.example.com/c.png"]["bytes"] == 2048
+    reloaded.close()
+    assert second.calls == []
+
+
+def test_image_weight_penalizes_heavy_legacy_eager_images() -> None:
+    images = [
+        {"src": "a.jpg", "lazy": False, "format": "jpeg", "bytes": 400 * 1024},
+        {"src": "b.webp", "lazy": True, "format": "webp", "bytes": 40 * 1024},
+        {"src": "c.png", "lazy": False, "format": "png", "bytes": None},
+    ]
+    result = SCORERS["image_weight"]({"images": images}, 10, {"max_image_kb": 200})
+
+    assert result["issues"] == ["images_oversized", "images_legacy_format", "images_not_lazy"]
+    assert result["metrics"]["unprobed"] == 1
+    assert 0 < result["score"] < 10
+    assert SCORERS["image_weight"]({"images": []}, 10, {})["score"] == 10
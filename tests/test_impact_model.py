@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from src.canonical import load_rules
+from src.impact_model import ImpactStats, compile_table, ingest
+from src.main import analyze_article
+from src.recommender import get_impact_table, recommend_fixes
+
+
+def _result(index: int, issues: list) -> Dict[str, Any]:
+    return {
+        "url": f"https://www.tenasia.co.kr/article/{index}?utm_source=x",
+        "score": {
+            "total_score": 70,
+            "grade": "C",
+            "profile": {"domain": "entertainment_news", "format": "standard"},
+            "details": [
+                {"id": "title", "score": 5, "weight": 20, "issues": issues},
+                {"id": "meta_description", "score": 5, "weight": 15, "issues": ["meta_description_too_short"]},
+            ],
+            "error": "",
+        },
+    }
+
+
+def test_impact_table_ranks_recommendations_by_expected_gain(tmp_path: Path) -> None:
+    rules = load_rules()
+    results = [_result(index, ["title_too_short"] if index < 10 else []) for index in range(20)]
+    # 제목이 짧은 기사는 CTR 2%, 나머지는 5%.
+    analytics = {
+        f"https://www.tenasia.co.kr/article/{index}": (1000.0, 20.0 if index < 10 else 50.0) for index in range(20)
+    }
+    stats = ImpactStats(tmp_path / "stats.sqlite")
+    assert ingest(stats, results, analytics, rules) == 20
+    assert ingest(stats, results, analytics, rules) == 0
+
+    table = compile_table(stats.sums())["entries"]
+    entry = table["entertainment_news/standard|title_too_short|1"]
+    assert entry[2] == 10
+    assert 0 < entry[0] < 3.0
+    assert table["entertainment_news/standard|title_too_short|*"] == entry
+    # 모든 기사에 있는 이슈는 비교 대상이 없어 표에 넣지 않는다.
+    assert not any("meta_description_too_short" in key for key in table)
+
+    score = _result(0, ["title_too_short"])["score"]
+    fixes = recommend_fixes(score, impact_table=table)
+    assert fixes[0].startswith("제목이 짧습니다")
+    assert "예상 영향: CTR +" in fixes[0]
+    assert "예상 영향" not in fixes[1]
+
+    # 같은 URL의 새 분석 결과는 이전 기여분을 대체한다.
+    fixed = [_result(index, []) for index in range(10)]
+    assert ingest(stats, fixed, analytics, rules) == 10
+    assert "entertainment_news/standard|title_too_short|1" not in compile_table(stats.sums())["entries"]
+    stats.close()
+
+
+def test_zero_gain_entry_does_not_outrank_larger_gap() -> None:
+    score = {
+        "total_score": 40,
+        "grade": "F",
+        "profile": {"domain": "entertainment_news", "format": "standard"},
+        "details": [
+            {"id": "title", "score": 0, "weight": 20, "issues": ["title_missing"]},
+            {"id": "meta_description", "score": 14, "weight": 15, "issues": ["meta_description_too_short"]},
+        ],
+    }
+    table = {"entertainment_news/standard|meta_description_too_short|*": [0.0, 0.0, 50]}
+    fixes = recommend_fixes(score, impact_table=table)
+    assert fixes[0].startswith("제목이 없습니다")
+    # 예상 개선이 0인 항목에는 "+0.00%p" 같은 영향도 문구를 붙이지 않는다.
+    assert fixes[1].startswith("메타 설명이 짧습니다") and "예상 영향" not in fixes[1]
+
+
+def test_impact_table_is_opt_in(tmp_path: Path) -> None:
+    path = tmp_path / "impact_table.json"
+    path.write_text(
+        json.dumps({"entries": {"general_news/standard|title_missing|*": [1.5, 15.0, 40]}}), encoding="utf-8"
+    )
+    article = {"url": "https://example.com/news/1", "title": "", "content": "본문"}
+    assert not any("예상 영향" in fix for fix in analyze_article(article)["recommendations"])
+    fixes = analyze_article(article, impact_table=get_impact_table(path))["recommendations"]
+    assert any("예상 영향: CTR +1.50%p" in fix for fix in fixes)
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from src.crawler import parse_article_html
+from src.link_graph import LinkGraph
+from src.scorer import SCORERS
+
+HTML = """
+<html><body><article>
+  <p>본문</p>
+  <a href="/news/2#top">next</a>
+  <a href="/news/2">dup</a>
+  <a href="https://example.com/news/3">abs</a>
+  <a href="https://other.com/x">ext</a>
+  <a href="mailto:desk@example.com">mail</a>
+</article></body></html>
+"""
+
+
+def test_crawler_records_internal_targets() -> None:
+    article = parse_article_html("https://example.com/news/1", HTML)
+
+    assert article["internal_targets"] == ["https://example.com/news/2", "https://example.com/news/3"]
+    assert article["internal_links"] == 4
+    assert article["external_links"] == 1
+
+
+def test_link_graph_incremental_updates_and_reload(tmp_path: Path) -> None:
+    graph = LinkGraph()
+    graph.add_page("https://example.com/1", ["https://example.com/2", "https://example.com/3"])
+    graph.add_page("https://example.com/2", ["https://example.com/3"])
+    graph.compact()
+    graph.add_page("https://example.com/4", [])
+
+    assert graph.inlink_count("https://example.com/3") == 2
+    assert graph.orphans() == ["https://example.com/1", "https://example.com/4"]
+    assert graph.hubs(1) == [("https://example.com/1", 2)]
+
+    graph.add_page("https://example.com/1", ["https://example.com/4"])
+    graph.save(tmp_path / "graph")
+    reloaded = LinkGraph.load(tmp_path / "graph")
+
+    assert reloaded.inlink_count("https://example.com/2") == 0
+    assert reloaded.inlink_count("https://example.com/4") == 1
+    assert reloaded.is_orphan("https://example.com/2")
+    assert reloaded.edge_count == graph.edge_count == 2
+
+
+def test_links_scorer_flags_orphans_only_when_inlinks_known() -> None:
+    article = {"internal_links": 3, "external_links": 0}
+
+    assert SCORERS["links"](article, 10, {})["issues"] == []
+    assert SCORERS["links"](dict(article, inlinks=0), 10, {})["issues"] == ["orphan_article"]
@@ -0,0 +1,71 @@
+import json
+import os
+
+from src.batch_report import write_report_stream
+from src.records import ArticleRecord
+from src.scorer import score_article
+from src.main import load_rubric
+from src.worker_pool import imap_recycling
+
+ARTICLE = {
+    "url": "https://example.com/post",
+    "title": "Short",
+    "meta_description": "",
+    "h1": "",
+    "h2_count": 0,
+    "content": "One short sentence.",
+    "word_count": 3,
+    "image_count": 2,
+    "images_missing_alt": 2,
+    "internal_links": 0,
+    "external_links": 0,
+    "error": "",
+}
+
+
+def _square(value: int) -> int:
+    if value == 3:
+        raise ValueError("boom")
+    return value * value
+
+
+def _crash_on_two(value: int) -> int:
+    if value == 2:
+        # OOM kill처럼 결과를 보내지 못하고 워커가 죽는 경우.
+        os._exit(1)
+    return value
+
+
+def test_article_record_scores_like_dict_without_copy() -> None:
+    record = ArticleRecord.from_dict(dict(ARTICLE, status_code=200, extra_field="x"))
+
+    assert score_article(record, load_rubric()) == score_article(ARTICLE, load_rubric())
+    assert record.to_dict() == dict(ARTICLE, status_code=200, extra_field="x")
+    assert not hasattr(record, "__dict__")
+
+
+def test_imap_recycling_recycles_workers_and_reports_errors() -> None:
+    results = {index: (status, value) for index, status, value in imap_recycling(_square, range(6), 2, 1)}
+
+    assert results[2] == ("done", 4)
+    assert results[3][0] == "error" and "boom" in results[3][1]
+    assert len(results) == 6
+
+
+def test_imap_recycling_reports_tasks_of_dead_workers() -> None:
+    results = {index: (status, value) for index, status, value in imap_recycling(_crash_on_two, range(5), 2)}
+
+    assert results[2] == ("error", "worker process died")
+    assert {index: value for index, (status, value) in results.items() if status == "done"} == {
+        0: 0, 1: 1, 3: 3, 4: 4
+    }
+
+
+def test_write_report_stream_produces_report_json(tmp_path) -> None:
+    path = tmp_path / "report.json"
+
+    count = write_report_stream(path, iter([{"url": "a"}, {"url": "b"}]))
+    report = json.loads(path.read_text(encoding="utf-8"))
+
+    assert count == report["count"] == 2
+    assert [item["url"] for item in report["results"]] == ["a", "b"]
@@ -0,0 +1,50 @@
+import src.main as main
+from src import metrics
+
+HTML = "<html><head><title>Timed</title></head><body><article><p>One. Two.</p></article></body></html>"
+
+
+def _fake_fetch_page(url: str, timer=None) -> dict:
+    if timer is not None:
+        timer.add("ttfb", 0.01)
+        timer.bytes += len(HTML)
+    return {"url": url, "status_code": 200, "bytes": len(HTML), "html": HTML, "error": ""}
+
+
+def test_run_attaches_timings_only_when_enabled(monkeypatch) -> None:
+    monkeypatch.setattr(main, "fetch_page", _fake_fetch_page)
+    metrics.reset()
+
+    plain = main.run("https://example.com/a", timings=False)
+    timed = main.run("https://example.com/a", timings=True)
+
+    assert "timings" not in plain
+    assert {"ttfb_ms", "parse_ms", "score_ms", "recommend_ms", "total_ms"} <= set(timed["timings"])
+    assert timed["timings"]["bytes"] == len(HTML)
+    assert timed["timings"]["total_ms"] >= timed["timings"]["ttfb_ms"] == 10.0
+
+
+def test_dns_probe_is_reported_but_not_counted_in_total() -> None:
+    metrics.reset()
+    timer = metrics.StageTimer()
+    timer.add("dns_probe", 0.5)
+    timer.add("ttfb", 0.1)
+    metrics.record(timer)
+
+    assert timer.as_dict()["dns_probe_ms"] == 500.0
+    assert timer.as_dict()["total_ms"] == 100.0
+    assert metrics.stage_quantiles()["total"]["p50"] == 0.1
+
+
+def test_render_prometheus_reports_stage_quantiles() -> None:
+    metrics.reset()
+    for value in (0.1, 0.2, 0.3, 0.4):
+        metrics.observe("parse", value)
+
+    text = metrics.render_prometheus()
+
+    assert '# TYPE tenasia_stage_seconds summary' in text
+    assert 'tenasia_stage_seconds{stage="parse",quantile="0.5"} 0.300000' in text
+    assert 'tenasia_stage_seconds{stage="parse",quantile="0.99"} 0.400000' in text
+    assert 'tenasia_stage_seconds_count{stage="parse"} 4' in text
+    assert metrics.stage_quantiles()["parse"]["p95"] == 0.4
@@ -0,0 +1,43 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+from src.monitor import WatchlistMonitor
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_monitor_crawls_each_url_once_and_flags_changes(monkeypatch) -> None:
+    monkeypatch.setattr("src.monitor.MIN_REFRESH_INTERVAL", 0.05)
+    calls: List[str] = []
+    lock = threading.Lock()
+    scores = {"https://example.com/a": 70.0, "https://example.com/b": 50.0}
+
+    def analyze(url: str) -> Dict[str, Any]:
+        with lock:
+            calls.append(url)
+        time.sleep(0.01)
+        return {"url": url, "article": {"title": "t"}, "score": {"total_score": scores[url], "grade": "C"}}
+
+    monitor = WatchlistMonitor(analyze, workers=2)
+    urls = list(scores)
+    # 두 편집자가 같은 목록을 감시해도 URL마다 한 번만 가져온다.
+    monitor.watch(urls, interval=60)
+    monitor.watch(urls, interval=60)
+    _wait_for(lambda: all(row["status"] == "ok" for row in monitor.snapshot(urls)))
+    assert sorted(calls) == urls
+    assert all(row["changes"] == [] for row in monitor.snapshot(urls))
+
+    scores["https://example.com/a"] = 82.0
+    monitor.watch(["https://example.com/a"], interval=0.05)
+    _wait_for(lambda: monitor.snapshot(["https://example.com/a"])[0]["changes"])
+    row = monitor.snapshot(["https://example.com/a"])[0]
+    assert row["changes"] == ["total_score"]
+    assert row["previous_score"] == 70.0
+    assert row["summary"]["total_score"] == 82.0
+    assert calls.count("https://example.com/b") == 1
+    monitor.close()
@@ -0,0 +1,99 @@
+import time
+from typing import Dict, List
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from src.metrics import StageTimer
+from src.politeness import FetchBlocked, FetchController
+
+
+class ScriptedAdapter(BaseAdapter):
+    def __init__(self, responses: Dict[str, List[tuple]]) -> None:
+        super().__init__()
+        self.responses = responses
+        self.calls: List[str] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        url = request.url or ""
+        self.calls.append(url)
+        script = self.responses.get(url) or [(404, {}, b"")]
+        status, headers, body = script.pop(0) if len(script) > 1 else script[0]
+        if status == 0:
+            raise requests.ConnectionError("connection refused")
+        if status == -1:
+            raise requests.TooManyRedirects("redirect loop")
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.url = url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _controller(responses: Dict[str, List[tuple]]) -> tuple:
+    session = requests.Session()
+    adapter = ScriptedAdapter(responses)
+    session.mount("https://", adapter)
+    sleeps: List[float] = []
+    return FetchController(session=session, sleep=sleeps.append), adapter, sleeps
+
+
+def test_retries_honor_retry_after() -> None:
+    url = "https://news.example.com/a"
+    controller, adapter, sleeps = _controller(
+        {url: [(503, {"Retry-After": "7"}, b""), (503, {}, b""), (200, {}, b"ok")]}
+    )
+    timer = StageTimer()
+    response = controller.get(url, timer=timer)
+    assert response.status_code == 200
+    assert adapter.calls.count(url) == 3
+    assert sleeps[0] == 7
+    assert 0 <= sleeps[1] <= 1.0
+    # robots.txt 조회와 재시도 대기는 ttfb에 섞이지 않는다.
+    assert {"throttle", "ttfb"} <= set(timer.seconds)
+
+
+def test_circuit_breaker_and_robots() -> None:
+    controller, adapter, _ = _controller(
+        {
+            "https://down.example.com/a": [(0, {}, b"")],
+            "https://site.example.com/robots.txt": [(200, {}, b"User-agent: *\nDisallow: /private/\n")],
+            "https://site.example.com/news": [(200, {}, b"ok")],
+        }
+    )
+    controller.max_retries = 1
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            controller.get("https://down.example.com/a")
+    # 5번째 실패에서 회로가 열려 남은 재시도도, 이후 요청도 보내지 않는다.
+    calls = len(adapter.calls)
+    for _ in range(2):
+        with pytest.raises(FetchBlocked):
+            controller.get("https://down.example.com/a")
+    assert len(adapter.calls) == calls + 1
+
+    assert controller.get("https://site.example.com/news").status_code == 200
+    with pytest.raises(FetchBlocked):
+        controller.get("https://site.example.com/private/x")
+    assert adapter.calls.count("https://site.example.com/robots.txt") == 1
+
+
+def test_half_open_probe_failure_releases_breaker() -> None:
+    url = "https://loop.example.com/a"
+    controller, _, _ = _controller({url: [(-1, {}, b""), (200, {}, b"ok")]})
+    breaker = controller._host("loop.example.com").breaker
+    # 쿨다운이 지난 열린 회로: 다음 요청이 half-open 시험 요청이 된다.
+    breaker.failures, breaker.opened_at = breaker.threshold, time.monotonic() - breaker.cooldown - 1
+
+    with pytest.raises(requests.TooManyRedirects):
+        controller.get(url)
+    breaker.opened_at = time.monotonic() - breaker.cooldown - 1
+    assert controller.get(url).status_code == 200
@@ -0,0 +1,42 @@
+import pstats
+
+import src.main as main
+from src.profiling import SamplingProfiler, StageProfiler, format_top
+
+HTML = "<html><head><title>Profiled</title></head><body><article><p>One. Two.</p></article></body></html>"
+
+
+def _fake_fetch_page(url: str, timer=None) -> dict:
+    return {"url": url, "status_code": 200, "bytes": len(HTML), "html": HTML, "error": ""}
+
+
+def test_stage_profiler_writes_pstats_and_collapsed_stacks(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(main, "fetch_page", _fake_fetch_page)
+    profiler = StageProfiler()
+
+    result = main.run("https://example.com/p", timings=False, profiler=profiler)
+    written = profiler.write(tmp_path)
+
+    assert "timings" not in result
+    assert {"parse", "score", "recommend"} <= set(profiler.profiles)
+    assert (tmp_path / "parse.pstats") in written
+    assert pstats.Stats(str(tmp_path / "parse.pstats")).total_calls > 0
+    lines = (tmp_path / "collapsed.txt").read_text(encoding="utf-8").splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("parse;") and "parse_article_html" in line for line in lines)
+    assert "parse" in format_top(profiler, 5)
+
+
+def test_sampling_profiler_tags_samples_with_stage(tmp_path) -> None:
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    with profiler.stage("download"):
+        total = 0
+        while profiler.samples.total() < 5:
+            total += sum(range(1000))
+    profiler.stop()
+    profiler.write(tmp_path)
+
+    fetch_samples = sum(n for stack, n in profiler.samples.items() if stack.startswith("fetch;"))
+    assert fetch_samples >= 5
+    assert (tmp_path / "collapsed.txt").read_text(encoding="utf-8")
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.report_index import ReportIndex, encode_cursor, query_from_params
+
+
+def _result(index: int) -> Dict[str, Any]:
+    grade = "ABCDF"[index % 5]
+    issues = ["meta_description_missing"] if index % 3 == 0 else []
+    return {
+        "url": f"https://www.tenasia.co.kr/{'photo' if index % 2 else 'article'}/{index:04d}",
+        "article": {"title": f"기사 {index}", "content": "본문 " * 200},
+        "score": {
+            "total_score": float(index % 40) + 50,
+            "grade": grade,
+            "profile": {"domain": "entertainment_news", "format": "standard"},
+            "details": [
+                {"id": "title", "score": float(index % 7), "weight": 20, "issues": []},
+                {"id": "meta_description", "score": 0.0 if issues else 15.0, "weight": 15, "issues": issues},
+            ],
+        },
+    }
+
+
+def _pages(index: ReportIndex, **kwargs: Any) -> List[List[Dict[str, Any]]]:
+    pages, cursor = [], ""
+    while True:
+        page = index.query(cursor=cursor, **kwargs)
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return pages
+
+
+def test_keyset_pages_cover_filtered_results_in_order(tmp_path: Path) -> None:
+    index = ReportIndex(tmp_path / "reports.sqlite")
+    results = [_result(number) for number in range(120)]
+    assert index.add(results) == 120
+    assert index.add([_result(0)]) == 1 and index.count() == 120
+
+    pages = _pages(index, grades=["A", "B"], issues=["meta_description_missing"], sort="title", limit=7)
+    items = [item for page in pages for item in page]
+    expected = [
+        result
+        for result in results
+        if result["score"]["grade"] in ("A", "B") and result["score"]["details"][1]["issues"]
+    ]
+    assert len(items) == len(expected) == len({item["url"] for item in items})
+    titles = [item["scores"]["title"] for item in items]
+    assert titles == sorted(titles, reverse=True)
+    assert all("content" not in item for item in items)
+
+    prefix = "https://www.tenasia.co.kr/photo/"
+    pages = _pages(index, url_prefix=prefix, sort="url", descending=False, limit=25)
+    assert [item["url"] for page in pages for item in page] == sorted(
+        result["url"] for result in results if result["url"].startswith(prefix)
+    )
+
+
+def test_query_params_validate_input(tmp_path: Path) -> None:
+    index = ReportIndex(tmp_path / "reports.sqlite")
+    index.add(_result(number) for number in range(10))
+    page = query_from_params(index, {"grade": ["A,F"], "min_score": ["50"], "order": ["asc"], "limit": ["3"]})
+    assert [item["total_score"] for item in page["items"]] == [50.0, 54.0, 55.0]
+    for params in ({"sort": ["title; DROP TABLE results"]}, {"cursor": ["%%%"]}, {"order": ["up"]}):
+        with pytest.raises(ValueError):
+            query_from_params(index, params)
+
+
+@pytest.mark.parametrize("value", [[1, 2], {"score": 1}])
+def test_cursor_with_non_scalar_sort_value_is_rejected(tmp_path: Path, value: Any) -> None:
+    index = ReportIndex(tmp_path / "reports.sqlite")
+    index.add(_result(number) for number in range(3))
+    with pytest.raises(ValueError):
+        index.query(cursor=encode_cursor(value, 1))
@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+from src.crawler import parse_article_html
+from src.main import RUBRIC_PATH, load_rubric
+from src.rubric_compare import compare_rubrics, iter_archive
+from src.scorer import score_article
+
+HTML = """
+<html>
+  <head><title>배우 A 신작 공개</title><meta name="description" content="요약" /></head>
+  <body><article><h1>배우 A 신작 공개</h1><p>배우 A가 오늘 신작을 공개했다.</p></article></body>
+</html>
+"""
+
+
+def test_compare_rubrics_reports_transitions(tmp_path: Path) -> None:
+    rubric = json.loads(RUBRIC_PATH.read_text(encoding="utf-8"))
+    for criterion in rubric["criteria"]:
+        if criterion["id"] == "title":
+            criterion["weight"] = 0
+    candidate = tmp_path / "rubric.v2.json"
+    candidate.write_text(json.dumps(rubric), encoding="utf-8")
+
+    archive = tmp_path / "archive.jsonl"
+    lines = [
+        {"url": "https://example.com/a", "html": HTML},
+        {"url": "https://example.com/b", "title": "", "content": "", "error": "timeout"},
+    ]
+    archive.write_text("\n".join(json.dumps(line, ensure_ascii=False) for line in lines), encoding="utf-8")
+
+    report = compare_rubrics(iter_archive([archive]), [str(RUBRIC_PATH), str(candidate)])
+    comparison = report["comparisons"][0]
+    baseline = score_article(parse_article_html("https://example.com/a", HTML), load_rubric())
+
+    assert report["articles"] == 1 and report["skipped"] == 1
+    assert sum(sum(row.values()) for row in comparison["grade_transitions"].values()) == 1
+    assert "title" in comparison["criterion_deltas"]
+    assert comparison["top_movers"][0]["baseline"] == baseline["total_score"]
+
@@ -0,0 +1,89 @@
+import json
+
+from src.crawler import parse_article_html
+from src.main import analyze_article
+from src.rubric_router import ROUTES_PATH, RubricRouter, get_router
+
+HTML = """
+<html>
+  <head><title>배우 A 화보 공개</title><meta name="description" content="요약" /></head>
+  <body><article><h1>배우 A 화보 공개</h1><p>배우 A가 오늘 화보를 공개했다.</p></article></body>
+</html>
+"""
+
+
+def test_trie_prefers_deepest_host_specific_route() -> None:
+    config = {
+        "default": "rubric.v1.json",
+        "routes": [
+            {"name": "photo", "path_prefix": "/photo", "rubric": "rubric.photo.json"},
+            {
+                "name": "photo_star",
+                "host": "www.tenasia.co.kr",
+                "path_prefix": "/photo/star",
+                "rubric": "rubric.interview.json",
+            },
+            {"name": "short", "profile": {"format": "short_form"}, "rubric": "rubric.breaking.json"},
+        ],
+    }
+    router = RubricRouter(config, ROUTES_PATH.parent)
+
+    assert router.route("https://example.com/photo/1")["route"] == "photo"
+    assert router.route("https://example.com/photos/1")["route"] == "default"
+    assert router.route("https://www.tenasia.co.kr/photo/star/1")["route"] == "photo_star"
+    assert router.route("https://example.com/photo/star/1")["route"] == "photo"
+    assert router.route("https://example.com/article/1", {"format": "short_form"})["route"] == "short"
+    # 경로 규칙이 profile만 건 규칙보다 구체적이다.
+    assert router.route("https://example.com/photo/1", {"format": "short_form"})["route"] == "photo"
+    assert set(router.rubrics) == {
+        "rubric.v1.json",
+        "rubric.photo.json",
+        "rubric.interview.json",
+        "rubric.breaking.json",
+    }
+
+
+def test_analyze_article_records_routing_decision() -> None:
+    article = parse_article_html("https://www.tenasia.co.kr/photo/2024010112345", HTML)
+    result = analyze_article(article, ROUTES_PATH)
+    routing = result["score"]["routing"]
+    photo = get_router(ROUTES_PATH).rubrics["rubric.photo.json"]
+
+    assert routing["route"] == "photo" and routing["rubric"] == "rubric.photo.json"
+    assert {item["id"] for item in result["score"]["details"]} <= {item["id"] for item in photo["criteria"]}
+    assert "routing" not in analyze_article(json.loads(json.dumps(article)))["score"]
+
+
+def _article_html(title: str, paragraphs: int, words: int, h2_count: int = 0) -> str:
+    sentence = "배우 A가 오늘 서울에서 새 작품 촬영 현장을 공개했다. "
+    body = "".join(
+        f"<p>{(sentence * (words // (7 * paragraphs) + 1)).strip()}</p>" for _ in range(paragraphs)
+    )
+    headings = "".join(f"<h2>소제목 {index}</h2>" for index in range(h2_count))
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><article><h1>{title}</h1>{headings}{body}</article></body></html>"
+    )
+
+
+def test_routed_section_rubrics_keep_configured_thresholds() -> None:
+    photo = parse_article_html(
+        "https://www.tenasia.co.kr/photo/2024010112345", _article_html("배우 A 화보 공개", 3, 130)
+    )
+    result = analyze_article(photo, ROUTES_PATH)
+    content = next(item for item in result["score"]["details"] if item["id"] == "content")
+    assert result["score"]["profile"]["format"] == "short_form"
+    # short_form 보정(110/220)이 아니라 rubric.photo.json의 40/120 기준으로 본다.
+    assert 120 <= content["metrics"]["word_count"] < 220
+    assert "content_below_ideal_length" not in content["issues"]
+
+    interview = parse_article_html(
+        "https://www.tenasia.co.kr/interview/2024010112345", _article_html("배우 A 인터뷰", 8, 600, h2_count=2)
+    )
+    result = analyze_article(interview, ROUTES_PATH)
+    details = {item["id"]: item for item in result["score"]["details"]}
+    assert result["score"]["profile"]["format"] == "deep_dive"
+    # deep_dive 보정(260/520)이 아니라 rubric.interview.json의 500/1200, 소제목 3개 기준으로 본다.
+    assert 520 <= details["content"]["metrics"]["word_count"] < 1200
+    assert "content_below_ideal_length" in details["content"]["issues"]
+    assert "h2_insufficient" in details["headings"]["issues"]
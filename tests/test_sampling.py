@@ -0,0 +1,48 @@
+import random
+import time
+from typing import Any, Dict
+
+from src.sampling import StratifiedSample, build_strata, run_sample, section_of, url_date
+
+
+def test_strata_use_section_profile_and_age() -> None:
+    now = time.time()
+    url = "https://www.tenasia.co.kr/article/2024010112345"
+    assert section_of("https://example.com/news/star/123") == "star"
+    assert url_date(url) is not None
+    strata = build_strata(
+        [url, "https://example.com/tv/1", "https://example.com/tv/2"],
+        lastmods={"https://example.com/tv/1": "2024-01-01T00:00:00Z"},
+        known={"https://example.com/tv/2": {"profile": "entertainment_news/short_form", "published": now - 3600}},
+        now=now,
+    )
+    assert set(strata) == {"other|unknown|older", "tv|unknown|older", "tv|entertainment_news/short_form|1d"}
+
+
+def test_adaptive_sample_estimates_population_mean() -> None:
+    rng = random.Random(7)
+    scores: Dict[str, float] = {}
+    for index in range(3000):
+        section = "star" if index % 3 else "music"
+        scores[f"https://example.com/{section}/{index}"] = rng.gauss(80 if section == "star" else 50, 6)
+    true_mean = sum(scores.values()) / len(scores)
+    true_prevalence = sum(score < 60 for score in scores.values()) / len(scores)
+
+    def analyze(url: str) -> Dict[str, Any]:
+        total = scores[url]
+        issues = ["title_too_short"] if total < 60 else []
+        return {"url": url, "score": {"total_score": total, "grade": "B", "details": [{"issues": issues}]}}
+
+    sample = StratifiedSample(build_strata(scores), seed=1)
+    results = run_sample(sample, analyze, target_margin=1.0, batch_size=10)
+    report = sample.report()
+    mean = report["mean_score"]
+    assert len(results) < 200
+    assert mean["margin"] <= 1.0
+    assert mean["low"] <= true_mean <= mean["high"]
+    prevalence = report["issue_prevalence"]["title_too_short"]
+    assert prevalence["low"] <= true_prevalence <= prevalence["high"]
+    assert report["grade_shares"]["B"]["estimate"] == 1.0
+    # 모든 표본이 B여도 구간 폭은 0이 아니고, 보지 못한 이슈에도 상한이 있다.
+    assert report["grade_shares"]["B"]["low"] < 1.0 and report["grade_shares"]["A"]["high"] > 0.0
+    assert 0.0 < report["unseen_issue_upper"] < 0.2
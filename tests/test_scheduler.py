@@ -0,0 +1,72 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.scheduler import MIN_INTERVAL, FetchBudget, RecrawlScheduler
+
+
+def _result(url: str, content: str, score: float) -> Dict[str, Any]:
+    return {"url": url, "article": {"url": url, "title": "t", "content": content}, "score": {"total_score": score}}
+
+
+def test_changed_articles_are_revisited_sooner(tmp_path: Path) -> None:
+    scheduler = RecrawlScheduler(tmp_path / "state.sqlite")
+    scheduler.add(["https://example.com/hot", "https://example.com/cold"], now=0)
+    assert scheduler.record("https://example.com/hot", _result("hot", "v1", 80), now=0) == 5400
+    assert scheduler.record("https://example.com/cold", _result("cold", "v1", 80), now=0) == 5400
+
+    hot = scheduler.record("https://example.com/hot", _result("hot", "v2", 80), now=6000)
+    cold = scheduler.record("https://example.com/cold", _result("cold", "v1", 80), now=6000)
+    assert hot < cold
+    assert scheduler.pop_due(now=6000 + hot) == ("https://example.com/hot", 0.0)
+    assert scheduler.pop_due(now=6000 + hot)[0] is None
+
+    low = scheduler.record("https://example.com/hot", _result("hot", "v2", 40), now=20000)
+    assert MIN_INTERVAL <= low < hot * 1.5
+    scheduler.close()
+
+    reopened = RecrawlScheduler(tmp_path / "state.sqlite")
+    assert len(reopened) == 2
+    assert reopened.stats()["changes"] == 1
+    reopened.close()
+
+
+def test_run_respects_fetch_budget(tmp_path: Path) -> None:
+    scheduler = RecrawlScheduler(tmp_path / "state.sqlite")
+    scheduler.add([f"https://example.com/{index}" for index in range(5)])
+    fetched: List[str] = []
+
+    def analyze(url: str) -> Dict[str, Any]:
+        fetched.append(url)
+        return _result(url, "body", 70)
+
+    # 분당 120회 = 초당 2회: 버킷 2개를 쓴 뒤에는 0.5초마다 하나씩 허용된다.
+    stop = threading.Event()
+    timer = threading.Timer(0.8, stop.set)
+    timer.start()
+    started = time.monotonic()
+    count = scheduler.run(analyze, FetchBudget(120), stop, workers=2, once=True)
+    timer.cancel()
+    assert count == len(fetched) == 3
+    assert time.monotonic() - started < 2
+    assert len(scheduler) == 5
+    scheduler.close()
+
+
+def test_run_reschedules_url_when_analyze_raises(tmp_path: Path) -> None:
+    scheduler = RecrawlScheduler(tmp_path / "state.sqlite")
+    scheduler.add(["https://example.com/bad", "https://example.com/ok"])
+    results: List[Dict[str, Any]] = []
+
+    def analyze(url: str) -> Dict[str, Any]:
+        if url.endswith("/bad"):
+            raise RuntimeError("parser crashed")
+        return _result(url, "body", 70)
+
+    count = scheduler.run(analyze, FetchBudget(600), threading.Event(), results.append, workers=1, once=True)
+    assert count == 2
+    assert {result["url"]: result.get("error", "") for result in results}["https://example.com/bad"]
+    # 실패한 URL도 다시 예약되어 다음 방문 대상으로 남는다.
+    assert not scheduler._in_flight and "https://example.com/bad" in scheduler._due
+    scheduler.close()
@@ -0,0 +1,37 @@
+import json
+
+import src.main as main
+from src.server import format_ndjson, format_sse
+
+HTML = """
+<html>
+  <head><title>Stream Title</title><meta name="description" content="desc" /></head>
+  <body><article><h1>Heading</h1><p>First sentence here. Second one.</p></article></body>
+</html>
+"""
+
+
+def _fake_fetch_page(url: str, timer=None) -> dict:
+    return {"url": url, "status_code": 200, "bytes": len(HTML), "html": HTML, "error": ""}
+
+
+def test_iter_analysis_yields_stage_events_in_order(monkeypatch) -> None:
+    monkeypatch.setattr(main, "fetch_page", _fake_fetch_page)
+
+    events = list(main.iter_analysis("https://example.com/post"))
+    kinds = [event["event"] for event in events]
+
+    assert kinds[:2] == ["fetch", "article"]
+    assert kinds[-3:] == ["score", "recommendations", "result"]
+    assert kinds.count("criterion") == len(events[-1]["result"]["score"]["details"])
+    assert events[0]["bytes"] == len(HTML)
+    assert "content" not in events[1]["article"]
+    assert main.run("https://example.com/post") == events[-1]["result"]
+
+
+def test_stream_formats() -> None:
+    event = {"event": "fetch", "status_code": 200}
+
+    assert format_sse(event).decode("utf-8").startswith("event: fetch\ndata: {")
+    assert format_sse(event).endswith(b"\n\n")
+    assert json.loads(format_ndjson(event)) == event
@@ -0,0 +1,69 @@
+import json
+
+from src.crawler import parse_article_html
+from src.scorer import SCORERS
+from src.structured_data import extract_structured_data
+
+LD = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "WebPage", "name": "page"},
+        {
+            "@type": "NewsArticle",
+            "headline": "배우 A 신작 공개",
+            "datePublished": "2024-03-05T09:00:00+09:00",
+            "author": [{"@type": "Person", "name": "기자 B"}],
+            "image": {"@type": "ImageObject", "url": "https://example.com/a.jpg"},
+        },
+    ],
+}
+
+HTML = f"""
+<html><head>
+  <meta content="배우 A &amp; 신작" property="og:title" />
+  <meta property="og:image" content="https://example.com/a.jpg" />
+  <meta name="twitter:card" content="summary_large_image" />
+  <script type="application/ld+json">{json.dumps(LD, ensure_ascii=False)}</script>
+  <script type="application/ld+json">{{ broken </script>
+</head><body><article><p>본문</p></article></body></html>
+"""
+
+
+def test_extracts_news_article_and_social_tags() -> None:
+    data = parse_article_html("https://example.com/news/1", HTML)["structured_data"]
+
+    assert data["article_type"] == "NewsArticle"
+    assert data["authors"] == ["기자 B"]
+    assert data["image"] == "https://example.com/a.jpg"
+    assert data["invalid_blocks"] == 1
+    assert data["og"] == {"og:title": "배우 A & 신작", "og:image": "https://example.com/a.jpg"}
+    assert data["twitter"] == {"twitter:card": "summary_large_image"}
+
+
+def test_structured_data_scorer() -> None:
+    full = SCORERS["structured_data"]({"structured_data": extract_structured_data(HTML)}, 10, {})
+    empty = SCORERS["structured_data"]({"structured_data": extract_structured_data("<html></html>")}, 10, {})
+
+    assert full["issues"] == ["json_ld_invalid", "open_graph_incomplete"]
+    assert full["metrics"]["missing_og"] == ["og:description"]
+    assert empty["issues"][0] == "news_article_schema_missing"
+    assert empty["score"] < full["score"]
+
+
+def test_ld_json_marker_outside_script_tag_is_ignored() -> None:
+    source = (
+        "<html><head><script>var loader = {type: 'application/ld+json', body: '{ broken'};</script>"
+        '<script type="text/javascript">insert("<p>application/LD+JSON</p>");</script></head></html>'
+    )
+    data = extract_structured_data(source)
+
+    assert data["invalid_blocks"] == 0
+    assert data["article_type"] == ""
+
+
+def test_ld_json_type_is_matched_case_insensitively() -> None:
+    article = json.dumps({"@type": "NewsArticle", "headline": "배우 A 신작 공개"}, ensure_ascii=False)
+    data = extract_structured_data(f"<html><head><SCRIPT Type='application/LD+JSON'>{article}</SCRIPT></head></html>")
+
+    assert data["article_type"] == "NewsArticle"
+    assert data["headline"] == "배우 A 신작 공개"
@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.watch import DropDirWatcher, FileTailer, SeenStore, watch
+
+
+def _run_until(store: SeenStore, source: Any, output: Path, analyzed: List[str], expected: int) -> None:
+    stop = threading.Event()
+
+    def analyze(url: str) -> Dict[str, Any]:
+        analyzed.append(url)
+        if len(analyzed) >= expected:
+            stop.set()
+        if url.endswith("/2"):
+            raise RuntimeError("parser crashed")
+        return {"url": url, "score": {"total_score": 50, "grade": "C"}}
+
+    worker = threading.Thread(target=watch, args=(source, store, analyze, output, stop, 0.01))
+    worker.start()
+    deadline = time.time() + 5
+    while not stop.is_set() and time.time() < deadline:
+        time.sleep(0.01)
+    stop.set()
+    worker.join()
+
+
+def test_tailer_analyzes_only_new_urls_across_restarts(tmp_path: Path) -> None:
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://example.com/1\nhttps://example.com/1\nhttps://example.com/2", encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+    analyzed: List[str] = []
+
+    store = SeenStore(tmp_path / "seen.sqlite")
+    tailer = FileTailer(url_file, store)
+    assert tailer.poll() == ["https://example.com/1", "https://example.com/1"]
+    tailer = FileTailer(url_file, store)
+    _run_until(store, tailer, output, analyzed, 1)
+    store.close()
+
+    with url_file.open("a", encoding="utf-8") as handle:
+        handle.write("\nhttps://example.com/3\nhttps://example.com/1\n")
+    store = SeenStore(tmp_path / "seen.sqlite")
+    _run_until(store, FileTailer(url_file, store), output, analyzed, 3)
+    store.close()
+
+    assert analyzed == ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["url"] for line in lines] == analyzed
+    # 분석 중 예외가 난 URL은 오류 행으로 남고 감시는 계속된다.
+    assert json.loads(lines[1])["error"] == "RuntimeError: parser crashed"
+
+
+def test_failed_urls_are_retried_up_to_the_attempt_cap(tmp_path: Path) -> None:
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://example.com/flaky\nhttps://example.com/down\n", encoding="utf-8")
+    store = SeenStore(tmp_path / "seen.sqlite")
+    analyzed: List[str] = []
+    stop = threading.Event()
+
+    def analyze(url: str) -> Dict[str, Any]:
+        analyzed.append(url)
+        if url.endswith("/down") or analyzed.count(url) == 1:
+            return {"url": url, "article": {"url": url, "error": "HTTP 503"}}
+        return {"url": url, "score": {"total_score": 50, "grade": "C"}}
+
+    worker = threading.Thread(
+        target=watch, args=(FileTailer(url_file, store), store, analyze, tmp_path / "out.jsonl", stop, 0.01, 3, 0.0)
+    )
+    worker.start()
+    deadline = time.time() + 5
+    while len(analyzed) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    stop.set()
+    worker.join()
+
+    # 일시적 실패는 다음 폴링에서 다시 분석해 성공하면 seen이 되고, 계속 실패하면 3번에서 멈춘다.
+    assert analyzed.count("https://example.com/flaky") == 2
+    assert analyzed.count("https://example.com/down") == 3
+    assert store.unseen(["https://example.com/flaky", "https://example.com/down"]) == []
+    assert store.retries(3, 0.0) == []
+    store.close()
+
+
+def test_drop_dir_moves_processed_files(tmp_path: Path) -> None:
+    drop = tmp_path / "drop"
+    drop.mkdir()
+    (drop / "batch1.txt").write_text("https://example.com/a\n# comment\n", encoding="utf-8")
+    store = SeenStore(tmp_path / "seen.sqlite")
+    analyzed: List[str] = []
+
+    _run_until(store, DropDirWatcher(drop), tmp_path / "out.jsonl", analyzed, 1)
+    store.close()
+
+    assert analyzed == ["https://example.com/a"]
+    assert not (drop / "batch1.txt").exists()
+    assert (drop / "processed" / "batch1.txt").exists()
@@ -14,9 +14,13 @@ const LABELS = {
   content: "\uBCF8\uBB38 \uD488\uC9C8",
   links: "\uB9C1\uD06C \uAD6C\uC131",
   images_alt: "\uC774\uBBF8\uC9C0 ALT",
+  image_weight: "\uC774\uBBF8\uC9C0 \uC6A9\uB7C9",
+  structured_data: "\uAD6C\uC870\uD654 \uB370\uC774\uD130",
   readability: "\uAC00\uB3C5\uC131",
 };
 
+let partialDetails = [];
+
 function setStatus(message) {
   statusText.textContent = message;
 }
@@ -119,6 +123,53 @@ async function requestAnalyze(url) {
   return response.json();
 }
 
+async function requestAnalyzeStream(url, onEvent) {
+  const response = await fetch("/api/analyze/stream", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "application/x-ndjson" },
+    body: JSON.stringify({ url }),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`API error: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+  let result = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    buffered += decoder.decode(value ?? new Uint8Array(), { stream: !done });
+    const lines = buffered.split("\n");
+    buffered = lines.pop();
+    lines.filter((line) => line.trim()).forEach((line) => {
+      const event = JSON.parse(line);
+      if (event.event === "result") {
+        result = event.result;
+      }
+      onEvent(event);
+    });
+    if (done) {
+      break;
+    }
+  }
+  if (!result) {
+    throw new Error("stream ended without result");
+  }
+  return result;
+}
+
+function onStreamEvent(event) {
+  if (event.event === "fetch") {
+    setStatus(`\uC218\uC9D1 \uC644\uB8CC: HTTP ${event.status_code} / ${event.bytes} bytes`);
+  } else if (event.event === "criterion") {
+    partialDetails.push(event.criterion);
+    renderDetails({ score: { details: partialDetails } });
+  } else if (event.event === "score") {
+    renderScore({ score: event.score });
+  }
+}
+
 async function onAnalyze() {
   const url = urlInput.value.trim();
   if (!validateUrl(url)) {
@@ -130,7 +181,8 @@ async function onAnalyze() {
   setStatus("\uBD84\uC11D \uC911...");
 
   try {
-    const result = await requestAnalyze(url);
+    partialDetails = [];
+    const result = await requestAnalyzeStream(url, onStreamEvent).catch(() => requestAnalyze(url));
     renderScore(result);
     renderDetails(result);
     renderRecommendations(result);
@@ -152,3 +204,125 @@ urlInput.addEventListener("keydown", (event) => {
     onAnalyze();
   }
 });
+
+const gradeFilter = document.getElementById("gradeFilter");
+const issueFilter = document.getElementById("issueFilter");
+const prefixFilter = document.getElementById("prefixFilter");
+const sortSelect = document.getElementById("sortSelect");
+const resultsBtn = document.getElementById("resultsBtn");
+const resultsBody = document.getElementById("resultsBody");
+const resultsStatus = document.getElementById("resultsStatus");
+const resultsSentinel = document.getElementById("resultsSentinel");
+
+const RESULTS_PAGE_SIZE = 50;
+const SORT_LABELS = { total_score: "\uC885\uD569 \uC810\uC218", url: "URL", ...LABELS };
+
+// 배치 결과는 서버 인덱스에서 페이지 단위로 받아, 표 끝이 보일 때마다 다음 커서를 읽는다.
+let resultsCursor = "";
+let resultsDone = false;
+let resultsLoading = false;
+let resultsShown = 0;
+// 필터/정렬이 바뀌면 세대를 올려, 진행 중이던 이전 요청의 응답은 버린다.
+let resultsGeneration = 0;
+
+function resultsQuery() {
+  const params = new URLSearchParams({ sort: sortSelect.value, limit: String(RESULTS_PAGE_SIZE) });
+  if (sortSelect.value === "url") {
+    params.set("order", "asc");
+  }
+  if (gradeFilter.value) {
+    params.set("grade", gradeFilter.value);
+  }
+  if (issueFilter.value.trim()) {
+    params.set("issue", issueFilter.value.trim());
+  }
+  if (prefixFilter.value.trim()) {
+    params.set("url_prefix", prefixFilter.value.trim());
+  }
+  if (resultsCursor) {
+    params.set("cursor", resultsCursor);
+  }
+  return params;
+}
+
+function renderResultRows(items) {
+  const sort = sortSelect.value;
+  items.forEach((item) => {
+    const row = document.createElement("tr");
+    const link = document.createElement("a");
+    link.href = item.url;
+    link.target = "_blank";
+    link.rel = "noopener";
+    link.textContent = item.title || item.url;
+
+    const urlCell = document.createElement("td");
+    urlCell.appendChild(link);
+    const scoreCell = document.createElement("td");
+    const score = sort in (item.scores ?? {}) ? item.scores[sort] : item.total_score;
+    scoreCell.textContent = String(Math.round(score * 10) / 10);
+    const gradeCell = document.createElement("td");
+    gradeCell.textContent = item.grade;
+    const issueCell = document.createElement("td");
+    issueCell.textContent = item.error || (item.issues ?? []).join(", ");
+
+    row.append(urlCell, scoreCell, gradeCell, issueCell);
+    resultsBody.appendChild(row);
+  });
+}
+
+async function loadResults(reset) {
+  if (reset) {
+    resultsCursor = "";
+    resultsDone = false;
+    resultsShown = 0;
+    resultsBody.innerHTML = "";
+    resultsGeneration += 1;
+    resultsLoading = false;
+  }
+  if (resultsLoading || resultsDone) {
+    return;
+  }
+  const generation = resultsGeneration;
+  resultsLoading = true;
+  resultsStatus.textContent = "\uBD88\uB7EC\uC624\uB294 \uC911...";
+  try {
+    const response = await fetch(`/api/results?${resultsQuery()}`);
+    const page = await response.json();
+    if (generation !== resultsGeneration) {
+      return;
+    }
+    if (!response.ok) {
+      throw new Error(page.detail ?? `API error: ${response.status}`);
+    }
+    renderResultRows(page.items);
+    resultsShown += page.items.length;
+    resultsCursor = page.next_cursor ?? "";
+    resultsDone = !resultsCursor;
+    resultsStatus.textContent = `${resultsShown}\uAC74${resultsDone ? "" : " (\uC2A4\uD06C\uB864\uD558\uBA74 \uB354 \uBD88\uB7EC\uC635\uB2C8\uB2E4)"}`;
+  } catch (error) {
+    if (generation !== resultsGeneration) {
+      return;
+    }
+    resultsDone = true;
+    resultsStatus.textContent = `\uACB0\uACFC \uC778\uB371\uC2A4\uB97C \uBD88\uB7EC\uC624\uC9C0 \uBABB\uD588\uC2B5\uB2C8\uB2E4: ${error.message}`;
+  } finally {
+    if (generation === resultsGeneration) {
+      resultsLoading = false;
+    }
+  }
+}
+
+Object.entries(SORT_LABELS).forEach(([value, label]) => {
+  const option = document.createElement("option");
+  option.value = value;
+  option.textContent = label;
+  sortSelect.appendChild(option);
+});
+
+resultsBtn.addEventListener("click", () => loadResults(true));
+sortSelect.addEventListener("change", () => loadResults(true));
+new IntersectionObserver((entries) => {
+  if (entries.some((entry) => entry.isIntersecting)) {
+    loadResults(false);
+  }
+}).observe(resultsSentinel);